@@ -1,25 +1,72 @@
+import asyncio
+import logging
 import time
 
-def timed_cache(seconds: int):
-    """Decorator to cache function results for a specified duration."""
+
+def timed_cache(seconds: int, stale: float = 0):
+    """Decorator to cache an async function's results for a specified duration.
+
+    Concurrent calls that miss the cache share one call of the function
+    rather than each making their own. With ``stale``, a result up to that
+    many seconds past its expiry is still returned at once while a single
+    background call refreshes it; if the refresh fails, the old result stays.
+    Failures are never cached.
+
+    The wrapper has ``invalidate(*args, **kwargs)`` to drop one entry and
+    ``cache_clear()`` to drop them all.
+    """
     def wrapper_decorator(func):
         """Wrapper function to cache results."""
         cache = {}
-        
+        in_flight = {}
+
+        def key_for(args, kwargs):
+            return str(args) + str(kwargs)
+
+        def start(key, args, kwargs):
+            """The one call for ``key`` under way, started if there is none."""
+            task = in_flight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                in_flight[key] = task
+                task.add_done_callback(lambda done: finish(key, done))
+            return task
+
+        def finish(key, task):
+            if in_flight.get(key) is task:
+                del in_flight[key]
+            if task.cancelled():
+                return
+            if task.exception() is None:
+                cache[key] = (task.result(), time.time())
+            else:
+                logging.warning(f"{func.__name__} failed: {task.exception()}")
+
         async def wrapped_func(*args, **kwargs):
             """Async wrapper function to cache results."""
-            key = str(args) + str(kwargs)
+            key = key_for(args, kwargs)
             now = time.time()
-            
+
             if key in cache:
                 result, timestamp = cache[key]
-                if now - timestamp < seconds:
+                age = now - timestamp
+                if age < seconds:
+                    return result
+                if age < seconds + stale:
+                    start(key, args, kwargs)
                     return result
-                
-            # Get new result
-            result = await func(*args, **kwargs)
-            cache[key] = (result, now)
-            return result
-            
+
+            # Shielded so a caller that gives up does not cancel the call
+            # everyone else sharing it is waiting on.
+            return await asyncio.shield(start(key, args, kwargs))
+
+        def invalidate(*args, **kwargs):
+            cache.pop(key_for(args, kwargs), None)
+
+        def cache_clear():
+            cache.clear()
+
+        wrapped_func.invalidate = invalidate
+        wrapped_func.cache_clear = cache_clear
         return wrapped_func
     return wrapper_decorator
@@ -0,0 +1,160 @@
+"""
+Serving result bundles so that nothing is sent twice.
+
+A bundle is a zip written once per job, yet every refresh of the result page
+used to fetch all of it again, and an interrupted download started over. Each
+response now carries a strong ``ETag`` (the SHA-256 of the file) and a
+``Last-Modified``, so a browser that has the file asks with
+``If-None-Match``/``If-Modified-Since`` and gets an empty 304. A single
+``Range`` is answered with 206 and just those bytes, so a broken download
+resumes where it stopped; ``If-Range`` makes sure the rest comes from the same
+file.
+
+Bundle names are reused when a job is rerun, so by default a response must be
+revalidated before reuse. A URL that names the content, with ``?v=`` set to
+the file's ETag, cannot go stale and is marked immutable; the result page
+links to a finished job's bundle that way (see :func:`content_addressed_url`).
+"""
+import hashlib
+import os
+import re
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+CHUNK_SIZE = 64 * 1024
+
+REVALIDATE = "private, no-cache"
+IMMUTABLE = "private, max-age=31536000, immutable"
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# The ETag of each bundle as of its last (mtime, size): a bundle is hashed
+# once, not on every request, and a rewritten bundle replaces its entry.
+_etags = {}
+_etags_lock = threading.Lock()
+
+
+def file_etag(path: str, stat: os.stat_result) -> str:
+    """A strong ETag for the file's current contents."""
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _etags.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    etag = f'"{digest.hexdigest()}"'
+    with _etags_lock:
+        _etags[path] = (version, etag)
+    return etag
+
+
+async def content_addressed_url(url: str, path: str) -> str:
+    """``url`` with ``?v=`` naming the current contents of ``path``."""
+    etag = await run_in_threadpool(file_etag, path, os.stat(path))
+    return f"{url}?v=" + etag.strip('"')
+
+
+def _matches(header: str, etag: str) -> bool:
+    """Whether an ``If-None-Match`` value names ``etag`` (weakly compared)."""
+    if header.strip() == "*":
+        return True
+    tags = (tag.strip() for tag in header.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+
+def _not_modified_since(header: str, mtime: float) -> bool:
+    try:
+        return int(mtime) <= parsedate_to_datetime(header).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return False
+
+
+def parse_range(header: str, size: int):
+    """``(start, end)`` inclusive for a single byte range, or None to send it all.
+
+    Raises ``ValueError`` for a range that lies wholly past the end of the file.
+    Several ranges in one header are answered with the whole file, which the
+    HTTP spec allows.
+    """
+    match = _RANGE.match(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:  # the last N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError(header)
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError(header)
+    return start, end
+
+
+def _read_range(path: str, start: int, end: int):
+    with open(path, "rb") as source:
+        source.seek(start)
+        remaining = end - start + 1
+        while remaining:
+            chunk = source.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+async def conditional_file_response(
+    request, path: str, filename: str, media_type: str, headers=None
+) -> Response:
+    """Serve ``path`` honouring the request's validators and ``Range``."""
+    stat = os.stat(path)
+    etag = await run_in_threadpool(file_etag, path, stat)
+    headers = dict(headers or {})
+    headers.update({
+        "ETag": etag,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Accept-Ranges": "bytes",
+        "Cache-Control": IMMUTABLE if f'"{request.query_params.get("v")}"' == etag else REVALIDATE,
+    })
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        not_modified = _matches(if_none_match, etag)
+    else:
+        not_modified = _not_modified_since(
+            request.headers.get("if-modified-since"), stat.st_mtime
+        )
+    if not_modified:
+        return Response(status_code=304, headers={
+            name: value for name, value in headers.items() if name != "Content-Disposition"
+        })
+
+    requested = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if requested and (if_range is None or if_range.strip() in (etag, headers["Last-Modified"])):
+        try:
+            byte_range = parse_range(requested, stat.st_size)
+        except ValueError:
+            return Response(
+                status_code=416, headers={"Content-Range": f"bytes */{stat.st_size}", **headers}
+            )
+        if byte_range is not None:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+            headers["Content-Length"] = str(end - start + 1)
+            return StreamingResponse(
+                _read_range(path, start, end),
+                status_code=206,
+                media_type=media_type,
+                headers=headers,
+            )
+
+    return FileResponse(path=path, filename=filename, media_type=media_type, headers=headers)
@@ -3,6 +3,8 @@ Main entry point for the ATS-Proof Resume application.
 """
 from fastapi import FastAPI
 from .routes import router as api_router
+from .uploads import BodyLimit
+from .workers import audit_pool
 import logging
 import os
 
@@ -17,7 +19,7 @@ logging.basicConfig(
 )
 
 # Create output directory
-from .state import OUTPUT_DIR
+from .state import OUTPUT_DIR, MAX_BATCH_BYTES, MAX_UPLOAD_BYTES
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 # Create FastAPI app
@@ -27,6 +29,14 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Refuse oversized bodies before they are read. The slack over the file limit
+# leaves room for the other form fields around the resume.
+app.add_middleware(
+    BodyLimit,
+    default=MAX_UPLOAD_BYTES + 64 * 1024,
+    limits={"/audit/batch/": MAX_BATCH_BYTES},
+)
+
 # Include API routes
 app.include_router(api_router)
 
@@ -38,4 +48,5 @@ async def startup_event():
 # Add shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
+    audit_pool.shutdown()
     logging.info("Application shutdown") 
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+Telling progress subscribers when a job changes, and only then.
+
+The progress socket used to read ``progress_status`` once a second for as long
+as it was open, sending the same number and logging a line each time. With
+many result pages open that is steady CPU and log traffic while nothing
+happens, and up to a second of delay when something does.
+
+``ProgressHub`` keeps the latest update for each job, numbered by a per-job
+version, and wakes whoever is waiting on that job when a new one is
+published. Jobs run in FastAPI's threadpool, not on the event loop, so
+``publish`` is safe to call from any thread: it hands the wake-up to each
+waiter's own loop.
+
+Subscribers see the latest state, not every intermediate one; if two updates
+land while a socket is busy sending, it sends the newer and skips the older.
+"""
+import asyncio
+import collections
+import threading
+import time
+
+# Progress values that end a job: finished, or failed.
+DONE = 100
+FAILED = -1
+
+
+def is_final(update) -> bool:
+    return update["progress"] >= DONE or update["progress"] == FAILED
+
+
+class ProgressHub:
+    """The latest progress of every job, with per-job change notification."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._updates = {}
+        self._waiters = collections.defaultdict(set)
+
+    def publish(self, job_id: str, progress: int, stage: str) -> dict:
+        """Record a job's new state and wake everyone waiting on it."""
+        with self._lock:
+            previous = self._updates.get(job_id)
+            update = {
+                "job_id": job_id,
+                "progress": progress,
+                "stage": stage,
+                "time": time.time(),
+                "version": previous["version"] + 1 if previous else 1,
+            }
+            self._updates[job_id] = update
+            waiters = self._waiters.pop(job_id, ())
+        for waiter in waiters:
+            waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+        return update
+
+    def latest(self, job_id: str):
+        """The job's most recent update, or None if it has published none."""
+        return self._updates.get(job_id)
+
+    async def wait(self, job_id: str, after: int = 0, timeout: float | None = None):
+        """The first update newer than version ``after``.
+
+        Returns at once if there already is one, otherwise when one is
+        published, or None once ``timeout`` seconds pass without one.
+        """
+        with self._lock:
+            update = self._updates.get(job_id)
+            if update is not None and update["version"] > after:
+                return update
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters[job_id].add(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(job_id)
+                if waiters is not None:
+                    waiters.discard(waiter)
+                    if not waiters:
+                        del self._waiters[job_id]
+        return self._updates.get(job_id)
+
+    async def updates(self, job_id: str, after: int = 0):
+        """Yield each new state of the job until it finishes or fails."""
+        while True:
+            update = await self.wait(job_id, after)
+            after = update["version"]
+            yield update
+            if is_final(update):
+                return
+
+
+def _wake(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+# The app's one hub, written by app.tasks and read by the progress routes.
+progress_hub = ProgressHub()
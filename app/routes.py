@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Request, BackgroundTasks, UploadFile, File, Form, WebSocket, HTTPException
-from fastapi.responses import FileResponse, JSONResponse, HTMLResponse
+from fastapi import APIRouter, Request, BackgroundTasks, UploadFile, File, Form, Query, Header, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi.responses import FileResponse, JSONResponse, HTMLResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
+from anyio import from_thread
+from starlette.concurrency import run_in_threadpool
 from app.services import get_fallback_models, fetch_openai_models, clear_model_cache
-from app.tasks import process_resume_job
+from app.downloads import conditional_file_response, content_addressed_url
+from app.progress import is_final, progress_hub
+from app.tasks import report_progress, run_resume_job
 from app.utils import sanitize_filename, format_markdown_for_text
-from app.state import progress_status, jobs_db, OUTPUT_DIR
+from app.state import progress_status, jobs_db, OUTPUT_DIR, PROFILE_AUDITS
+from app.uploads import CHUNK_SIZE, MAX_EXPANSION, AuditCache, UploadRejected, save_upload
+from app.workers import PoolBusy, audit_pool
 from urllib.parse import urlparse
 import os
 import uuid
@@ -12,9 +18,16 @@ import shutil
 import asyncio
 import re
 import tempfile
-from ats import score_resume
+import zipfile
+import json
+import dataclasses
+from typing import List
+from ats import LiveSession, index_posting
+from ats.batch import ScoreFailure, Summary
+from ats.history import text_digest
+from ats.profiling import PROFILE_FORMATS
+from ats.serialize import to_json, to_msgpack
 from openai import OpenAI
-from job_scraper import JobPostingScraper
 from interview_questions import generate_interview_questions
 import logging
 
@@ -33,16 +46,88 @@ async def favicon():
     return FileResponse(os.path.join("static", "favicon.ico"))
 
 
+AUDIT_FORMATS = ("json", "compact", "msgpack")
+
+# Scorecards by (upload SHA-256, posting digest): the same file against the
+# same posting is not scored twice.
+audit_cache = AuditCache()
+
+
+def _rejected(exc: UploadRejected) -> JSONResponse:
+    return JSONResponse(status_code=exc.status_code, content={"error": exc.message})
+
+
+def scorecard_response(card, fmt: str = "json") -> Response:
+    """Encode a scorecard in the requested wire format.
+
+    ``json`` is the readable :meth:`Scorecard.to_dict` shape; ``compact`` and
+    ``msgpack`` are the round-trippable short-key form from ``ats.serialize``.
+    """
+    if fmt == "msgpack":
+        return Response(content=to_msgpack(card), media_type="application/x-msgpack")
+    return Response(
+        content=to_json(card, compact=fmt == "compact"), media_type="application/json"
+    )
+
+
+PROFILE_MEDIA = {
+    "pstats": ("application/octet-stream", "audit.prof"),
+    "collapsed": ("text/plain; charset=utf-8", "audit.folded"),
+}
+
+
+def _requested_profile(value: str) -> str | None:
+    """Map a ``profile`` flag to a format: ``1``/``true`` mean pstats."""
+    value = (value or "").strip().lower()
+    if value in ("", "0", "false", "no"):
+        return None
+    return "pstats" if value in ("1", "true", "yes") else value
+
+
 @router.post("/audit/")
 async def audit_resume(
     file: UploadFile = File(...),
     job_description: str = Form(""),
+    fmt: str = Query("json", alias="format"),
+    profile: str = Query(""),
+    x_ats_profile: str = Header(""),
 ):
     """Score a resume for ATS compatibility. No API key, no model, no cost.
 
     Deciding whether a document parses is arithmetic over its own XML, so this
     endpoint stays free and offline. Only the rewriting features need OpenAI.
+
+    The upload is streamed to disk and hashed; anything over
+    ``ATS_MAX_UPLOAD_MB`` is refused with 413, and anything that is not a Word
+    package with 400, before a worker sees it. A file already scored against
+    the same posting is answered from the cache.
+
+    Scoring runs on the audit worker pool. When every worker is busy and the
+    queue behind them is full, the answer is 503 with ``Retry-After``.
+
+    With ``ATS_PROFILE_AUDITS`` set, ``?profile=pstats|collapsed`` (or the
+    ``X-ATS-Profile`` header) returns a profile of scoring this upload in place
+    of the scorecard, with the parse score in ``X-ATS-Parse-Score``.
     """
+    if fmt not in AUDIT_FORMATS:
+        return JSONResponse(
+            status_code=400,
+            content={"error": f"Unknown format {fmt!r}; use one of: {', '.join(AUDIT_FORMATS)}."},
+        )
+    profile_format = _requested_profile(profile or x_ats_profile)
+    if profile_format and not PROFILE_AUDITS:
+        return JSONResponse(
+            status_code=403,
+            content={"error": "Profiling is disabled; set ATS_PROFILE_AUDITS=1 to enable it."},
+        )
+    if profile_format and profile_format not in PROFILE_FORMATS:
+        return JSONResponse(
+            status_code=400,
+            content={
+                "error": f"Unknown profile format {profile_format!r}; "
+                f"use one of: {', '.join(PROFILE_FORMATS)}."
+            },
+        )
     if not (file.filename or "").lower().endswith(".docx"):
         return JSONResponse(
             status_code=400,
@@ -52,13 +137,25 @@ async def audit_resume(
     tmp_dir = tempfile.mkdtemp(prefix="ats-audit-")
     tmp_path = os.path.join(tmp_dir, sanitize_filename(file.filename or "resume.docx"))
     try:
-        with open(tmp_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        card = score_resume(tmp_path, job_description or None)
-        payload = card.to_dict()
+        digest = await save_upload(file, tmp_path)
+        key = (digest, text_digest(job_description) if job_description else None)
+        card = None if profile_format else audit_cache.get(key)
+        if card is None:
+            card, profile_output = await audit_pool.audit(
+                tmp_path, job_description or None, profile_format
+            )
+            if not profile_format:
+                audit_cache.put(key, card)
         # The stored path is a server temp directory; it is noise to the caller.
-        payload["path"] = file.filename
-        return JSONResponse(content=payload)
+        card = dataclasses.replace(card, path=file.filename)
+    except UploadRejected as exc:
+        return _rejected(exc)
+    except PoolBusy as exc:
+        return JSONResponse(
+            status_code=503,
+            content={"error": str(exc)},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
     except Exception as exc:  # noqa: BLE001
         logging.error(f"Audit failed: {exc}")
         return JSONResponse(
@@ -68,6 +165,177 @@ async def audit_resume(
     finally:
         shutil.rmtree(tmp_dir, ignore_errors=True)
 
+    if profile_format:
+        media_type, filename = PROFILE_MEDIA[profile_format]
+        return Response(
+            content=profile_output,
+            media_type=media_type,
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                "X-ATS-Parse-Score": str(card.parse_score),
+            },
+        )
+    try:
+        return scorecard_response(card, fmt)
+    except ImportError as exc:
+        return JSONResponse(status_code=501, content={"error": str(exc)})
+
+
+# A batch is one request holding workers for a while; these keep one upload
+# from holding them, or the disk, indefinitely.
+BATCH_MAX_FILES = 1000
+BATCH_MAX_FILE_BYTES = 20 * 1024 * 1024
+BATCH_MAX_EXPANDED_BYTES = 1024 * 1024 * 1024
+
+
+def _unpack_batch(uploads, directory):
+    """Save uploaded resumes, and the resumes inside uploaded zips, to ``directory``.
+
+    Returns ``(name, path)`` pairs to score and ``(name, error)`` pairs for
+    entries that were refused before scoring. This is blocking file work, so
+    it runs in a threadpool thread. Direct .docx parts are saved with
+    ``save_upload`` for its checks; being a coroutine, it is handed back to
+    the event loop with ``from_thread.run`` and this thread waits for it.
+    """
+    accepted, refused = [], []
+    limit = f"Skipped: a batch holds at most {BATCH_MAX_FILES} resumes."
+    budget = f"Skipped: the batch unpacks to more than {BATCH_MAX_EXPANDED_BYTES // 2**20} MB."
+    written = 0
+
+    def target(name):
+        stem = sanitize_filename(os.path.basename(name)) or "resume.docx"
+        return os.path.join(directory, f"{len(accepted):05d}_{stem}")
+
+    for upload in uploads:
+        name = upload.filename or "upload"
+        lower = name.lower()
+        if len(accepted) >= BATCH_MAX_FILES:
+            refused.append((name, limit))
+        elif lower.endswith(".docx"):
+            if written + (upload.size or 0) > BATCH_MAX_EXPANDED_BYTES:
+                refused.append((name, budget))
+                continue
+            path = target(name)
+            try:
+                from_thread.run(save_upload, upload, path, BATCH_MAX_FILE_BYTES)
+            except UploadRejected as exc:
+                refused.append((name, exc.message))
+                continue
+            written += os.path.getsize(path)
+            accepted.append((name, path))
+        elif lower.endswith(".zip"):
+            try:
+                archive = zipfile.ZipFile(upload.file)
+            except zipfile.BadZipFile:
+                refused.append((name, "Not a readable zip archive."))
+                continue
+            with archive:
+                for info in archive.infolist():
+                    member = info.filename
+                    base = os.path.basename(member)
+                    if info.is_dir() or member.startswith("__MACOSX/") or base.startswith("~$"):
+                        continue
+                    label = f"{name}/{member}"
+                    if not base.lower().endswith(".docx"):
+                        refused.append((label, "Not a .docx file."))
+                    elif info.file_size > BATCH_MAX_FILE_BYTES:
+                        refused.append((label, "Larger than the per-file limit."))
+                    elif info.file_size > MAX_EXPANSION * max(info.compress_size, CHUNK_SIZE):
+                        refused.append((label, "Compressed far more than any resume is."))
+                    elif len(accepted) >= BATCH_MAX_FILES:
+                        refused.append((label, limit))
+                    elif written + info.file_size > BATCH_MAX_EXPANDED_BYTES:
+                        refused.append((label, budget))
+                    else:
+                        path = target(base)
+                        # ZipExtFile stops at the declared size, so the
+                        # budget holds even for a lying directory.
+                        with archive.open(info) as source, open(path, "wb") as buffer:
+                            shutil.copyfileobj(source, buffer)
+                        written += info.file_size
+                        accepted.append((label, path))
+        else:
+            refused.append((name, "Upload .docx resumes or a .zip of them."))
+    return accepted, refused
+
+
+async def _stream_batch(accepted, refused, posting, fmt, tmp_dir):
+    """Yield one NDJSON line per resume as it finishes, then a summary line."""
+    summary = Summary()
+    pending = {}
+    queue = iter(accepted)
+    try:
+        for name, error in refused:
+            summary.add(ScoreFailure(path=name, error=error))
+            yield json.dumps({"path": name, "error": error}) + "\n"
+
+        def submit():
+            for name, path in queue:
+                pending[asyncio.ensure_future(audit_pool.audit(path, posting, wait=True))] = name
+                return
+
+        # Keep at most one document per worker in flight for this batch, so
+        # single /audit/ calls still find room in the queue.
+        for _ in range(audit_pool.workers):
+            submit()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = pending.pop(task)
+                submit()
+                try:
+                    card, _ = task.result()
+                except Exception as exc:  # noqa: BLE001
+                    failure = ScoreFailure(path=name, error=f"{type(exc).__name__}: {exc}")
+                    summary.add(failure)
+                    yield json.dumps({"path": failure.path, "error": failure.error}) + "\n"
+                    continue
+                card.path = name
+                summary.add(card)
+                yield to_json(card, compact=fmt == "compact").decode("utf-8") + "\n"
+        yield json.dumps({"summary": summary.to_dict()}) + "\n"
+    finally:
+        # Also reached when the client disconnects mid-stream.
+        for task in pending:
+            task.cancel()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+@router.post("/audit/batch/")
+async def audit_batch(
+    files: List[UploadFile] = File(...),
+    job_description: str = Form(""),
+    fmt: str = Query("json", alias="format"),
+):
+    """Score many resumes in one request, streaming NDJSON as each finishes.
+
+    ``files`` may be any mix of .docx resumes and .zip archives of them. The
+    posting is analyzed once for the whole batch. Each line is a scorecard in
+    the requested ``format`` (``json`` or ``compact``), or ``{"path",
+    "error"}`` for a file that could not be scored; the last line is
+    ``{"summary": ...}``, as ``ats score`` prints for a batch.
+    """
+    if fmt not in ("json", "compact"):
+        return JSONResponse(
+            status_code=400,
+            content={"error": f"Unknown format {fmt!r}; use json or compact."},
+        )
+    tmp_dir = tempfile.mkdtemp(prefix="ats-batch-")
+    try:
+        accepted, refused = await run_in_threadpool(_unpack_batch, files, tmp_dir)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    if not accepted and not refused:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return JSONResponse(status_code=400, content={"error": "No resumes were uploaded."})
+
+    posting = index_posting(job_description) if job_description.strip() else None
+    return StreamingResponse(
+        _stream_batch(accepted, refused, posting, fmt, tmp_dir),
+        media_type="application/x-ndjson",
+    )
+
 
 @router.post("/upload_resume/")
 async def upload_resume(
@@ -80,16 +348,15 @@ async def upload_resume(
     api_key: str = Form(...)
 ):
     """
-    Validates the job posting URL, saves the resume and job posting data,
-    and schedules a background task to process the resume.
+    Validates the job posting URL, saves the resume, and schedules the
+    background job that does everything else. The resume is streamed to disk
+    and checked as it arrives, as for ``/audit/``.
+
+    Fetching the posting, extracting its title and company, and capturing the
+    screenshot are stages of that job, not of this request, so the job id
+    comes back at once however slow the job site is. The finished bundle is
+    served from ``/jobs/{job_id}/download``.
     """
-    # Initialize job scraper with user-selected model
-    job_scraper = JobPostingScraper(
-        model_name=model,
-        temperature=temperature,
-        api_key=api_key
-    )
-    
     # Validate job posting URL
     parsed_url = urlparse(job_link)
     if not (parsed_url.scheme and parsed_url.netloc):
@@ -98,49 +365,24 @@ async def upload_resume(
     # Generate a unique job ID for progress tracking
     job_id = str(uuid.uuid4())
     
-    # Scrape job posting details with the configured model
-    job_data = job_scraper.scrape_job_posting(job_link)
-    
-    # Sanitize company name and job title for file paths
-    company_name = sanitize_filename(job_data["company"])
-    if company_name == "Unknown_Company":
-        company_name = "Generic_Company"
-    
-    job_title = sanitize_filename(job_data.get("job_title", "Job_Description"))[:50]
-    
-    company_dir = os.path.join(OUTPUT_DIR, company_name)
-    os.makedirs(company_dir, exist_ok=True)
-    
-    # Save job posting text.
-    job_posting_path = os.path.join(company_dir, f"{job_title}.txt")
-    with open(job_posting_path, "w", encoding="utf-8") as f:
-        f.write(job_data.get("job_text", ""))
-    
-    # Capture a screenshot of the job posting.
-    screenshot_path = os.path.join(company_dir, "job_screenshot.png")
+    # Park the upload until the job knows which company directory it belongs in.
+    upload_dir = os.path.join(OUTPUT_DIR, "uploads")
+    os.makedirs(upload_dir, exist_ok=True)
+    upload_path = os.path.join(upload_dir, f"{job_id}.docx")
     try:
-        job_scraper.capture_screenshot(job_link, screenshot_path)
-    except Exception as e:
-        logging.error(f"Failed to capture screenshot: {str(e)}")
-        # Create an empty file to maintain the expected file structure
-        with open(screenshot_path, "wb") as f:
-            pass
+        digest = await save_upload(file, upload_path)
+    except UploadRejected as exc:
+        return _rejected(exc)
     
-    # Save the uploaded resume DOCX.
-    resume_path = os.path.join(company_dir, "original_resume.docx")
-    with open(resume_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-    
-    # Create zip filename with sanitized components
-    zip_filename = f"{company_name}_{job_title}.zip"
+    jobs_db[job_id] = {"job_link": job_link, "upload_sha256": digest}
+    report_progress(job_id, 0, "queued")
     
     # Schedule background processing
     background_tasks.add_task(
-        process_resume_job, 
-        job_id, 
-        job_data, 
-        resume_path, 
-        company_dir,
+        run_resume_job,
+        job_id,
+        job_link,
+        upload_path,
         model,
         temperature,
         api_key
@@ -148,13 +390,20 @@ async def upload_resume(
     
     # Return both the job ID and download URL
     return JSONResponse(content={
-        "redirect_url": f"/result?job_id={job_id}&download_url=/download/{zip_filename}",
+        "redirect_url": f"/result?job_id={job_id}&download_url=/jobs/{job_id}/download",
         "job_id": job_id
     })
 
 @router.get("/result", response_class=HTMLResponse)
 async def result_page(request: Request, job_id: str, download_url: str):
-    """Show result page with download link and progress status."""
+    """Show result page with download link and progress status.
+
+    Once the job's bundle exists, the link names its contents, so the
+    browser may keep the download for good.
+    """
+    bundle = jobs_db.get(job_id, {}).get("download")
+    if bundle and os.path.exists(bundle):
+        download_url = await content_addressed_url(f"/jobs/{job_id}/download", bundle)
     return templates.TemplateResponse(
         request,
         "result.html",
@@ -242,27 +491,59 @@ async def generate_questions(
         raise HTTPException(status_code=500, detail=f"Error generating questions: {str(e)}")
 
 
+# Longest the model dropdown waits on OpenAI before it gets the fallback list.
+# The fetch carries on and fills the cache for the next page load.
+MODEL_LIST_WAIT = 3
+
+
 @router.get("/available_models")
 async def get_available_models(api_key: str = None, force_refresh: bool = False):
     """
     Returns available OpenAI models with caching.
-    If no API key is provided or there's an error, returns fallback models.
+    If no API key is provided, there's an error, or OpenAI is slow to answer,
+    returns fallback models.
     """
     try:
-        if force_refresh:
-            clear_model_cache()
         if not api_key:
             return JSONResponse(content={"models": get_fallback_models()})
+        if force_refresh:
+            clear_model_cache(api_key)
             
-        models = await fetch_openai_models(api_key)
+        models = await asyncio.wait_for(
+            asyncio.shield(fetch_openai_models(api_key)), MODEL_LIST_WAIT
+        )
         return JSONResponse(content={"models": models})
-        
+
+    except asyncio.TimeoutError:
+        # Expected now and then: the fetch goes on and fills the cache.
+        logging.info("Model list is slow to arrive; serving the fallback list for now")
+        return JSONResponse(content={"models": get_fallback_models()})
     except Exception as e:
         print(f"Error in get_available_models: {e}")
         return JSONResponse(content={"models": get_fallback_models()})
     
+async def _zip_download(request: Request, file_path: str, filename: str) -> Response:
+    """Serve a result bundle with headers that keep browsers from balking.
+
+    Repeat and partial requests are answered from the validators, so a
+    refresh costs a 304 and a broken download resumes; see app.downloads.
+    """
+    logging.info(f"Serving download file: {filename}")
+    
+    # Add security headers to prevent Chrome warnings
+    headers = {
+        "X-Content-Type-Options": "nosniff",
+        "Content-Disposition": f"attachment; filename=\"{filename}\"",
+        "Content-Security-Policy": "default-src 'self'",
+    }
+    
+    return await conditional_file_response(
+        request, file_path, filename, "application/zip", headers
+    )
+
+
 @router.get("/download/{filename}")
-async def download_file(filename: str):
+async def download_file(request: Request, filename: str):
     """
     Download a file from the output directory.
     
@@ -276,37 +557,64 @@ async def download_file(filename: str):
     if not os.path.exists(file_path):
         logging.error(f"File not found: {file_path}")
         raise HTTPException(status_code=404, detail="File not found")
-        
-    logging.info(f"Serving download file: {filename}")
-    
-    # Add security headers to prevent Chrome warnings
-    headers = {
-        "X-Content-Type-Options": "nosniff",
-        "Content-Disposition": f"attachment; filename=\"{filename}\"",
-        "Content-Security-Policy": "default-src 'self'",
-    }
-    
-    return FileResponse(
-        path=file_path, 
-        filename=filename,
-        media_type="application/zip",
-        headers=headers
-    )
+    return await _zip_download(request, file_path, filename)
+
+
+@router.get("/jobs/{job_id}/download")
+async def download_job(request: Request, job_id: str):
+    """Download a job's bundle, whose name is only known once the job has run."""
+    job = jobs_db.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    file_path = job.get("download")
+    if not file_path:
+        if progress_status.get(job_id) == -1:
+            raise HTTPException(status_code=404, detail="Job failed; there is nothing to download")
+        raise HTTPException(status_code=409, detail="Job is still running")
+    if not os.path.exists(file_path):
+        logging.error(f"File not found: {file_path}")
+        raise HTTPException(status_code=404, detail="File not found")
+    return await _zip_download(request, file_path, os.path.basename(file_path))
+
+def _progress_snapshot(job_id: str):
+    """The job's latest update, or None for a job this server does not know."""
+    update = progress_hub.latest(job_id)
+    if update is None and job_id in progress_status:
+        # Recorded without going through the hub; report it as version 0 so
+        # the first real update still counts as news.
+        update = {
+            "job_id": job_id,
+            "progress": progress_status[job_id],
+            "stage": jobs_db.get(job_id, {}).get("stage", ""),
+            "time": None,
+            "version": 0,
+        }
+    return update
+
 
 @router.websocket("/ws/progress/{job_id}")
 async def websocket_progress(websocket: WebSocket, job_id: str):
-    """WebSocket endpoint for progress updates."""
+    """Push a job's progress as it changes.
+
+    Each message is ``{"job_id", "progress", "stage", "time", "version"}``:
+    the current state on connect, then one message per change, and the socket
+    closes once the job finishes (100) or fails (-1). Nothing is sent while
+    nothing changes.
+    """
     await websocket.accept()
     try:
-        logging.info(f"WebSocket connection established for job {job_id}")
-        while True:
-            progress = progress_status.get(job_id, 0)
-            logging.info(f"WebSocket sending progress for job {job_id}: {progress}")
-            await websocket.send_text(str(progress))
-            if progress >= 100 or progress == -1:  # Also exit on error
-                logging.info(f"Job {job_id} completed or failed with progress {progress}")
-                break
-            await asyncio.sleep(1)
+        update = _progress_snapshot(job_id)
+        if update is None:
+            await websocket.send_json({"job_id": job_id, "error": "Job not found"})
+            await websocket.close()
+            return
+        await websocket.send_json(update)
+        if not is_final(update):
+            async for update in progress_hub.updates(job_id, after=update["version"]):
+                await websocket.send_json(update)
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
     except Exception as e:
         logging.error(f"WebSocket error for job {job_id}: {e}")
         try:
@@ -314,3 +622,155 @@ async def websocket_progress(websocket: WebSocket, job_id: str):
         except:
             pass
 
+
+# Longest a long-poll is held open, and how often an idle event stream sends a
+# comment so proxies do not time it out.
+STATUS_MAX_WAIT = 60
+EVENTS_HEARTBEAT = 15
+
+
+def _progress_etag(update) -> str:
+    return f'"{update["version"]}"'
+
+
+def _version_from_etag(value: str):
+    """The version in an ``If-None-Match`` value we issued, or None."""
+    for tag in (value or "").split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        tag = tag.strip('"')
+        if tag.isdigit():
+            return int(tag)
+    return None
+
+
+@router.get("/jobs/{job_id}/status")
+async def job_status(
+    job_id: str,
+    wait: float = Query(0, ge=0),
+    version: int | None = Query(None, ge=0),
+    if_none_match: str = Header(""),
+):
+    """A job's progress, as a long-poll.
+
+    The answer is the same update the progress socket sends, with its
+    version as the ``ETag``. A client that already has a version sends it
+    back as ``If-None-Match`` (or ``?version=``) with ``?wait=`` seconds, up
+    to 60: the request is answered as soon as the job moves on, or with 304
+    once the wait runs out, so one open request replaces a polling loop.
+    """
+    update = _progress_snapshot(job_id)
+    if update is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    known = version if version is not None else _version_from_etag(if_none_match)
+    if known is not None and known >= update["version"]:
+        if wait and not is_final(update):
+            newer = await progress_hub.wait(job_id, known, timeout=min(wait, STATUS_MAX_WAIT))
+            if newer is not None:
+                update = newer
+        if known >= update["version"]:
+            return Response(status_code=304, headers={"ETag": _progress_etag(update)})
+    return JSONResponse(
+        content=update,
+        headers={"ETag": _progress_etag(update), "Cache-Control": "no-cache"},
+    )
+
+
+async def _progress_events(job_id: str, update, last_seen):
+    """Server-sent events for each change to the job, until it ends."""
+    def event(update):
+        return f"id: {update['version']}\nevent: progress\ndata: {json.dumps(update)}\n\n"
+
+    if last_seen is None or update["version"] > last_seen:
+        yield event(update)
+    version = update["version"]
+    while not is_final(update):
+        newer = await progress_hub.wait(job_id, version, timeout=EVENTS_HEARTBEAT)
+        if newer is None:
+            yield ": keep-alive\n\n"
+            continue
+        update, version = newer, newer["version"]
+        yield event(update)
+
+
+@router.get("/jobs/{job_id}/events")
+async def job_events(job_id: str, last_event_id: str = Header("")):
+    """A job's progress as Server-Sent Events, for clients a proxy keeps off websockets.
+
+    Each ``progress`` event carries the same JSON as the progress socket,
+    with its version as the event id, so a reconnecting ``EventSource``
+    resumes with ``Last-Event-ID`` and is not sent what it already has. The
+    stream ends when the job finishes or fails.
+    """
+    update = _progress_snapshot(job_id)
+    if update is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    last_seen = int(last_event_id) if last_event_id.isdigit() else None
+    return StreamingResponse(
+        _progress_events(job_id, update, last_seen),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws/live")
+async def websocket_live(websocket: WebSocket):
+    """Keep a resume's match score current while it is being edited.
+
+    The first message opens the session with the posting and the draft:
+    ``{"job_description": "...", "paragraphs": ["...", ...]}``. Every message
+    after that is one edit, ``{"op": "replace" | "insert" | "delete", "index": n,
+    "text": "..."}``, answered with the updated coverage. ``{"op": "audit"}``
+    runs the text-level parse checks over the whole draft on demand.
+    """
+    await websocket.accept()
+    try:
+        opening = await websocket.receive_json()
+        if not isinstance(opening, dict):
+            await websocket.send_json({"error": "A live session opens with a JSON object."})
+            await websocket.close()
+            return
+        job_description = (opening.get("job_description") or "").strip()
+        if not job_description:
+            await websocket.send_json({"error": "A live session needs a job_description."})
+            await websocket.close()
+            return
+        paragraphs = opening.get("paragraphs")
+        if paragraphs is None:
+            paragraphs = (opening.get("text") or "").split("\n")
+        # Tokenizing the draft and the posting, and the audit's parse checks,
+        # are CPU work on the whole text: keep them off the event loop.
+        session = await run_in_threadpool(
+            LiveSession, job_description, [str(p) for p in paragraphs]
+        )
+        await websocket.send_json(session.snapshot())
+
+        while True:
+            delta = await websocket.receive_json()
+            if not isinstance(delta, dict):
+                await websocket.send_json({"error": "Each edit must be a JSON object."})
+                continue
+            if delta.get("op") == "audit":
+                card = await run_in_threadpool(session.scorecard)
+                await websocket.send_json({
+                    "parse_score": card.parse_score,
+                    "grade": card.grade,
+                    "findings": [str(f) for f in card.findings],
+                    **session.snapshot(),
+                })
+                continue
+            try:
+                session.apply(delta)
+            except ValueError as exc:
+                await websocket.send_json({"error": str(exc)})
+                continue
+            await websocket.send_json(session.snapshot())
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logging.error(f"Live scoring websocket error: {e}")
+        try:
+            await websocket.close()
+        except Exception:
+            pass
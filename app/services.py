@@ -1,7 +1,4 @@
-from openai import OpenAI
-from typing import List
-
-from openai import OpenAI
+from openai import AsyncOpenAI
 from typing import List, Dict
 from app.caching import timed_cache
 
@@ -72,9 +69,12 @@ def get_friendly_model_name(model_id: str) -> str:
     return model_id
 
 # Add a function to clear the cache
-def clear_model_cache():
-    """Clear the model cache to force a refresh"""
-    fetch_openai_models.cache = {}  # Reset the cache dictionary
+def clear_model_cache(api_key: str = None):
+    """Clear the model cache, for one API key or for all, to force a refresh"""
+    if api_key is None:
+        fetch_openai_models.cache_clear()
+    else:
+        fetch_openai_models.invalidate(api_key)
 
 # Update the excluded_models list to ensure reasoning models aren't filtered out
 excluded_models = [
@@ -84,13 +84,17 @@ excluded_models = [
     '-16k', '-mini-realtime', '-realtime', '-audio'
 ]
 
-# Update the fetch_openai_models function to deduplicate models
-@timed_cache(seconds=300)
+# Update the fetch_openai_models function to deduplicate models.
+# A list up to an hour past its five minutes is served while it is refreshed.
+@timed_cache(seconds=300, stale=3600)
 async def fetch_openai_models(api_key: str) -> List[Dict]:
     """
     Fetches available OpenAI models with caching.
-    Returns a list of model info dictionaries.
+    Returns a list of model info dictionaries. Errors are raised, not
+    cached, so a failed refresh leaves the last good list in place.
     """
+    # Closed on the way out, so no refresh leaves a connection pool behind.
+    client = AsyncOpenAI(api_key=api_key)
     try:
         # List of model types to exclude
         excluded_models = [
@@ -100,8 +104,7 @@ async def fetch_openai_models(api_key: str) -> List[Dict]:
             '-16k', '-mini-realtime', '-realtime', '-audio'
         ]
         
-        client = OpenAI(api_key=api_key)
-        models = client.models.list()
+        models = await client.models.list()
         
         # List of known chat-compatible model prefixes
         chat_model_prefixes = [
@@ -238,9 +241,8 @@ async def fetch_openai_models(api_key: str) -> List[Dict]:
                 x["name"]  # Alphabetical within same category
             )
         )
-    except Exception as e:
-        print(f"Error fetching OpenAI models: {e}")
-        return get_fallback_models()
+    finally:
+        await client.close()
 
 
 
@@ -1,6 +1,7 @@
 """
 Shared state for the application.
 """
+import os
 
 # Progress status for background jobs
 progress_status = {}
@@ -9,4 +10,18 @@ progress_status = {}
 jobs_db = {}
 
 # Output directory
-OUTPUT_DIR = "output" 
\ No newline at end of file
+OUTPUT_DIR = "output" 
+
+# Whether /audit/ may return a profile of the request instead of its scorecard.
+# Off by default: a profile exposes server paths and costs extra work per call.
+PROFILE_AUDITS = os.getenv("ATS_PROFILE_AUDITS", "").lower() in ("1", "true", "yes")
+
+# Worker processes for /audit/, and how many audits may wait behind them before
+# new ones are refused with 503. Defaults: one worker per CPU, four queued each.
+AUDIT_WORKERS = int(os.getenv("ATS_AUDIT_WORKERS") or 0) or os.cpu_count() or 1
+AUDIT_QUEUE = int(os.getenv("ATS_AUDIT_QUEUE") or 4 * AUDIT_WORKERS)
+
+# Largest resume accepted by /audit/ and /upload_resume/, and largest request
+# body accepted by /audit/batch/; bigger uploads get 413 before they are read.
+MAX_UPLOAD_BYTES = int(float(os.getenv("ATS_MAX_UPLOAD_MB") or 10) * 1024 * 1024)
+MAX_BATCH_BYTES = int(float(os.getenv("ATS_MAX_BATCH_MB") or 200) * 1024 * 1024)
@@ -1,10 +1,13 @@
 import json
 import os
+import shutil
 import zipfile
 import logging
 from app.utils import extract_text_from_docx, sanitize_filename, format_markdown_for_text
-from app.state import progress_status, OUTPUT_DIR
-from ats import format_scorecard, score_resume
+from app.progress import progress_hub
+from app.state import progress_status, jobs_db, OUTPUT_DIR
+from ats import format_scorecard
+from ats.compare import compare_resumes
 from resume.processor import ResumeProcessor
 from recommendations import generate_recommendations
 from interview_questions import generate_interview_questions
@@ -20,8 +23,8 @@ def write_ats_audit(original_path, rewritten_path, job_text, company_dir):
     should not cost the user their rewritten resume.
     """
     try:
-        before = score_resume(original_path, job_text)
-        after = score_resume(rewritten_path, job_text)
+        comparison = compare_resumes(original_path, rewritten_path, job_text or None)
+        before, after = comparison.before, comparison.after
 
         lines = [
             "ATS COMPATIBILITY REPORT",
@@ -42,6 +45,14 @@ def write_ats_audit(original_path, rewritten_path, job_text, company_dir):
         lines += [
             f"{'Critical findings':24} {len(before.critical):>8} {len(after.critical):>8} "
             f"{len(after.critical) - len(before.critical):>+8}",
+        ]
+        for heading, findings in (
+            ("Fixed by the rewrite", comparison.removed),
+            ("Introduced by the rewrite", comparison.added),
+        ):
+            if findings:
+                lines += ["", f"{heading}:"] + [f"  {finding}" for finding in findings]
+        lines += [
             "",
             "--- ORIGINAL ---",
             format_scorecard(before, verbose=True),
@@ -53,14 +64,114 @@ def write_ats_audit(original_path, rewritten_path, job_text, company_dir):
         with open(os.path.join(company_dir, "ats_report.txt"), "w", encoding="utf-8") as f:
             f.write("\n".join(lines))
         with open(os.path.join(company_dir, "ats_report.json"), "w", encoding="utf-8") as f:
-            json.dump(
-                {"before": before.to_dict(), "after": after.to_dict()}, f, indent=2
-            )
+            json.dump(comparison.to_dict(), f, indent=2)
         return {"before": before.parse_score, "after": after.parse_score}
     except Exception as exc:  # noqa: BLE001
         logging.error(f"ATS audit failed: {exc}")
         return None
 
+def report_progress(job_id: str, percent: int, stage: str):
+    """Record how far a job has got, and wake everyone watching it."""
+    progress_status[job_id] = percent
+    jobs_db.setdefault(job_id, {})["stage"] = stage
+    progress_hub.publish(job_id, percent, stage)
+    logging.info(f"Job {job_id}: {stage} - Progress: {percent}%")
+
+
+def prepare_job(
+    job_id: str,
+    job_link: str,
+    upload_path: str,
+    model: str,
+    temperature: float,
+    api_key: str
+):
+    """
+    Fetch the posting, extract its company and title, capture a screenshot,
+    and file the uploaded resume in the company's output directory.
+
+    These used to run inside the upload request, where one slow job site held
+    the request (and, being blocking calls in an async route, the server) for
+    as long as it took. Returns ``(job_data, resume_path, company_dir)``.
+    """
+    # Imported here: job_scraper loads selenium, langchain and PIL, which only
+    # this pipeline needs and which dominate the app's start-up time otherwise.
+    from job_scraper import JobPostingScraper
+
+    job_scraper = JobPostingScraper(
+        model_name=model,
+        temperature=temperature,
+        api_key=api_key
+    )
+
+    report_progress(job_id, 2, "fetching job posting")
+    job_data = job_scraper.scrape_job_posting(job_link)
+
+    # Sanitize company name and job title for file paths
+    company_name = sanitize_filename(job_data["company"])
+    if company_name == "Unknown_Company":
+        company_name = "Generic_Company"
+    job_title = sanitize_filename(job_data.get("job_title", "Job_Description"))[:50]
+
+    company_dir = os.path.join(OUTPUT_DIR, company_name)
+    os.makedirs(company_dir, exist_ok=True)
+
+    # Save job posting text.
+    job_posting_path = os.path.join(company_dir, f"{job_title}.txt")
+    with open(job_posting_path, "w", encoding="utf-8") as f:
+        f.write(job_data.get("job_text", ""))
+
+    report_progress(job_id, 5, "capturing job posting")
+    screenshot_path = os.path.join(company_dir, "job_screenshot.png")
+    try:
+        job_scraper.capture_screenshot(job_link, screenshot_path)
+    except Exception as e:
+        logging.error(f"Failed to capture screenshot: {str(e)}")
+        # Create an empty file to maintain the expected file structure
+        with open(screenshot_path, "wb") as f:
+            pass
+
+    resume_path = os.path.join(company_dir, "original_resume.docx")
+    shutil.move(upload_path, resume_path)
+
+    jobs_db[job_id].update({
+        "company": job_data.get("company", ""),
+        "job_title": job_data.get("job_title", ""),
+        "job_description": job_data.get("job_text", ""),
+    })
+    report_progress(job_id, 8, "job posting saved")
+    return job_data, resume_path, company_dir
+
+
+def run_resume_job(
+    job_id: str,
+    job_link: str,
+    upload_path: str,
+    model: str,
+    temperature: float,
+    api_key: str
+):
+    """
+    The whole background pipeline for one upload: prepare the job, then
+    rewrite and bundle the resume, which ``process_resume_job`` records in
+    ``jobs_db`` for ``/jobs/{job_id}/download``.
+    """
+    try:
+        job_data, resume_path, company_dir = prepare_job(
+            job_id, job_link, upload_path, model, temperature, api_key
+        )
+    except Exception as e:
+        logging.error(f"Error preparing job {job_id}: {e}")
+        # The upload is still parked if the job failed before filing it.
+        if os.path.exists(upload_path):
+            os.remove(upload_path)
+        report_progress(job_id, -1, "failed")
+        return None
+    return process_resume_job(
+        job_id, job_data, resume_path, company_dir, model, temperature, api_key
+    )
+
+
 def process_resume_job(
     job_id: str, 
     job_data: dict, 
@@ -72,10 +183,11 @@ def process_resume_job(
 ):
     """
     Background task that processes the resume with specified AI parameters.
+    Returns the path of the finished ZIP bundle, also stored as the job's
+    ``download``, or None if the job failed.
     """
     try:
-        progress_status[job_id] = 10
-        logging.info(f"Starting job {job_id} - Progress: 10%")
+        report_progress(job_id, 10, "rewriting resume")
         
         # Pass AI parameters to the processing functions
         formatted_resume_path = os.path.join(company_dir, "formatted_resume.docx")
@@ -89,11 +201,12 @@ def process_resume_job(
             temperature=temperature,
         )
             
-        progress_status[job_id] = 60
-        logging.info(f"Resume processed for job {job_id} - Progress: 60%")
+        report_progress(job_id, 60, "writing recommendations")
         
         # Extract resume text for further processing
         resume_text = extract_text_from_docx(resume_path)
+        if job_id in jobs_db:
+            jobs_db[job_id]["resume_text"] = resume_text
         
         # Generate recommendations
         recommendations_text = generate_recommendations(
@@ -108,8 +221,7 @@ def process_resume_job(
         recommendations_path = os.path.join(company_dir, "recommendations.txt")
         with open(recommendations_path, "w", encoding="utf-8") as f:
             f.write(recommendations_text)
-        progress_status[job_id] = 75
-        logging.info(f"Recommendations generated for job {job_id} - Progress: 75%")
+        report_progress(job_id, 75, "writing interview questions")
         
         # Generate interview questions
         company_name = job_data.get("company", "Unknown Company")
@@ -151,8 +263,7 @@ def process_resume_job(
             with open(questions_path, "w", encoding="utf-8") as f:
                 f.write("Interview questions could not be generated. Please try again later.")
         
-        progress_status[job_id] = 85
-        logging.info(f"Interview questions generated for job {job_id} - Progress: 85%")
+        report_progress(job_id, 85, "auditing ATS compatibility")
 
         # Audit what the rewrite actually did to machine readability.
         audit = write_ats_audit(
@@ -162,7 +273,7 @@ def process_resume_job(
             logging.info(
                 f"Job {job_id} ATS parse score: {audit['before']} -> {audit['after']}"
             )
-        progress_status[job_id] = 90
+        report_progress(job_id, 90, "bundling results")
 
         # Step 3: Bundle all outputs into a ZIP file
         job_title = sanitize_filename(job_data.get("job_title", "Job_Description"))[:50]
@@ -183,10 +294,14 @@ def process_resume_job(
 
         logging.info(f"ZIP file created: {zip_filepath} (exists: {os.path.exists(zip_filepath)})")
         
-        progress_status[job_id] = 100
-        logging.info(f"Job {job_id} completed - Progress: 100%")
+        # Recorded before "done" goes out, so a client reacting to it can
+        # download at once.
+        jobs_db.setdefault(job_id, {})["download"] = zip_filepath
+        report_progress(job_id, 100, "done")
+        return zip_filepath
         
     except Exception as e:
         logging.error(f"Error processing job {job_id}: {e}")
-        progress_status[job_id] = -1  # Indicate error
+        report_progress(job_id, -1, "failed")
+        return None
 
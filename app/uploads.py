@@ -0,0 +1,203 @@
+"""
+Receiving uploads without trusting them.
+
+Copying an upload wholesale with ``shutil.copyfileobj`` accepts a file of any
+size and only finds out it is not a resume when python-docx fails on it, after
+the bytes are on disk and a worker has been spent. Two layers stop that early:
+
+* ``BodyLimit`` is ASGI middleware that refuses a request whose
+  ``Content-Length`` is over the limit before a byte of the body is read, and
+  stops one that streams past the limit without a length, so neither is ever
+  buffered in full.
+* ``save_upload`` writes an upload to disk in chunks, checks the first bytes
+  are a zip local file header, enforces the per-file limit, hashes as it goes,
+  and finally reads the zip central directory to confirm the file is a Word
+  package of sane size. The SHA-256 it returns keys the audit cache.
+"""
+import hashlib
+import json
+import os
+import zipfile
+from collections import OrderedDict
+
+from starlette.concurrency import run_in_threadpool
+
+from app.state import MAX_UPLOAD_BYTES
+
+CHUNK_SIZE = 64 * 1024
+
+# Every .docx is a zip; every zip starts with a local file header.
+ZIP_MAGIC = b"PK\x03\x04"
+DOCX_PARTS = ("[Content_Types].xml", "word/document.xml")
+
+# A .docx is XML and images that compress a few times over, not hundreds.
+# Past these, the package is a decompression bomb, not a resume.
+MAX_PACKAGE_ENTRIES = 5000
+MAX_EXPANSION = 100
+
+
+class UploadRejected(Exception):
+    """An upload refused before scoring, with the HTTP status to answer with."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+
+
+def check_docx_package(path: str, size: int):
+    """Raise ``UploadRejected`` unless ``path`` is a plausible Word package."""
+    try:
+        with zipfile.ZipFile(path) as package:
+            entries = package.infolist()
+    except zipfile.BadZipFile:
+        raise UploadRejected(400, "The file is not a readable .docx (its zip directory is damaged).")
+    names = {entry.filename for entry in entries}
+    if not all(part in names for part in DOCX_PARTS):
+        raise UploadRejected(400, "The file is a zip archive but not a Word .docx document.")
+    expanded = sum(entry.file_size for entry in entries)
+    if len(entries) > MAX_PACKAGE_ENTRIES or expanded > MAX_EXPANSION * max(size, CHUNK_SIZE):
+        raise UploadRejected(413, "The .docx expands to far more than any resume needs.")
+
+
+async def save_upload(upload, path: str, max_bytes: int = MAX_UPLOAD_BYTES) -> str:
+    """Stream ``upload`` to ``path`` and return its SHA-256.
+
+    Raises ``UploadRejected`` as soon as the first chunk shows the file is not
+    a .docx or the running size passes ``max_bytes``; nothing is left on disk
+    for a rejected upload. Disk writes and the package check run in the
+    threadpool, so a slow disk does not hold up the event loop.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(path, "wb") as buffer:
+            while True:
+                chunk = await upload.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                if size == 0 and not chunk.startswith(ZIP_MAGIC):
+                    raise UploadRejected(
+                        400, "The file is not a .docx. Legacy .doc and PDF are not supported."
+                    )
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadRejected(
+                        413, f"The file is larger than the {max_bytes // (1024 * 1024)} MB limit."
+                    )
+                digest.update(chunk)
+                await run_in_threadpool(buffer.write, chunk)
+        if size == 0:
+            raise UploadRejected(400, "The file is empty.")
+        await run_in_threadpool(check_docx_package, path, size)
+    except BaseException:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        raise
+    return digest.hexdigest()
+
+
+class AuditCache:
+    """Recent scorecards by (upload hash, posting hash), least recently used out.
+
+    The same resume is audited again and again while someone edits other
+    parts of an application; identical bytes against an identical posting
+    need not be parsed twice.
+    """
+
+    def __init__(self, size: int = 256):
+        self.size = size
+        self._cards = OrderedDict()
+
+    def get(self, key):
+        card = self._cards.get(key)
+        if card is not None:
+            self._cards.move_to_end(key)
+        return card
+
+    def put(self, key, card):
+        self._cards[key] = card
+        self._cards.move_to_end(key)
+        while len(self._cards) > self.size:
+            self._cards.popitem(last=False)
+
+    def clear(self):
+        self._cards.clear()
+
+
+class BodyLimit:
+    """ASGI middleware refusing request bodies over a size limit with 413.
+
+    ``limits`` maps path prefixes to byte limits, longest prefix first wins;
+    other paths get ``default``. A declared ``Content-Length`` over the limit
+    is refused before the body is read. A body that streams past the limit is
+    cut off there, and whatever the app would have answered is replaced with
+    the 413.
+    """
+
+    def __init__(self, app, default: int = MAX_UPLOAD_BYTES, limits=None):
+        self.app = app
+        self.default = default
+        self.limits = sorted((limits or {}).items(), key=lambda item: -len(item[0]))
+
+    def limit_for(self, path: str) -> int:
+        for prefix, limit in self.limits:
+            if path.startswith(prefix):
+                return limit
+        return self.default
+
+    @staticmethod
+    async def _refuse(send, limit):
+        body = json.dumps({
+            "error": f"The upload is larger than the {limit // (1024 * 1024)} MB limit."
+        }).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                (b"connection", b"close"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("POST", "PUT", "PATCH"):
+            await self.app(scope, receive, send)
+            return
+
+        limit = self.limit_for(scope["path"])
+        declared = dict(scope["headers"]).get(b"content-length")
+        if declared is not None and declared.isdigit() and int(declared) > limit:
+            await self._refuse(send, limit)
+            return
+
+        received = 0
+        exceeded = False
+
+        async def limited_receive():
+            nonlocal received, exceeded
+            if exceeded:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    exceeded = True
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message):
+            if not exceeded:
+                await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not exceeded:
+                raise
+        if exceeded:
+            await self._refuse(send, limit)
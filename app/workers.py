@@ -0,0 +1,143 @@
+"""
+Running audits off the event loop.
+
+Scoring a resume is CPU-bound: python-docx parses the package, then the checks
+walk it. Done inside an ``async def`` route, that work holds the event loop, so
+every other request and every open websocket waits for it. ``AuditPool`` sends
+it to a pool of worker processes instead, each started with the scoring code
+already imported, and keeps the loop free to answer everyone else.
+
+The pool takes a bounded amount of work: one audit per worker running and a
+fixed number queued behind them. Past that it refuses with ``PoolBusy``
+straight away rather than queueing without limit. Otherwise latency under load
+grows until every client times out; refused early, the client learns how long
+to wait and can come back.
+"""
+import asyncio
+import collections
+import logging
+import math
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from app.state import AUDIT_QUEUE, AUDIT_WORKERS
+
+
+class PoolBusy(Exception):
+    """Raised when an audit would have to wait behind a full queue."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"All audit workers are busy; retry in {retry_after}s.")
+        self.retry_after = retry_after
+
+
+def _warm():
+    """Import the scoring code and score a fixture, so no request starts cold."""
+    from ats.fixtures import JOB_POSTING, build_clean
+    from ats.score import score_resume
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "warm.docx")
+        build_clean(path)
+        score_resume(path, JOB_POSTING)
+
+
+def _audit(path, job_description, profile_format=None):
+    """Score one resume in a worker; returns the scorecard and any profile bytes."""
+    from ats.score import score_resume
+
+    if not profile_format:
+        return score_resume(path, job_description), None
+
+    from ats.profiling import Profiler
+
+    with Profiler(profile_format) as profiler:
+        card = score_resume(path, job_description)
+    return card, profiler.output()
+
+
+class AuditPool:
+    """A process pool with a bounded queue in front of it.
+
+    The pool starts on first use, not at import, so importing the app (and
+    running its tests) does not start processes that nothing needs.
+    """
+
+    def __init__(self, workers=AUDIT_WORKERS, queue=AUDIT_QUEUE):
+        self.workers = max(1, workers)
+        self.capacity = self.workers + max(0, queue)
+        self.in_flight = 0
+        # A moving average of how long an audit takes from submission to
+        # result, used to tell refused clients when to come back.
+        self.latency = 1.0
+        self._executor = None
+        self._waiters = collections.deque()
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm)
+        return self._executor
+
+    def retry_after(self):
+        """Seconds until a slot is likely to be free, rounded up."""
+        return max(1, math.ceil(self.latency))
+
+    async def _admit(self, wait):
+        # Only the event loop thread touches in_flight, so no lock is needed.
+        while self.in_flight >= self.capacity:
+            if not wait:
+                raise PoolBusy(self.retry_after())
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+
+    def _release(self):
+        self.in_flight -= 1
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def run(self, func, *args, wait=False):
+        """Run ``func(*args)`` on a worker.
+
+        When the queue is full this raises ``PoolBusy``, or with ``wait``
+        waits for a slot; batch work waits, single requests are refused.
+        """
+        await self._admit(wait)
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+        except BrokenProcessPool:
+            # A worker died mid-audit (out of memory, usually). Start a fresh
+            # pool for the next request instead of failing every one after.
+            logging.error("Audit worker pool broke; restarting it")
+            self.shutdown(wait=False)
+            raise
+        finally:
+            self._release()
+            self.latency = 0.8 * self.latency + 0.2 * (time.perf_counter() - started)
+
+    async def audit(self, path, job_description=None, profile_format=None, wait=False):
+        """Score ``path``; returns ``(scorecard, profile bytes or None)``."""
+        return await self.run(_audit, path, job_description, profile_format, wait=wait)
+
+    def shutdown(self, wait=True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+# The app's one pool, shared by every route that scores documents.
+audit_pool = AuditPool()
@@ -3,17 +3,77 @@
     >>> from ats import score_resume
     >>> card = score_resume("resume.docx", job_description=posting)
     >>> card.parse_score, card.match_score
+
+Public names are imported on first use, so ``import ats`` (and ``ats
+--version``) does not load python-docx and lxml until something needs them.
 """
 
-from .checks import Finding, run_all
-from .extract import ExtractionReport, extract
-from .keywords import KeywordReport, match
-from .score import Scorecard, format_scorecard, score_report, score_resume
+from __future__ import annotations
+
+import importlib
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 __version__ = "1.1.0"
 
-__all__ = [
-    "ExtractionReport", "Finding", "KeywordReport", "Scorecard",
-    "extract", "format_scorecard", "match", "run_all",
-    "score_report", "score_resume",
-]
+# Public name -> submodule that defines it.
+_EXPORTS = {
+    "ExtractionReport": "extract",
+    "Finding": "checks",
+    "KeywordReport": "keywords",
+    "LiveSession": "live",
+    "MatrixRow": "matrix",
+    "PostingIndex": "keywords",
+    "Ranking": "rank",
+    "ScoreFailure": "batch",
+    "Scorecard": "score",
+    "extract": "extract",
+    "format_scorecard": "score",
+    "index_posting": "keywords",
+    "match": "keywords",
+    "rank_resumes": "rank",
+    "run_all": "checks",
+    "score_many": "batch",
+    "score_matrix": "matrix",
+    "score_report": "score",
+    "score_resume": "score",
+}
+
+__all__ = sorted(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .batch import ScoreFailure, score_many
+    from .checks import Finding, run_all
+    from .extract import ExtractionReport, extract
+    from .keywords import KeywordReport, PostingIndex, index_posting, match
+    from .live import LiveSession
+    from .matrix import MatrixRow, score_matrix
+    from .rank import Ranking, rank_resumes
+    from .score import Scorecard, format_scorecard, score_report, score_resume
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    # Cache it, so the next lookup is an ordinary attribute access.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+class _Package(ModuleType):
+    def __setattr__(self, name: str, value) -> None:
+        # Loading the submodule ``ats.extract`` binds it on the package under
+        # the same name as the ``extract`` function. Keep the function.
+        if isinstance(value, ModuleType) and _EXPORTS.get(name) == name:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
@@ -0,0 +1,260 @@
+"""Scoring many resumes against one posting.
+
+:func:`~ats.score.score_resume` is one document at a time, and a loop around it
+re-analyzes the same posting for every file and leaves every core but one idle.
+:func:`score_many` analyzes the posting once, hands the result to a pool of
+worker processes when the pool starts, and fans extraction and checks out
+across them. Scorecards come back in completion order, as soon as each is done.
+
+Work in flight is bounded. Paths are read lazily and only a fixed number of
+documents are queued at a time, so a run over a hundred thousand files holds a
+few dozen scorecards in memory, not a hundred thousand.
+
+:func:`expand_paths` turns what a person types (files, directories, globs, or
+``-`` for a list on stdin) into that lazy stream of paths, and :class:`Summary`
+tallies results as they go by without keeping them.
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+import sys
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar, Union
+
+from .keywords import PostingIndex, as_posting_index
+from .score import Scorecard, grade_for, score_resume
+
+
+@dataclass
+class ScoreFailure:
+    """A document that could not be scored, reported in place of its scorecard."""
+
+    path: str
+    error: str
+
+
+Result = Union[Scorecard, ScoreFailure]
+T = TypeVar("T")
+
+GLOB_CHARS = frozenset("*?[")
+
+
+def _docx_under(directory: Path) -> Iterator[str]:
+    # Word leaves "~$name.docx" lock files next to open documents; they are
+    # not resumes and never parse.
+    for path in sorted(directory.rglob("*.docx")):
+        if not path.name.startswith("~$") and path.is_file():
+            yield str(path)
+
+
+def expand_paths(inputs: Iterable[str], stdin: IO[str] | None = None) -> Iterator[str]:
+    """Yield every resume path named by ``inputs``, lazily and in order.
+
+    A directory contributes every ``.docx`` beneath it, a pattern containing
+    ``*``, ``?`` or ``[`` is globbed (``**`` recurses), and ``-`` reads one
+    path per line from ``stdin``. Anything else is passed through as a path,
+    so a missing file is reported when it is scored, not dropped silently.
+    """
+    for item in inputs:
+        if item == "-":
+            for line in stdin or sys.stdin:
+                line = line.strip()
+                if line:
+                    yield line
+        elif os.path.isdir(item):
+            yield from _docx_under(Path(item))
+        elif GLOB_CHARS.intersection(item):
+            for match in sorted(glob.iglob(item, recursive=True)):
+                if os.path.isdir(match):
+                    yield from _docx_under(Path(match))
+                else:
+                    yield match
+        else:
+            yield item
+
+
+@dataclass
+class Summary:
+    """Running totals over a stream of results."""
+
+    scored: int = 0
+    failed: int = 0
+    grades: Counter = field(default_factory=Counter)
+    parse_total: int = 0
+    match_total: int = 0
+    matched: int = 0
+    below: int = 0
+    min_score: Optional[int] = None
+    # (check, severity) -> findings raised, and resumes raising at least one.
+    findings: Counter = field(default_factory=Counter)
+    flagged: Counter = field(default_factory=Counter)
+
+    def add(self, result: Result) -> None:
+        if isinstance(result, ScoreFailure):
+            self.failed += 1
+            return
+        self.add_scores(
+            result.parse_score,
+            result.match_score if result.keywords is not None else None,
+            [(f.check, f.severity) for f in result.findings],
+        )
+
+    def add_scores(
+        self,
+        parse_score: int,
+        match_score: Optional[int] = None,
+        findings: Iterable[Tuple[str, str]] = (),
+    ) -> None:
+        """Count one scored resume from its numbers alone.
+
+        This is what :meth:`add` does with a scorecard, for callers that only
+        have the scores, such as one reading batch output back in.
+        """
+        self.scored += 1
+        self.grades[grade_for(parse_score)] += 1
+        self.parse_total += parse_score
+        if match_score is not None:
+            self.matched += 1
+            self.match_total += match_score
+        if self.min_score is not None and parse_score < self.min_score:
+            self.below += 1
+        findings = list(findings)
+        self.findings.update(findings)
+        self.flagged.update(set(findings))
+
+    @property
+    def total(self) -> int:
+        return self.scored + self.failed
+
+    def to_dict(self) -> Dict:
+        summary = {
+            "total": self.total,
+            "scored": self.scored,
+            "failed": self.failed,
+            "grades": {grade: self.grades[grade] for grade in sorted(self.grades)},
+            "mean_parse_score": (
+                round(self.parse_total / self.scored, 1) if self.scored else None
+            ),
+            "mean_match_score": (
+                round(self.match_total / self.matched, 1) if self.matched else None
+            ),
+            "findings": [
+                {"check": check, "severity": severity, "count": count,
+                 "resumes": self.flagged[check, severity]}
+                for (check, severity), count in sorted(
+                    self.findings.items(), key=lambda item: (-item[1], item[0])
+                )
+            ],
+        }
+        if self.min_score is not None:
+            summary["below_min_score"] = self.below
+        return summary
+
+
+# Set once per worker process by the pool initializer, so the posting crosses
+# the process boundary once per worker rather than once per document.
+_POSTING: Optional[PostingIndex] = None
+
+
+def _init_worker(posting: Optional[PostingIndex]) -> None:
+    global _POSTING
+    _POSTING = posting
+
+
+def _score_in_worker(path: str) -> Scorecard:
+    return score_resume(path, _POSTING)
+
+
+def _failure(path: str, exc: BaseException) -> ScoreFailure:
+    return ScoreFailure(path=path, error=f"{type(exc).__name__}: {exc}")
+
+
+def fan_out(
+    paths: Iterable[str | Path],
+    local: Callable[[str | Path], T],
+    remote: Callable[[str], T],
+    workers: int,
+    max_pending: int | None = None,
+    return_exceptions: bool = False,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple = (),
+) -> Iterator[Union[T, ScoreFailure]]:
+    """Run a per-document task over ``paths`` with bounded work in flight.
+
+    With one worker ``local`` is called in this process. Otherwise a pool is
+    started with ``initializer`` and ``remote``, which must be importable by
+    the workers, is called there with each path as a string. Results come back
+    in completion order; see :func:`score_many` for the other arguments.
+    """
+    if workers <= 1:
+        for path in paths:
+            try:
+                yield local(path)
+            except Exception as exc:  # noqa: BLE001
+                if not return_exceptions:
+                    raise
+                yield _failure(str(path), exc)
+        return
+
+    limit = max(max_pending or 2 * workers, 1)
+    pool = ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    )
+    pending: Dict[Future, str] = {}
+
+    def drain(block_until: int) -> Iterator[Union[T, ScoreFailure]]:
+        while len(pending) > block_until:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    yield future.result()
+                except Exception as exc:  # noqa: BLE001
+                    if not return_exceptions:
+                        raise
+                    yield _failure(path, exc)
+
+    try:
+        for path in paths:
+            pending[pool.submit(remote, str(path))] = str(path)
+            yield from drain(limit - 1)
+        yield from drain(0)
+    finally:
+        # Reached early when the caller stops iterating or a file raises.
+        # Queued work is abandoned rather than finished for nobody.
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+
+def score_many(
+    paths: Iterable[str | Path],
+    job_description: str | PostingIndex | None = None,
+    workers: int | None = None,
+    max_pending: int | None = None,
+    return_exceptions: bool = False,
+) -> Iterator[Result]:
+    """Score every path, yielding scorecards as they complete.
+
+    ``workers`` defaults to the CPU count; ``1`` scores in this process, which
+    is faster for a handful of files than starting a pool. ``max_pending``
+    caps how many documents are queued at once and defaults to twice the
+    worker count. With ``return_exceptions`` a file that fails to score
+    yields a :class:`ScoreFailure` instead of stopping the run.
+    """
+    posting = as_posting_index(job_description)
+    return fan_out(
+        paths,
+        local=lambda path: score_resume(path, posting),
+        remote=_score_in_worker,
+        workers=workers or os.cpu_count() or 1,
+        max_pending=max_pending,
+        return_exceptions=return_exceptions,
+        initializer=_init_worker,
+        initargs=(posting,),
+    )
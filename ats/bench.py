@@ -11,58 +11,74 @@ that are not there". A linter that cries wolf on a clean resume is worse than
 no linter, because people learn to ignore it.
 
 Everything is deterministic: fixtures are generated from code, checks have no
-randomness, and no network call is involved.
+randomness, and no network call is involved. :func:`run_corpus_benchmark` runs
+the same measurement over any number of seeded, generated resumes.
+
+:func:`run_perf` measures the other thing an optimization has to be judged on:
+how long each stage takes on the same fixtures, and how much memory it needs.
+Accuracy numbers are exact and belong in version control; timings depend on
+the machine, so they are only collected when asked for.
+
+:func:`compare_reports` diffs two saved reports metric by metric and says which
+moved past their :class:`Tolerances`, so a change that costs accuracy or makes
+scoring slower fails a gate instead of silently rewriting ``benchmark.json``.
 """
 
 from __future__ import annotations
 
 import json
+import math
+import platform
 import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Sequence
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
-from .fixtures import JOB_POSTING, build_all
-from .score import score_resume
+from .batch import score_many
+from .checks import run_all
+from .extract import extract
+from .fixtures import (
+    JOB_POSTING,
+    STRESS,
+    CorpusSpec,
+    build_all,
+    build_stress,
+    generate_corpus,
+)
+from .keywords import match
+from .score import Scorecard, score_resume
 
+#: Stages timed by :func:`run_perf`, in pipeline order. ``score`` is the whole
+#: pipeline end to end, so it is slightly more than the sum of the others.
+PERF_STAGES = ("extract", "checks", "keywords", "score")
 
-def run_benchmark(directory: str | Path | None = None) -> Dict:
-    """Build the corpus, audit every fixture, and score the detector."""
-    with tempfile.TemporaryDirectory() as tmp:
-        target = Path(directory) if directory else Path(tmp)
-        expected = build_all(target)
 
-        cases: List[Dict] = []
-        true_positives = false_positives = false_negatives = 0
-
-        for name, planted in expected.items():
-            card = score_resume(target / f"{name}.docx", JOB_POSTING)
-            fired = sorted({f.check for f in card.findings})
-
-            # A fixture is built to contain specific defects. Anything else the
-            # detector reports on it is counted against precision, which is
-            # strict on purpose: the "clean" fixture must fire nothing at all.
-            hits = [c for c in planted if c in fired]
-            spurious = [c for c in fired if c not in planted]
-            missed = [c for c in planted if c not in fired]
-
-            true_positives += len(hits)
-            false_positives += len(spurious)
-            false_negatives += len(missed)
-
-            cases.append(
-                {
-                    "fixture": name,
-                    "planted": planted,
-                    "fired": fired,
-                    "missed": missed,
-                    "spurious": spurious,
-                    "parse_score": card.parse_score,
-                    "grade": card.grade,
-                    "match_score": card.match_score,
-                    "critical": len(card.critical),
-                    "warnings": len(card.warnings),
-                }
-            )
+def _case(name: str, planted: List[str], card: Scorecard) -> Dict:
+    """Compare one scorecard against the defects its document was built with."""
+    fired = sorted({f.check for f in card.findings})
+    # A fixture is built to contain specific defects. Anything else the
+    # detector reports on it is counted against precision, which is strict on
+    # purpose: the "clean" fixture must fire nothing at all.
+    return {
+        "fixture": name,
+        "planted": planted,
+        "fired": fired,
+        "missed": [c for c in planted if c not in fired],
+        "spurious": [c for c in fired if c not in planted],
+        "parse_score": card.parse_score,
+        "grade": card.grade,
+        "match_score": card.match_score,
+        "critical": len(card.critical),
+        "warnings": len(card.warnings),
+    }
+
+
+def _totals(cases: Sequence[Dict]) -> Dict:
+    false_positives = sum(len(c["spurious"]) for c in cases)
+    false_negatives = sum(len(c["missed"]) for c in cases)
+    true_positives = sum(len(c["planted"]) for c in cases) - false_negatives
 
     precision = (
         true_positives / (true_positives + false_positives)
@@ -73,34 +89,234 @@ def run_benchmark(directory: str | Path | None = None) -> Dict:
         if (true_positives + false_negatives) else 1.0
     )
     f1 = 2 * precision * recall / (precision + recall) if (precision + recall) else 0.0
+    return {
+        "true_positives": true_positives,
+        "false_positives": false_positives,
+        "false_negatives": false_negatives,
+        "precision": round(precision, 4),
+        "recall": round(recall, 4),
+        "f1": round(f1, 4),
+    }
+
+
+def _mean_parse(cases: Sequence[Dict]) -> float:
+    return round(sum(c["parse_score"] for c in cases) / len(cases), 1) if cases else 0.0
+
+
+def run_benchmark(directory: str | Path | None = None) -> Dict:
+    """Build the corpus, audit every fixture, and score the detector."""
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(directory) if directory else Path(tmp)
+        expected = build_all(target)
+        cases = [
+            _case(name, planted, score_resume(target / f"{name}.docx", JOB_POSTING))
+            for name, planted in expected.items()
+        ]
 
     clean = next(c for c in cases if c["fixture"] == "clean")
     defective = [c for c in cases if c["fixture"] != "clean"]
 
     return {
         "cases": sorted(cases, key=lambda c: c["fixture"]),
-        "totals": {
-            "true_positives": true_positives,
-            "false_positives": false_positives,
-            "false_negatives": false_negatives,
-            "precision": round(precision, 4),
-            "recall": round(recall, 4),
-            "f1": round(f1, 4),
-        },
+        "totals": _totals(cases),
         "separation": {
             # The number that matters in practice: a clean resume has to score
             # clearly above the broken ones, not merely one point above.
             "clean_parse_score": clean["parse_score"],
             "worst_defective_parse_score": min(c["parse_score"] for c in defective),
-            "mean_defective_parse_score": round(
-                sum(c["parse_score"] for c in defective) / len(defective), 1
-            ),
-            "gap": clean["parse_score"]
-            - round(sum(c["parse_score"] for c in defective) / len(defective), 1),
+            "mean_defective_parse_score": _mean_parse(defective),
+            "gap": clean["parse_score"] - _mean_parse(defective),
         },
     }
 
 
+def run_corpus_benchmark(
+    count: int = 200,
+    seed: int = 0,
+    spec: CorpusSpec | None = None,
+    directory: str | Path | None = None,
+    workers: int | None = None,
+) -> Dict:
+    """Generate a seeded corpus and score the detector against its manifest.
+
+    Only the documents the detector got wrong are listed case by case; at ten
+    thousand documents the rest is a number, not a table.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(directory) if directory else Path(tmp)
+        expected = generate_corpus(target, count, seed=seed, spec=spec)
+        paths = [target / f"{name}.docx" for name in expected]
+        cases = [
+            _case(Path(card.path).stem, expected[Path(card.path).stem], card)
+            for card in score_many(paths, JOB_POSTING, workers=workers)
+        ]
+
+    cases.sort(key=lambda c: c["fixture"])
+    clean = [c for c in cases if not c["planted"]]
+    defective = [c for c in cases if c["planted"]]
+    return {
+        "seed": seed,
+        "count": count,
+        "totals": _totals(cases),
+        "separation": {
+            "clean_documents": len(clean),
+            "mean_clean_parse_score": _mean_parse(clean),
+            "mean_defective_parse_score": _mean_parse(defective),
+            "gap": round(_mean_parse(clean) - _mean_parse(defective), 1),
+        },
+        "errors": [c for c in cases if c["missed"] or c["spurious"]],
+    }
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """The ``q``-th percentile, interpolating between the nearest ranks."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * q / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _latency(samples: Sequence[float]) -> Dict[str, float]:
+    """Seconds in, milliseconds out, rounded for a diffable report."""
+    return {
+        "p50_ms": round(1000 * percentile(samples, 50), 3),
+        "p95_ms": round(1000 * percentile(samples, 95), 3),
+        "p99_ms": round(1000 * percentile(samples, 99), 3),
+        "mean_ms": round(1000 * sum(samples) / len(samples), 3) if samples else 0.0,
+    }
+
+
+def _time(func: Callable[[], object], repeat: int) -> List[float]:
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _peak_memory(func: Callable[[], object]) -> int:
+    """Peak bytes Python allocated while ``func`` ran."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_perf(repeat: int = 20, directory: str | Path | None = None) -> Dict:
+    """Time every pipeline stage on every fixture, ``repeat`` times each.
+
+    Memory is measured in a separate pass, because tracing allocations slows
+    the code under it and would distort the timings.
+    """
+    repeat = max(1, repeat)
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(directory) if directory else Path(tmp)
+        names = list(build_all(target))
+
+        fixtures: Dict[str, Dict] = {}
+        all_scores: List[float] = []
+        for name in names:
+            path = target / f"{name}.docx"
+            report = extract(path)
+            score_resume(path, JOB_POSTING)  # warm caches before timing
+
+            timings = {
+                "extract": _time(lambda: extract(path), repeat),
+                "checks": _time(lambda: run_all(report), repeat),
+                "keywords": _time(lambda: match(report.ats_text, JOB_POSTING), repeat),
+                "score": _time(lambda: score_resume(path, JOB_POSTING), repeat),
+            }
+            all_scores.extend(timings["score"])
+            fixtures[name] = {stage: _latency(timings[stage]) for stage in PERF_STAGES}
+            fixtures[name]["peak_kib"] = round(
+                _peak_memory(lambda: score_resume(path, JOB_POSTING)) / 1024, 1
+            )
+
+    total = sum(all_scores)
+    return {
+        "repeat": repeat,
+        "python": platform.python_version(),
+        "fixtures": dict(sorted(fixtures.items())),
+        "overall": {
+            "score": _latency(all_scores),
+            "throughput_docs_per_sec": round(len(all_scores) / total, 1) if total else 0.0,
+            "peak_kib": max(f["peak_kib"] for f in fixtures.values()),
+        },
+    }
+
+
+def run_stress(directory: str | Path | None = None) -> Dict:
+    """Score every stress document once, against its time and memory budget."""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = build_stress(Path(directory) if directory else Path(tmp))
+        cases: Dict[str, Dict] = {}
+        for name, path in paths.items():
+            budget = STRESS[name]
+            start = time.perf_counter()
+            score_resume(path, JOB_POSTING)
+            seconds = time.perf_counter() - start
+            peak_mib = _peak_memory(lambda: score_resume(path, JOB_POSTING)) / 2**20
+            cases[name] = {
+                "size_kib": round(path.stat().st_size / 1024, 1),
+                "seconds": round(seconds, 3),
+                "peak_mib": round(peak_mib, 1),
+                "budget_seconds": budget.seconds,
+                "budget_mib": budget.peak_mib,
+                "within_budget": seconds <= budget.seconds and peak_mib <= budget.peak_mib,
+            }
+    return {
+        "cases": cases,
+        "within_budget": all(c["within_budget"] for c in cases.values()),
+    }
+
+
+def format_stress(stress: Dict) -> str:
+    """Render stress results as a Markdown table."""
+    lines = [
+        "| document | size KiB | seconds | budget | peak MiB | budget | ok |",
+        "| --- | ---: | ---: | ---: | ---: | ---: | :---: |",
+    ]
+    for name, case in stress["cases"].items():
+        lines.append(
+            f"| {name} | {case['size_kib']:.0f} | {case['seconds']:.2f} | "
+            f"{case['budget_seconds']:g} | {case['peak_mib']:.1f} | {case['budget_mib']:g} | "
+            f"{'yes' if case['within_budget'] else 'NO'} |"
+        )
+    return "\n".join(lines)
+
+
+def format_perf(perf: Dict) -> str:
+    """Render performance results as a Markdown table."""
+    lines = [
+        "| fixture | extract p50 | checks p50 | keywords p50 "
+        "| score p50 | score p95 | score p99 | peak KiB |",
+        "| --- | ---: | ---: | ---: | ---: | ---: | ---: | ---: |",
+    ]
+    for name, stages in perf["fixtures"].items():
+        lines.append(
+            f"| {name} | {stages['extract']['p50_ms']:.2f} | "
+            f"{stages['checks']['p50_ms']:.3f} | {stages['keywords']['p50_ms']:.2f} | "
+            f"{stages['score']['p50_ms']:.2f} | {stages['score']['p95_ms']:.2f} | "
+            f"{stages['score']['p99_ms']:.2f} | {stages['peak_kib']:.0f} |"
+        )
+    overall = perf["overall"]
+    lines += [
+        "",
+        f"Full scoring over {perf['repeat']} runs per fixture: "
+        f"p50 {overall['score']['p50_ms']:.2f} ms, p95 {overall['score']['p95_ms']:.2f} ms, "
+        f"p99 {overall['score']['p99_ms']:.2f} ms, "
+        f"{overall['throughput_docs_per_sec']:.1f} docs/sec, "
+        f"peak {overall['peak_kib']:.0f} KiB (Python {perf['python']}).",
+    ]
+    return "\n".join(lines)
+
+
 def format_report(report: Dict) -> str:
     """Render the benchmark as a Markdown table."""
     lines = [
@@ -131,17 +347,204 @@ def format_report(report: Dict) -> str:
     return "\n".join(lines)
 
 
+def format_corpus_report(report: Dict) -> str:
+    """Render a generated-corpus benchmark as a summary and a list of misses."""
+    totals = report["totals"]
+    sep = report["separation"]
+    lines = [
+        f"Generated corpus: {report['count']} documents, seed {report['seed']}.",
+        f"Precision {totals['precision']:.4f}, recall {totals['recall']:.4f}, "
+        f"F1 {totals['f1']:.4f} "
+        f"({totals['true_positives']} TP, {totals['false_positives']} FP, "
+        f"{totals['false_negatives']} FN).",
+        f"{sep['clean_documents']} clean documents average "
+        f"{sep['mean_clean_parse_score']}; defective ones average "
+        f"{sep['mean_defective_parse_score']}, a {sep['gap']:.1f} point gap.",
+    ]
+    for case in report["errors"]:
+        lines.append(
+            f"  {case['fixture']}: missed {', '.join(case['missed']) or '-'}; "
+            f"spurious {', '.join(case['spurious']) or '-'}"
+        )
+    return "\n".join(lines)
+
+
+@dataclass
+class Tolerances:
+    """How far a metric may move the wrong way before it counts as a regression.
+
+    Accuracy tolerances are absolute (a precision of 1.0 may fall to
+    ``1.0 - accuracy``); ``gap`` is in parse-score points. Performance
+    tolerances are relative, since timings only compare on the same machine,
+    and a latency increase smaller than ``latency_floor_ms`` is never a
+    regression, so sub-millisecond jitter cannot fail a build.
+    """
+
+    accuracy: float = 0.0
+    gap: float = 1.0
+    latency: float = 0.10
+    latency_floor_ms: float = 0.5
+    throughput: float = 0.10
+    memory: float = 0.10
+
+
+# (metric name, path into the report, kind). The kind decides the direction
+# that counts as worse and which tolerance applies.
+_ACCURACY_METRICS: Tuple[Tuple[str, Tuple[str, ...], str], ...] = (
+    ("precision", ("totals", "precision"), "accuracy"),
+    ("recall", ("totals", "recall"), "accuracy"),
+    ("f1", ("totals", "f1"), "accuracy"),
+    ("separation gap", ("separation", "gap"), "gap"),
+    ("corpus precision", ("corpus", "totals", "precision"), "accuracy"),
+    ("corpus recall", ("corpus", "totals", "recall"), "accuracy"),
+    ("corpus gap", ("corpus", "separation", "gap"), "gap"),
+)
+
+
+def _lookup(report: Dict, path: Sequence[str]) -> Optional[float]:
+    node = report
+    for key in path:
+        if not isinstance(node, dict) or key not in node:
+            return None
+        node = node[key]
+    return node
+
+
+def _perf_metrics(report: Dict) -> Iterator[Tuple[str, Tuple[str, ...], str]]:
+    overall = ("perf", "overall")
+    for q in ("p50_ms", "p95_ms", "p99_ms"):
+        yield (f"score {q[:-3]}", overall + ("score", q), "latency")
+    yield ("throughput", overall + ("throughput_docs_per_sec",), "throughput")
+    yield ("peak memory", overall + ("peak_kib",), "memory")
+    for name in sorted(_lookup(report, ("perf", "fixtures")) or {}):
+        fixture = ("perf", "fixtures", name)
+        for q in ("p50_ms", "p95_ms"):
+            yield (f"{name} score {q[:-3]}", fixture + ("score", q), "latency")
+        yield (f"{name} peak memory", fixture + ("peak_kib",), "memory")
+
+
+def _verdict(kind: str, old: float, new: float, tol: Tolerances) -> str:
+    if new == old:
+        return "ok"
+    if kind in ("accuracy", "gap"):
+        worse, limit = new < old, (tol.accuracy if kind == "accuracy" else tol.gap)
+        beyond = old - new > limit + 1e-9
+    elif kind == "throughput":
+        worse = new < old
+        beyond = new < old * (1 - tol.throughput)
+    elif kind == "latency":
+        worse = new > old
+        beyond = new > old * (1 + tol.latency) and new - old > tol.latency_floor_ms
+    else:  # memory
+        worse = new > old
+        beyond = new > old * (1 + tol.memory)
+    if not worse:
+        return "improved"
+    return "regressed" if beyond else "ok"
+
+
+def compare_reports(old: Dict, new: Dict, tolerances: Tolerances | None = None) -> Dict:
+    """Diff two benchmark reports, marking every metric ok, improved or regressed.
+
+    A metric present in only one report is listed as ``missing`` and never
+    fails the comparison: timing one run and not the other is a choice, not a
+    regression.
+    """
+    tol = tolerances or Tolerances()
+    metrics: List[Dict] = []
+    seen = set()
+    for report in (old, new):
+        for name, path, kind in (*_ACCURACY_METRICS, *_perf_metrics(report)):
+            if name in seen:
+                continue
+            seen.add(name)
+            before, after = _lookup(old, path), _lookup(new, path)
+            if before is None and after is None:
+                continue
+            if before is None or after is None:
+                status = "missing"
+                delta = None
+            else:
+                status = _verdict(kind, before, after, tol)
+                delta = round(after - before, 4)
+            metrics.append({
+                "metric": name,
+                "kind": kind,
+                "old": before,
+                "new": after,
+                "delta": delta,
+                "change": (
+                    round(delta / before, 4) if delta is not None and before else None
+                ),
+                "status": status,
+            })
+    regressions = [m["metric"] for m in metrics if m["status"] == "regressed"]
+    return {
+        "ok": not regressions,
+        "regressions": regressions,
+        "tolerances": tol.__dict__.copy(),
+        "metrics": metrics,
+    }
+
+
+def format_comparison(comparison: Dict) -> str:
+    """Render a report comparison as a Markdown table and a verdict."""
+    lines = [
+        "| metric | old | new | change | status |",
+        "| --- | ---: | ---: | ---: | :---: |",
+    ]
+    for m in comparison["metrics"]:
+        if m["change"] is not None and m["kind"] not in ("accuracy", "gap"):
+            change = f"{m['change']:+.1%}"
+        elif m["delta"] is not None:
+            change = f"{m['delta']:+g}"
+        else:
+            change = "-"
+        old = "-" if m["old"] is None else f"{m['old']:g}"
+        new = "-" if m["new"] is None else f"{m['new']:g}"
+        status = m["status"].upper() if m["status"] == "regressed" else m["status"]
+        lines.append(f"| {m['metric']} | {old} | {new} | {change} | {status} |")
+    lines.append("")
+    if comparison["ok"]:
+        lines.append("No regressions.")
+    else:
+        lines.append(
+            f"{len(comparison['regressions'])} regression(s): "
+            + ", ".join(comparison["regressions"])
+        )
+    return "\n".join(lines)
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     import argparse
 
     parser = argparse.ArgumentParser(description="Benchmark the ATS defect detector.")
     parser.add_argument("--json", default="benchmark.json")
+    parser.add_argument("--perf", action="store_true", help="also time every stage")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per fixture")
+    parser.add_argument("--corpus", type=int, default=0, help="also score N generated resumes")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the generated corpus")
+    parser.add_argument("--stress", action="store_true", help="also run the stress documents")
     args = parser.parse_args(argv)
 
     report = run_benchmark()
     print(format_report(report))
+    if args.corpus:
+        report["corpus"] = run_corpus_benchmark(args.corpus, seed=args.seed)
+        print()
+        print(format_corpus_report(report["corpus"]))
+    if args.stress:
+        report["stress"] = run_stress()
+        print()
+        print(format_stress(report["stress"]))
+    if args.perf:
+        report["perf"] = run_perf(repeat=args.repeat)
+        print()
+        print(format_perf(report["perf"]))
     Path(args.json).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
     print(f"\nWrote {args.json}")
+    if args.stress and not report["stress"]["within_budget"]:
+        return 1
     return 0
 
 
@@ -5,24 +5,38 @@ need OpenAI; deciding whether a resume parses does not, and pretending
 otherwise would put a paywall in front of the part that is just arithmetic.
 
     ats score resume.docx --job posting.txt
+    ats score resumes/ 'archive/**/*.docx' --jobs 8 --job posting.txt > scores.ndjson
+    ats score corpus/ --shard 2/8 > shard-2.ndjson   # on each of 8 machines
+    ats merge shard-*.ndjson
+    ats score slow.docx --profile slow.folded --profile-format collapsed
+    ats rank applicants/ --job posting.txt --top 20
+    ats matrix postings/ applicants/ --format csv -o fit.csv
     ats extract resume.docx --show-dropped
     ats compare before.docx after.docx --job posting.txt
+    ats history --db history.db --path resume.docx
+    ats watch drafts/ --job posting.txt
+    ats bench compare benchmark.json new.json
+    ats serve --socket /tmp/ats.sock &   # later calls reuse its warm workers
     ats fixtures /tmp/corpus
+    ats fixtures /tmp/corpus --generate 10000 --seed 7
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
+import time
 from pathlib import Path
 from typing import Sequence
 
-from docx.opc.exceptions import PackageNotFoundError
-
+# Only light modules are imported here. python-docx and lxml are loaded by the
+# commands that need them, so --help, --version and a call forwarded to a
+# running daemon never pay for them.
 from . import __version__
-from .extract import extract
-from .score import format_scorecard, score_resume
+from .daemon import SOCKET_ENV, forward
+from .history import HISTORY_ENV, HistoryStore, text_digest
 
 
 def _read_job(args: argparse.Namespace) -> str | None:
@@ -30,13 +44,41 @@ def _read_job(args: argparse.Namespace) -> str | None:
     if not getattr(args, "job", None):
         return None
     candidate = Path(args.job)
-    if candidate.exists():
+    try:
+        is_file = candidate.is_file()
+    except OSError:  # pasted posting text longer than a file name may be
+        is_file = False
+    if is_file:
         return candidate.read_text(encoding="utf-8", errors="replace")
     return args.job
 
 
-def cmd_score(args: argparse.Namespace) -> int:
-    card = score_resume(args.resume, _read_job(args))
+def _history_db(args: argparse.Namespace) -> str | None:
+    """The history database from --history/--db, falling back to $ATS_HISTORY."""
+    return (
+        getattr(args, "history", None) or getattr(args, "db", None)
+        or os.environ.get(HISTORY_ENV) or None
+    )
+
+
+def _is_batch(inputs: Sequence[str], shard: str | None = None) -> bool:
+    """More than one input, or one that names many files, means batch output."""
+    from .batch import GLOB_CHARS
+
+    return bool(shard) or len(inputs) > 1 or any(
+        item == "-" or os.path.isdir(item) or GLOB_CHARS.intersection(item)
+        for item in inputs
+    )
+
+
+def _score_one(args: argparse.Namespace, job: str | None) -> int:
+    from .score import format_scorecard, score_resume
+
+    card = score_resume(args.resume[0], job)
+    history = _history_db(args)
+    if history:
+        with HistoryStore(history) as store:
+            store.record(card, posting=job)
     if args.json:
         print(json.dumps(card.to_dict(), indent=2))
     else:
@@ -52,7 +94,123 @@ def cmd_score(args: argparse.Namespace) -> int:
     return 0
 
 
+def _score_batch(args: argparse.Namespace, job: str | None) -> int:
+    """Stream one JSON line per resume as it finishes, then a summary line.
+
+    A file that cannot be scored gets an ``{"path", "error"}`` line rather
+    than ending the run. The exit status is non-zero if any file failed or
+    fell below ``--min-score``.
+    """
+    from .batch import ScoreFailure, Summary, expand_paths, score_many
+    from .serialize import to_json
+    from .shard import parse_shard, select_shard
+
+    paths = expand_paths(args.resume)
+    shard = None
+    if args.shard:
+        index, count = parse_shard(args.shard)
+        paths = select_shard(paths, index, count, by=args.shard_by)
+        shard = {"index": index, "count": count, "by": args.shard_by}
+
+    summary = Summary(min_score=args.min_score)
+    history = _history_db(args)
+    store = HistoryStore(history) if history else None
+    try:
+        for result in score_many(paths, job, workers=args.jobs, return_exceptions=True):
+            summary.add(result)
+            if isinstance(result, ScoreFailure):
+                line = json.dumps({"path": result.path, "error": result.error})
+            else:
+                line = to_json(result, compact=args.compact).decode("utf-8")
+                if store is not None:
+                    store.record(result, posting=job)
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+    finally:
+        if store is not None:
+            store.close()
+    totals = summary.to_dict()
+    if shard:
+        totals["shard"] = shard
+    print(json.dumps({"summary": totals}))
+    return 1 if summary.failed or summary.below else 0
+
+
+def cmd_score(args: argparse.Namespace) -> int:
+    job = _read_job(args)
+    run = _score_batch if _is_batch(args.resume, args.shard) else _score_one
+    if not args.profile:
+        return run(args, job)
+
+    from .profiling import Profiler
+
+    with Profiler(args.profile_format) as profiler:
+        status = run(args, job)
+    profiler.save(args.profile)
+    print(f"Wrote {args.profile_format} profile to {args.profile}", file=sys.stderr)
+    return status
+
+
+def cmd_merge(args: argparse.Namespace) -> int:
+    """Combine the NDJSON of several sharded runs into one summary line."""
+    from .shard import merge_outputs
+
+    streams = []
+    try:
+        for name in args.outputs:
+            streams.append(
+                sys.stdin if name == "-" else open(name, encoding="utf-8")
+            )
+        summary = merge_outputs(streams, min_score=args.min_score)
+    finally:
+        for stream in streams:
+            if stream is not sys.stdin:
+                stream.close()
+    print(json.dumps({"summary": summary}))
+    return 1 if summary["failed"] or summary.get("below_min_score") else 0
+
+
+def cmd_rank(args: argparse.Namespace) -> int:
+    """Score a pile of resumes against one posting and print the best few."""
+    from .batch import expand_paths
+    from .rank import format_ranking, rank_resumes
+
+    ranking = rank_resumes(
+        expand_paths(args.resume), _read_job(args), k=args.top, workers=args.jobs
+    )
+    if args.json:
+        print(json.dumps(ranking.to_dict(), indent=2))
+    else:
+        print(format_ranking(ranking))
+    return 0
+
+
+def cmd_matrix(args: argparse.Namespace) -> int:
+    """Score every resume against every posting and write the matrix."""
+    from .batch import expand_paths
+    from .matrix import load_postings, score_matrix, write_matrix
+
+    postings = load_postings([args.postings])
+    rows = score_matrix(
+        expand_paths(args.resume), postings, workers=args.jobs, return_exceptions=True
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as stream:
+            scored, failed = write_matrix(rows, list(postings), stream, args.format)
+        print(
+            f"Wrote {scored} resume(s) x {len(postings)} posting(s) to {args.output}",
+            file=sys.stderr,
+        )
+    else:
+        scored, failed = write_matrix(rows, list(postings), sys.stdout, args.format)
+    if failed:
+        print(f"{failed} file(s) could not be scored", file=sys.stderr)
+    return 1 if failed else 0
+
+
 def cmd_extract(args: argparse.Namespace) -> int:
+    from .extract import extract
+
     report = extract(args.resume)
     print(f"Parsed {len(report.ats_text.split())} words "
           f"from {report.body_paragraphs} paragraphs and {report.table_count} tables")
@@ -72,29 +230,116 @@ def cmd_extract(args: argparse.Namespace) -> int:
 
 def cmd_compare(args: argparse.Namespace) -> int:
     """Score two resumes and report the delta, for before-and-after checks."""
-    job = _read_job(args)
-    before = score_resume(args.before, job)
-    after = score_resume(args.after, job)
+    from .compare import compare_resumes
 
-    print(f"{'':22} {'before':>8} {'after':>8} {'delta':>8}")
-    rows = [("parse score", before.parse_score, after.parse_score)]
-    if job:
-        rows.append(("match score", before.match_score, after.match_score))
-    rows.append(("critical findings", len(before.critical), len(after.critical)))
-    rows.append(("warnings", len(before.warnings), len(after.warnings)))
+    comparison = compare_resumes(args.before, args.after, _read_job(args))
 
-    for label, old, new in rows:
+    print(f"{'':22} {'before':>8} {'after':>8} {'delta':>8}")
+    for label, old, new in comparison.rows():
         delta = new - old
         print(f"{label:22} {old:>8} {new:>8} {delta:>+8}")
 
+    for heading, findings in (
+        ("Fixed", comparison.removed), ("Introduced", comparison.added),
+    ):
+        if findings:
+            print(f"\n{heading}:")
+            for finding in findings:
+                print(f"  {finding}")
+
     if args.json:
-        print(json.dumps({"before": before.to_dict(), "after": after.to_dict()}, indent=2))
+        print(json.dumps(comparison.to_dict(), indent=2))
+    return 0
+
+
+def cmd_history(args: argparse.Namespace) -> int:
+    """Show score trends or finding frequency from the history database."""
+    db = _history_db(args)
+    if not db:
+        raise ValueError(f"no history database; pass --db or set {HISTORY_ENV}")
+    if not Path(db).exists():
+        raise ValueError(f"{db} does not exist")
+
+    job = _read_job(args)
+    filters = {
+        "content_hash": args.hash,
+        "posting_hash": text_digest(job) if job else None,
+        "path": args.path,
+        "since": time.time() - args.days * 86400 if args.days else None,
+    }
+    with HistoryStore(db) as store:
+        if args.findings:
+            rows = store.finding_frequency(**filters)
+            audits = len(store.trend(**filters))
+            if args.json:
+                print(json.dumps({
+                    "audits": audits,
+                    "findings": [
+                        {"check": c, "severity": sev, "count": n, "audits": a}
+                        for c, sev, n, a in rows
+                    ],
+                }, indent=2))
+                return 0
+            print(f"{audits} audit(s)")
+            print(f"{'check':22} {'severity':9} {'findings':>8} {'audits':>7} {'share':>6}")
+            for check, severity, count, hit in rows:
+                share = hit / audits if audits else 0.0
+                print(f"{check:22} {severity:9} {count:>8} {hit:>7} {share:>6.0%}")
+            return 0
+
+        entries = store.trend(**filters, limit=args.limit)
+        if args.json:
+            print(json.dumps([e.to_dict() for e in entries], indent=2))
+            return 0
+        if not entries:
+            print("No recorded audits match.")
+            return 0
+        previous = None
+        for entry in entries:
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.recorded_at))
+            match = "  -" if entry.match_score is None else f"{entry.match_score:>3}"
+            delta = (
+                f"{entry.parse_score - previous:>+4}" if previous is not None else "    "
+            )
+            print(
+                f"{when}  parse {entry.parse_score:>3} ({entry.grade}) {delta}  "
+                f"match {match}  {entry.content_hash[:12]}  {entry.path}"
+            )
+            previous = entry.parse_score
+    return 0
+
+
+def cmd_watch(args: argparse.Namespace) -> int:
+    """Score a folder, then rescore each resume as it is saved, until Ctrl-C."""
+    from .watch import Watcher, format_event
+
+    if not os.path.isdir(args.directory):
+        raise ValueError(f"{args.directory} is not a directory")
+    watcher = Watcher(
+        args.directory, _read_job(args), debounce=args.debounce, poll_interval=args.interval,
+    )
+
+    def emit(event: dict) -> None:
+        print(json.dumps(event) if args.json else format_event(event), flush=True)
+
+    try:
+        watcher.run(emit, use_inotify=not args.poll)
+    except KeyboardInterrupt:
+        pass
     return 0
 
 
 def cmd_fixtures(args: argparse.Namespace) -> int:
-    from .fixtures import build_all
+    from .fixtures import MANIFEST, build_all, generate_corpus
 
+    if args.generate:
+        expected = generate_corpus(args.directory, args.generate, seed=args.seed)
+        planted = sum(1 for defects in expected.values() if defects)
+        print(
+            f"Wrote {len(expected)} generated resumes ({planted} with planted defects) "
+            f"to {args.directory}; expected defects are in {MANIFEST}"
+        )
+        return 0
     expected = build_all(args.directory)
     print(f"Wrote {len(expected)} fixtures to {args.directory}")
     for name, defects in expected.items():
@@ -103,16 +348,69 @@ def cmd_fixtures(args: argparse.Namespace) -> int:
 
 
 def cmd_bench(args: argparse.Namespace) -> int:
-    from .bench import format_report, run_benchmark
+    from .bench import (
+        format_corpus_report,
+        format_perf,
+        format_report,
+        format_stress,
+        run_benchmark,
+        run_corpus_benchmark,
+        run_perf,
+        run_stress,
+    )
 
     report = run_benchmark()
     print(format_report(report))
+    if args.corpus:
+        report["corpus"] = run_corpus_benchmark(args.corpus, seed=args.seed)
+        print()
+        print(format_corpus_report(report["corpus"]))
+    if args.stress:
+        report["stress"] = run_stress()
+        print()
+        print(format_stress(report["stress"]))
+    if args.perf:
+        report["perf"] = run_perf(repeat=args.repeat)
+        print()
+        print(format_perf(report["perf"]))
     if args.json:
         Path(args.json).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
         print(f"\nWrote {args.json}")
+    if args.stress and not report["stress"]["within_budget"]:
+        return 1
     return 0
 
 
+def cmd_bench_compare(args: argparse.Namespace) -> int:
+    """Diff two saved benchmark reports and fail on a regression."""
+    from .bench import Tolerances, compare_reports, format_comparison
+
+    old, new = (
+        json.loads(Path(path).read_text(encoding="utf-8")) for path in (args.old, args.new)
+    )
+    given = {
+        "accuracy": args.accuracy_tolerance,
+        "gap": args.gap_tolerance,
+        "latency": args.latency_tolerance,
+        "latency_floor_ms": args.latency_floor,
+        "throughput": args.throughput_tolerance,
+        "memory": args.memory_tolerance,
+    }
+    tolerances = Tolerances(**{k: v for k, v in given.items() if v is not None})
+    comparison = compare_reports(old, new, tolerances)
+    if args.json:
+        print(json.dumps(comparison, indent=2))
+    else:
+        print(format_comparison(comparison))
+    return 0 if comparison["ok"] else 1
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    from .daemon import serve
+
+    return serve(args.socket, workers=args.workers)
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="ats", description="Audit a resume for ATS compatibility, offline."
@@ -121,7 +419,28 @@ def build_parser() -> argparse.ArgumentParser:
     sub = parser.add_subparsers(dest="command", required=True)
 
     score = sub.add_parser("score", help="audit a resume and print a scorecard")
-    score.add_argument("resume", help="path to a .docx resume")
+    score.add_argument(
+        "resume", nargs="+",
+        help="a .docx resume; several, a directory, a glob, or - for paths on stdin "
+        "stream one JSON line per resume",
+    )
+    score.add_argument(
+        "--jobs", type=int, default=None, metavar="N",
+        help="worker processes for many resumes (default: one per CPU)",
+    )
+    score.add_argument(
+        "--compact", action="store_true",
+        help="stream the compact, round-trippable scorecard form",
+    )
+    score.add_argument(
+        "--shard", default=None, metavar="I/N",
+        help="score only shard I of N (from 1), chosen by a stable hash; "
+        "combine the outputs with ats merge",
+    )
+    score.add_argument(
+        "--shard-by", choices=("path", "content"), default="path",
+        help="hash the path as given, or the file's bytes (default: path)",
+    )
     score.add_argument("-j", "--job", help="job posting text, or a path to it")
     score.add_argument("--json", action="store_true", help="emit JSON")
     score.add_argument("-v", "--verbose", action="store_true", help="show every finding")
@@ -129,8 +448,57 @@ def build_parser() -> argparse.ArgumentParser:
         "--min-score", type=int, default=None,
         help="exit non-zero if the parse score falls below this",
     )
+    score.add_argument(
+        "--history", default=None, metavar="DB",
+        help=f"also record the scorecard in this SQLite database (default: ${HISTORY_ENV})",
+    )
+    score.add_argument("--profile", default=None, metavar="PATH", help="profile scoring into PATH")
+    score.add_argument(
+        "--profile-format", choices=("pstats", "collapsed"), default="pstats",
+        help="pstats for snakeviz and pstats, collapsed for flame graphs (default: pstats)",
+    )
     score.set_defaults(func=cmd_score)
 
+    merge = sub.add_parser("merge", help="combine sharded ats score outputs into one summary")
+    merge.add_argument("outputs", nargs="+", help="NDJSON files from ats score, or - for stdin")
+    merge.add_argument(
+        "--min-score", type=int, default=None,
+        help="count, and exit non-zero for, resumes whose parse score falls below this",
+    )
+    merge.set_defaults(func=cmd_merge)
+
+    rank = sub.add_parser("rank", help="the best-matching resumes for one posting")
+    rank.add_argument(
+        "resume", nargs="+", help="resumes, directories, globs, or - for paths on stdin",
+    )
+    rank.add_argument("-j", "--job", required=True, help="job posting text, or a path to it")
+    rank.add_argument(
+        "-k", "--top", type=int, default=10, metavar="K",
+        help="how many to keep (default: 10)",
+    )
+    rank.add_argument(
+        "--jobs", type=int, default=None, metavar="N",
+        help="worker processes (default: one per CPU)",
+    )
+    rank.add_argument("--json", action="store_true", help="emit JSON")
+    rank.set_defaults(func=cmd_rank)
+
+    mat = sub.add_parser("matrix", help="score many resumes against many postings")
+    mat.add_argument("postings", help="a directory of .txt/.md postings, or one posting file")
+    mat.add_argument(
+        "resume", nargs="+", help="resumes, directories, globs, or - for paths on stdin",
+    )
+    mat.add_argument(
+        "--format", choices=("csv", "ndjson"), default="csv",
+        help="one row per resume, one match column per posting (default: csv)",
+    )
+    mat.add_argument("-o", "--output", default=None, help="write here instead of stdout")
+    mat.add_argument(
+        "--jobs", type=int, default=None, metavar="N",
+        help="worker processes (default: one per CPU)",
+    )
+    mat.set_defaults(func=cmd_matrix)
+
     ext = sub.add_parser("extract", help="show what an ATS actually reads")
     ext.add_argument("resume")
     ext.add_argument("--show-dropped", action="store_true", help="list text parsers miss")
@@ -144,34 +512,125 @@ def build_parser() -> argparse.ArgumentParser:
     cmp_.add_argument("--json", action="store_true")
     cmp_.set_defaults(func=cmd_compare)
 
+    hist = sub.add_parser("history", help="score trends and finding frequency over time")
+    hist.add_argument("--db", default=None, help=f"history database (default: ${HISTORY_ENV})")
+    hist.add_argument("--path", default=None, help="only audits of this resume path")
+    hist.add_argument("--hash", default=None, help="only audits of this content hash")
+    hist.add_argument("-j", "--job", help="only audits against this posting (text or path)")
+    hist.add_argument("--days", type=float, default=None, help="only the last N days")
+    hist.add_argument("--limit", type=int, default=None, help="only the N most recent audits")
+    hist.add_argument("--findings", action="store_true", help="count findings by check")
+    hist.add_argument("--json", action="store_true", help="emit JSON")
+    hist.set_defaults(func=cmd_history)
+
+    watch = sub.add_parser("watch", help="rescore resumes in a folder as they are saved")
+    watch.add_argument("directory")
+    watch.add_argument("-j", "--job", help="job posting text, or a path to it")
+    watch.add_argument("--json", action="store_true", help="emit one JSON event per line")
+    watch.add_argument(
+        "--debounce", type=float, default=0.3, metavar="SECONDS",
+        help="wait for this much quiet after a change before rescoring (default: 0.3)",
+    )
+    watch.add_argument(
+        "--interval", type=float, default=1.0, metavar="SECONDS",
+        help="how often to poll when inotify is unavailable (default: 1)",
+    )
+    watch.add_argument("--poll", action="store_true", help="poll even where inotify exists")
+    watch.set_defaults(func=cmd_watch)
+
     fix = sub.add_parser("fixtures", help="generate the test corpus")
     fix.add_argument("directory", nargs="?", default="fixtures")
+    fix.add_argument(
+        "--generate", type=int, default=0, metavar="N",
+        help="write N seeded, generated resumes instead of the hand-built set",
+    )
+    fix.add_argument("--seed", type=int, default=0, help="seed for --generate")
     fix.set_defaults(func=cmd_fixtures)
 
     bench = sub.add_parser("bench", help="score the detector against known defects")
     bench.add_argument("--json", default=None, help="also write raw results here")
+    bench.add_argument(
+        "--perf", action="store_true",
+        help="also time extraction, checks, keywords and full scoring per fixture",
+    )
+    bench.add_argument("--repeat", type=int, default=20, help="timed runs per fixture")
+    bench.add_argument(
+        "--corpus", type=int, default=0, metavar="N",
+        help="also score the detector on N generated resumes",
+    )
+    bench.add_argument("--seed", type=int, default=0, help="seed for --corpus")
+    bench.add_argument(
+        "--stress", action="store_true",
+        help="also score the pathological stress documents against their budgets",
+    )
     bench.set_defaults(func=cmd_bench)
 
+    bench_sub = bench.add_subparsers(dest="bench_command")
+    gate = bench_sub.add_parser(
+        "compare", help="diff two benchmark JSON files; exit 1 on a regression",
+    )
+    gate.add_argument("old", help="baseline benchmark JSON")
+    gate.add_argument("new", help="candidate benchmark JSON")
+    gate.add_argument("--json", action="store_true", help="emit JSON")
+    for flag, text in (
+        ("--accuracy-tolerance", "allowed absolute drop in precision/recall/F1 (default 0)"),
+        ("--gap-tolerance", "allowed drop in the separation gap, in points (default 1)"),
+        ("--latency-tolerance", "allowed relative latency increase (default 0.10)"),
+        ("--latency-floor", "ignore latency increases under this many ms (default 0.5)"),
+        ("--throughput-tolerance", "allowed relative throughput drop (default 0.10)"),
+        ("--memory-tolerance", "allowed relative peak memory increase (default 0.10)"),
+    ):
+        gate.add_argument(flag, type=float, default=None, help=text)
+    gate.set_defaults(func=cmd_bench_compare)
+
+    srv = sub.add_parser(
+        "serve", help="keep warm workers behind a Unix socket for fast CLI calls",
+    )
+    srv.add_argument(
+        "--socket", default=None, metavar="PATH",
+        help=f"socket to listen on (default: ${SOCKET_ENV}, else a per-user temp path)",
+    )
+    srv.add_argument("--workers", type=int, default=None, help="worker processes (default: CPUs)")
+    srv.set_defaults(func=cmd_serve)
+
     return parser
 
 
+def _unreadable_docx(exc: BaseException) -> bool:
+    """Whether ``exc`` is python-docx refusing the file as a package.
+
+    Checked through ``sys.modules`` so the CLI need not import python-docx
+    just to name the exception: if it was raised, the module is loaded.
+    """
+    errors = sys.modules.get("docx.opc.exceptions")
+    return errors is not None and isinstance(exc, errors.PackageNotFoundError)
+
+
 def main(argv: Sequence[str] | None = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    status = forward(argv)
+    if status is not None:
+        return status
     args = build_parser().parse_args(argv)
     try:
         return args.func(args)
-    except PackageNotFoundError:
+    except (ValueError, OSError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+    except Exception as exc:  # noqa: BLE001
+        if not _unreadable_docx(exc):
+            raise
         # What python-docx raises for a missing file, a legacy .doc, or a PDF
         # someone renamed. All three deserve the same plain explanation.
         target = getattr(args, "resume", None) or getattr(args, "before", "the file")
+        if isinstance(target, list):
+            target = target[0]
         print(
             f"error: {target} is not a readable .docx file. "
             "Legacy .doc and PDF resumes must be converted to .docx first.",
             file=sys.stderr,
         )
         return 2
-    except (ValueError, OSError) as exc:
-        print(f"error: {exc}", file=sys.stderr)
-        return 2
 
 
 if __name__ == "__main__":
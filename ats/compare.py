@@ -0,0 +1,142 @@
+"""Before-and-after comparison of two resumes against one posting.
+
+Comparing is the question the rewrite pipeline exists to answer: did the new
+document parse better, match better, and which problems did it fix or
+introduce? Scoring both files separately analyzes the posting twice and
+leaves the reader to diff two finding lists by eye. :func:`compare_resumes`
+indexes the posting once, scores both documents (on two processes when they
+are large enough for that to pay), and returns the findings that appeared and
+disappeared.
+
+Findings are compared by what they say, not by position. A finding whose
+message changed ("3 images" becoming "1 image") is reported as one removed and
+one added, which is what happened from the reader's point of view.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .batch import score_many
+from .checks import Finding
+from .keywords import PostingIndex, as_posting_index
+from .score import Scorecard, score_resume
+
+# Below this combined size, starting a second process costs more than the
+# extraction it would overlap with.
+PARALLEL_MIN_BYTES = 2 * 1024 * 1024
+
+
+def _key(finding: Finding) -> Tuple[str, str, str, str]:
+    return (finding.check, finding.severity, finding.message, finding.evidence)
+
+
+def _finding_dict(finding: Finding) -> Dict:
+    return {
+        "check": finding.check,
+        "severity": finding.severity,
+        "message": finding.message,
+        "evidence": finding.evidence,
+        "penalty": finding.penalty,
+    }
+
+
+@dataclass
+class Comparison:
+    """Two scorecards and what changed between them."""
+
+    before: Scorecard
+    after: Scorecard
+    added: List[Finding] = field(default_factory=list)
+    removed: List[Finding] = field(default_factory=list)
+
+    @property
+    def parse_delta(self) -> int:
+        return self.after.parse_score - self.before.parse_score
+
+    @property
+    def match_delta(self) -> Optional[int]:
+        if self.before.keywords is None or self.after.keywords is None:
+            return None
+        return self.after.match_score - self.before.match_score
+
+    def rows(self) -> List[Tuple[str, int, int]]:
+        """``(label, before, after)`` rows for a side-by-side table."""
+        rows = [("parse score", self.before.parse_score, self.after.parse_score)]
+        if self.match_delta is not None:
+            rows.append(("match score", self.before.match_score, self.after.match_score))
+        rows.append(
+            ("critical findings", len(self.before.critical), len(self.after.critical))
+        )
+        rows.append(("warnings", len(self.before.warnings), len(self.after.warnings)))
+        return rows
+
+    def to_dict(self) -> Dict:
+        return {
+            "before": self.before.to_dict(),
+            "after": self.after.to_dict(),
+            "delta": {
+                "parse_score": self.parse_delta,
+                "match_score": self.match_delta,
+                "added": [_finding_dict(f) for f in self.added],
+                "removed": [_finding_dict(f) for f in self.removed],
+            },
+        }
+
+
+def compare_scorecards(before: Scorecard, after: Scorecard) -> Comparison:
+    """Diff the findings of two existing scorecards."""
+    old = Counter(_key(f) for f in before.findings)
+    new = Counter(_key(f) for f in after.findings)
+
+    def only_in(findings: List[Finding], surplus: Counter) -> List[Finding]:
+        picked: List[Finding] = []
+        for finding in findings:
+            if surplus[_key(finding)] > 0:
+                surplus[_key(finding)] -= 1
+                picked.append(finding)
+        return picked
+
+    return Comparison(
+        before=before,
+        after=after,
+        added=only_in(after.findings, new - old),
+        removed=only_in(before.findings, old - new),
+    )
+
+
+def _worth_parallel(*paths: str | Path) -> bool:
+    try:
+        return sum(os.path.getsize(p) for p in paths) >= PARALLEL_MIN_BYTES
+    except OSError:
+        return False
+
+
+def compare_resumes(
+    before: str | Path,
+    after: str | Path,
+    job_description: str | PostingIndex | None = None,
+    parallel: bool | None = None,
+) -> Comparison:
+    """Score two resumes against one posting and report the difference.
+
+    ``parallel`` forces the two documents onto separate processes or keeps
+    them in this one; left as ``None`` it is decided by their combined size.
+    """
+    posting = as_posting_index(job_description)
+    if parallel is None:
+        parallel = _worth_parallel(before, after)
+
+    if parallel:
+        cards = {
+            card.path: card
+            for card in score_many([before, after], posting, workers=2)
+        }
+        return compare_scorecards(cards[str(before)], cards[str(after)])
+    return compare_scorecards(
+        score_resume(before, posting), score_resume(after, posting)
+    )
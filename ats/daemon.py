@@ -0,0 +1,290 @@
+"""A resident ``ats`` that keeps its imports warm behind a Unix socket.
+
+Most ``ats`` invocations spend longer importing python-docx and lxml than
+auditing the resume they were given. ``ats serve`` pays that once: it starts a
+pool of worker processes, warms each by scoring a fixture, and listens on a
+Unix domain socket. While it runs, ``ats score``, ``ats extract`` and
+``ats compare`` send their arguments over the socket instead of doing the work
+themselves, which is what keeps editor integrations and git hooks fast.
+
+The protocol is one JSON line each way. The request carries ``argv``, the
+client's working directory, any stdin it was given and the ``ATS_*``
+environment that changes behaviour; the response carries the exit status and
+everything the command printed. Output is returned when the command finishes,
+so a batch run through the daemon arrives all at once rather than line by line.
+
+Every request names the code the client would run (see :func:`code_version`).
+A daemon started before an upgrade or an edit answers ``{"stale": true}``
+rather than run its old code, and the client runs the command itself.
+
+This module is imported on every CLI call, so it imports nothing heavy at the
+top: the client must stay cheap when no daemon is running.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Dict, List, Optional, Sequence
+
+#: Environment variable naming the daemon's socket.
+SOCKET_ENV = "ATS_SOCKET"
+#: Set to any value to keep the CLI from using a running daemon.
+NO_DAEMON_ENV = "ATS_NO_DAEMON"
+
+#: Commands worth forwarding. The rest are rare, slow, or manage the daemon.
+DAEMON_COMMANDS = frozenset({"score", "extract", "compare"})
+
+# Environment that changes what a forwarded command does, so the client's
+# values replace the daemon's for the length of the request.
+FORWARDED_ENV = ("ATS_HISTORY", "ATS_PROFILE_AUDITS")
+
+CONNECT_TIMEOUT = 0.5
+MAX_REQUEST = 64 * 1024 * 1024
+
+
+def default_socket_path() -> str:
+    """``$ATS_SOCKET``, else a per-user socket in the runtime or temp directory."""
+    if os.environ.get(SOCKET_ENV):
+        return os.environ[SOCKET_ENV]
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(base, f"ats-{uid}.sock")
+
+
+def code_version() -> str:
+    """The package version and a digest of its sources' names, sizes and mtimes.
+
+    Stat data, not contents, so the check costs a directory listing per call.
+    """
+    from . import __version__
+
+    digest = hashlib.sha256()
+    package = os.path.dirname(os.path.abspath(__file__))
+    for entry in sorted(os.scandir(package), key=lambda entry: entry.name):
+        if entry.name.endswith(".py"):
+            stat = entry.stat()
+            digest.update(f"{entry.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return f"{__version__}+{digest.hexdigest()[:12]}"
+
+
+# -- client -------------------------------------------------------------------
+
+
+def _connect(path: str) -> Optional[socket.socket]:
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(path)
+    except OSError:
+        # A socket file left behind by a daemon that died.
+        sock.close()
+        return None
+    sock.settimeout(None)
+    return sock
+
+
+def request(
+    argv: Sequence[str], path: str | None = None, stdin: str | None = None
+) -> Optional[Dict]:
+    """Run ``argv`` on the daemon, or return None if none is listening."""
+    sock = _connect(path or default_socket_path())
+    if sock is None:
+        return None
+    payload = {
+        "argv": list(argv),
+        "cwd": os.getcwd(),
+        "stdin": stdin,
+        "env": {key: os.environ.get(key) for key in FORWARDED_ENV},
+        "code": code_version(),
+    }
+    with sock, sock.makefile("rwb") as stream:
+        stream.write(json.dumps(payload).encode("utf-8") + b"\n")
+        stream.flush()
+        line = stream.readline()
+    if not line:
+        raise ConnectionError("the ats daemon closed the connection without answering")
+    return json.loads(line)
+
+
+def forward(argv: Sequence[str]) -> Optional[int]:
+    """Hand a CLI invocation to a running daemon, if that applies and works.
+
+    Returns the command's exit status, or None to run it in this process,
+    as when the daemon is running older code than this client.
+    """
+    if not argv or argv[0] not in DAEMON_COMMANDS or os.environ.get(NO_DAEMON_ENV):
+        return None
+    if "--profile" in argv:
+        return None  # the caller wants to profile this process, not a worker
+    stdin = sys.stdin.read() if "-" in argv[1:] else None
+    response = request(argv, stdin=stdin)
+    if response is None or response.get("stale"):
+        if stdin is not None:
+            sys.stdin = io.StringIO(stdin)
+        return None
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    return response["status"]
+
+
+# -- workers ------------------------------------------------------------------
+
+
+def _warm() -> None:
+    """Import everything and score one fixture, so the first request is fast."""
+    os.environ[NO_DAEMON_ENV] = "1"
+    from .fixtures import JOB_POSTING, build_clean
+    from .score import score_resume
+    from . import cli  # noqa: F401
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "warm.docx")
+        build_clean(path)
+        score_resume(path, JOB_POSTING)
+
+
+def _ready() -> int:
+    return os.getpid()
+
+
+def _exit_status(exc: SystemExit) -> int:
+    if exc.code is None:
+        return 0
+    return exc.code if isinstance(exc.code, int) else 1
+
+
+def run_request(
+    argv: List[str], cwd: str, stdin: str | None, env: Dict[str, Optional[str]]
+) -> Dict:
+    """Run one CLI invocation as the client would have, capturing its output."""
+    from .cli import main
+
+    out, err = io.StringIO(), io.StringIO()
+    saved_env = {key: os.environ.get(key) for key in env}
+    saved_stdin, saved_cwd = sys.stdin, os.getcwd()
+    try:
+        for key, value in env.items():
+            if key not in FORWARDED_ENV:
+                continue
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        os.chdir(cwd)
+        sys.stdin = io.StringIO(stdin or "")
+        with redirect_stdout(out), redirect_stderr(err):
+            try:
+                status = main(argv)
+            except SystemExit as exc:  # argparse errors and --help
+                status = _exit_status(exc)
+            except Exception as exc:  # noqa: BLE001
+                print(f"error: {type(exc).__name__}: {exc}", file=sys.stderr)
+                status = 2
+    finally:
+        sys.stdin = saved_stdin
+        os.chdir(saved_cwd)
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+    return {"status": status, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+
+# -- server -------------------------------------------------------------------
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline(MAX_REQUEST)
+        if not line:
+            return  # a liveness probe: connected, sent nothing
+        try:
+            payload = json.loads(line)
+            argv = [str(arg) for arg in payload["argv"]]
+            job = (argv, str(payload["cwd"]), payload.get("stdin"), payload.get("env") or {})
+        except (ValueError, KeyError, TypeError) as exc:
+            response = {"status": 2, "stdout": "", "stderr": f"error: bad request: {exc}\n"}
+        else:
+            if payload.get("code") != self.server.code:
+                response = {"stale": True, "code": self.server.code}
+            else:
+                response = self.server.pool.submit(run_request, *job).result()
+        try:
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client gave up waiting; nobody is left to tell
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """A Unix socket server answering CLI requests from a warm process pool.
+
+    The socket is created readable and writable by its owner only, and a
+    socket file left by a daemon that died is replaced; one that still answers
+    is not.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: str, workers: int | None = None) -> None:
+        probe = _connect(path)
+        if probe is not None:
+            probe.close()
+            raise RuntimeError(f"an ats daemon is already listening on {path}")
+        if os.path.exists(path):
+            os.unlink(path)
+        self.socket_path = path
+        # The code this daemon runs; requests from any other are refused.
+        self.code = code_version()
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm)
+        # Start every worker now, so no request pays for a cold one.
+        for future in [self.pool.submit(_ready) for _ in range(self.workers)]:
+            future.result()
+        previous = os.umask(0o177)
+        try:
+            super().__init__(path, _Handler)
+        finally:
+            os.umask(previous)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.shutdown(wait=True, cancel_futures=True)
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+
+def _interrupt(signum, frame) -> None:
+    raise KeyboardInterrupt
+
+
+def serve(path: str | None = None, workers: int | None = None) -> int:
+    """Run the daemon in the foreground until interrupted."""
+    import signal
+
+    path = path or default_socket_path()
+    server = DaemonServer(path, workers)
+    # Stop cleanly on SIGTERM as well as Ctrl-C, so the socket is removed.
+    signal.signal(signal.SIGTERM, _interrupt)
+    print(f"ats daemon listening on {path} with {server.workers} worker(s)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
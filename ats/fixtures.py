@@ -7,14 +7,32 @@ there and, just as importantly, not inventing what is not.
 
 All fixtures are generated from code, so nothing personal or copyrighted is
 committed to the repository and the corpus rebuilds identically anywhere.
+
+Six hand-built documents prove the checks work; they say nothing about how the
+detector behaves at scale. :func:`generate_corpus` writes any number of seeded
+variations on the same builders, with size, layout, images and planted defects
+drawn from a :class:`CorpusSpec`, plus a manifest of what each one should trip.
+
+:data:`STRESS` is the adversarial set: documents shaped like the ones that have
+stalled workers (a two-thousand-row table, tables nested forty deep, fifty
+megabytes of images, a five-megabyte paragraph), each with the time and memory
+:func:`~ats.score.score_resume` is allowed to spend on it.
 """
 
 from __future__ import annotations
 
+import io
+import json
+import random
+import struct
+import zlib
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Sequence, Tuple
 
 from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
 from docx.shared import Inches, Pt
 
 CONTACT = "jordan.reyes@example.com | (555) 123-4567 | Austin, TX"
@@ -78,31 +96,129 @@ and improve the reliability of our data platform.
 """
 
 
-def _add_body(doc: Document, heading_style: Dict[str, str] | None = None) -> None:
-    """Write a clean, conventional resume body into ``doc``."""
-    labels = heading_style or {
-        "summary": "PROFESSIONAL SUMMARY",
-        "experience": "PROFESSIONAL EXPERIENCE",
-        "education": "EDUCATION",
-        "skills": "TECHNICAL SKILLS",
-    }
+STANDARD_HEADINGS = {
+    "summary": "PROFESSIONAL SUMMARY",
+    "experience": "PROFESSIONAL EXPERIENCE",
+    "education": "EDUCATION",
+    "skills": "TECHNICAL SKILLS",
+}
+
+CREATIVE_HEADINGS = {
+    "summary": "WHO I AM",
+    "experience": "WHERE I'VE BEEN",
+    "education": "HOW I LEARNED IT",
+    "skills": "WHAT I'M GOOD AT",
+}
+
+Job = Tuple[str, str, Sequence[str]]
+
+
+def _add_body(
+    doc: Document,
+    heading_style: Dict[str, str] | None = None,
+    experience: Sequence[Job] = EXPERIENCE,
+    education: str = EDUCATION,
+    skills: str = SKILLS,
+    extra_sections: Sequence[Tuple[str, Sequence[str]]] = (),
+    bullet_glyph: str = "",
+) -> None:
+    """Write a clean, conventional resume body into ``doc``.
+
+    The defaults reproduce the hand-built fixtures; the generator varies them.
+    ``bullet_glyph`` types a literal bullet in place of the list style.
+    """
+    labels = heading_style or STANDARD_HEADINGS
 
     doc.add_paragraph(labels["summary"]).runs[0].bold = True
     doc.add_paragraph(SUMMARY)
 
     doc.add_paragraph(labels["experience"]).runs[0].bold = True
-    for title, dates, bullets in EXPERIENCE:
+    for title, dates, bullets in experience:
         line = doc.add_paragraph()
         line.add_run(title).bold = True
         line.add_run(f"    {dates}")
         for bullet in bullets:
-            doc.add_paragraph(bullet, style="List Bullet")
+            if bullet_glyph:
+                doc.add_paragraph(f"{bullet_glyph} {bullet}")
+            else:
+                doc.add_paragraph(bullet, style="List Bullet")
 
     doc.add_paragraph(labels["education"]).runs[0].bold = True
-    doc.add_paragraph(EDUCATION)
+    doc.add_paragraph(education)
 
     doc.add_paragraph(labels["skills"]).runs[0].bold = True
-    doc.add_paragraph(SKILLS)
+    doc.add_paragraph(skills)
+
+    _add_body_sections(doc, extra_sections)
+
+
+def _add_body_sections(doc: Document, sections: Sequence[Tuple[str, Sequence[str]]]) -> None:
+    for heading, paragraphs in sections:
+        doc.add_paragraph(heading).runs[0].bold = True
+        for text in paragraphs:
+            doc.add_paragraph(text)
+
+
+def _add_table_layout(
+    doc: Document,
+    experience: Sequence[Job] = EXPERIENCE,
+    education: str = EDUCATION,
+    skills: str = SKILLS,
+    bullet_glyph: str = "",
+) -> None:
+    """Skills and education in a narrow left column, experience on the right."""
+    table = doc.add_table(rows=1, cols=2)
+    table.autofit = False
+    left, right = table.rows[0].cells
+    left.width = Inches(2.0)
+    right.width = Inches(4.5)
+
+    left.paragraphs[0].text = "TECHNICAL SKILLS"
+    left.add_paragraph(skills)
+    left.add_paragraph("EDUCATION")
+    left.add_paragraph(education)
+
+    right.paragraphs[0].text = "PROFESSIONAL EXPERIENCE"
+    for title, dates, bullets in experience:
+        right.add_paragraph(f"{title}    {dates}")
+        for bullet in bullets:
+            right.add_paragraph(f"{bullet_glyph} {bullet}" if bullet_glyph else bullet)
+
+
+def _add_textbox(doc: Document, text: str) -> None:
+    """A floating VML text box, the kind design templates use for sidebars."""
+    paragraph = doc.add_paragraph()
+    paragraph._p.append(parse_xml(
+        f'<w:r {nsdecls("w")} xmlns:v="urn:schemas-microsoft-com:vml">'
+        '<w:pict><v:shape style="width:180pt;height:60pt"><v:textbox>'
+        f'<w:txbxContent><w:p><w:r><w:t xml:space="preserve">{_xml_escape(text)}</w:t>'
+        "</w:r></w:p></w:txbxContent></v:textbox></v:shape></w:pict></w:r>"
+    ))
+
+
+def _xml_escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    body = kind + data
+    return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+
+def png_bytes(width: int = 8, height: int = 8, seed: int = 0) -> bytes:
+    """A valid RGB PNG of noise. Different seeds give different images.
+
+    Incompressible noise keeps the file roughly ``3 * width * height`` bytes,
+    which is what a test of image-heavy documents needs.
+    """
+    rng = random.Random(seed)
+    rows = b"".join(b"\x00" + rng.randbytes(3 * width) for _ in range(height))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + _png_chunk(b"IDAT", zlib.compress(rows, 1))
+        + _png_chunk(b"IEND", b"")
+    )
 
 
 def build_clean(path: Path) -> List[str]:
@@ -135,24 +251,7 @@ def build_table_layout(path: Path) -> List[str]:
     doc = Document()
     doc.add_paragraph("JORDAN REYES").runs[0].bold = True
     doc.add_paragraph(CONTACT)
-
-    table = doc.add_table(rows=1, cols=2)
-    table.autofit = False
-    left, right = table.rows[0].cells
-    left.width = Inches(2.0)
-    right.width = Inches(4.5)
-
-    left.paragraphs[0].text = "TECHNICAL SKILLS"
-    left.add_paragraph(SKILLS)
-    left.add_paragraph("EDUCATION")
-    left.add_paragraph(EDUCATION)
-
-    right.paragraphs[0].text = "PROFESSIONAL EXPERIENCE"
-    for title, dates, bullets in EXPERIENCE:
-        right.add_paragraph(f"{title}    {dates}")
-        for bullet in bullets:
-            right.add_paragraph(f"• {bullet}")
-
+    _add_table_layout(doc, bullet_glyph="•")
     doc.save(str(path))
     return ["table_layout", "risky_characters"]
 
@@ -162,15 +261,7 @@ def build_unlabeled_sections(path: Path) -> List[str]:
     doc = Document()
     doc.add_paragraph("JORDAN REYES").runs[0].bold = True
     doc.add_paragraph(CONTACT)
-    _add_body(
-        doc,
-        {
-            "summary": "WHO I AM",
-            "experience": "WHERE I'VE BEEN",
-            "education": "HOW I LEARNED IT",
-            "skills": "WHAT I'M GOOD AT",
-        },
-    )
+    _add_body(doc, CREATIVE_HEADINGS)
     doc.save(str(path))
     return ["section_headings"]
 
@@ -229,3 +320,349 @@ def build_all(directory: str | Path) -> Dict[str, List[str]]:
         expected[name] = builder(target / f"{name}.docx")
     (target / "job_posting.txt").write_text(JOB_POSTING, encoding="utf-8")
     return expected
+
+
+# ---------------------------------------------------------------------------
+# Generated corpus
+# ---------------------------------------------------------------------------
+
+# Every word below is chosen so that no generated sentence contains a date, a
+# canonical section name, or a risky glyph by accident. A planted defect then
+# has exactly one cause, and a clean document has none.
+FIRST_NAMES = (
+    "Jordan", "Avery", "Morgan", "Riley", "Casey", "Quinn", "Rowan", "Sasha",
+    "Devon", "Emery", "Harper", "Kai", "Logan", "Parker", "Reese", "Skyler",
+)
+LAST_NAMES = (
+    "Reyes", "Okafor", "Lindqvist", "Tanaka", "Moreau", "Patel", "Novak",
+    "Castillo", "Brennan", "Haddad", "Kowalski", "Mensah", "Sorensen", "Vargas",
+)
+TITLES = (
+    "Senior Data Engineer", "Data Engineer", "Analytics Engineer",
+    "Platform Engineer", "Backend Engineer", "Machine Learning Engineer",
+    "Data Platform Lead", "Software Engineer",
+)
+COMPANIES = (
+    "Northwind Analytics", "Cobalt Systems", "Bluefin Labs", "Harbor Metrics",
+    "Juniper Health", "Granite Logistics", "Lumen Retail", "Atlas Payments",
+)
+VERBS = (
+    "Built", "Designed", "Automated", "Migrated", "Led", "Rebuilt", "Shipped",
+    "Maintained", "Optimized", "Documented", "Scaled", "Introduced",
+)
+OBJECTS = (
+    "the billing data pipeline", "a streaming ingestion service in Python",
+    "dashboards for the finance team", "Spark jobs on AWS",
+    "Airflow DAGs for nightly loads", "a feature store for machine learning models",
+    "SQL models in Snowflake", "Docker images for batch jobs",
+    "Kubernetes deployments for internal APIs", "unit tests for legacy ETL code",
+    "a CI/CD pipeline in GitHub Actions", "data quality checks on core tables",
+)
+OUTCOMES = (
+    "cutting runtime by {n} percent", "serving {n} internal users",
+    "saving {n} hours a month", "with zero downtime", "ahead of schedule",
+    "across {n} teams", "reducing cloud spend by {n} percent",
+    "lowering incident volume by {n} percent",
+)
+EXTRA_HEADINGS = (
+    "PROJECTS", "CERTIFICATIONS", "AWARDS", "PUBLICATIONS", "VOLUNTEERING",
+    "LANGUAGES", "LEADERSHIP", "TALKS", "PATENTS", "INTERESTS",
+)
+EXTRA_LINES = (
+    "Maintainer of a small open source data validation library",
+    "Speaker at a regional data engineering meetup",
+    "AWS Certified Data Analytics Specialty",
+    "Mentored {n} junior engineers through their first production launch",
+    "Organized a quarterly internal hackathon with {n} participants",
+    "Fluent in Spanish and conversational in Portuguese",
+    "Coauthored a paper on incremental view maintenance",
+    "Volunteer tutor teaching Python to high school students",
+    "Wrote an internal guide to testing Airflow DAGs",
+    "Recognized for reliability improvements on the payments platform",
+)
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+VAGUE_DATES = ("Recently", "Previously", "Earlier", "Before that")
+SIDEBAR_TEXT = "Open to relocation and remote roles"
+SKILL_TERMS = tuple(term.strip() for term in SKILLS.split(","))
+
+# The word counts at which ``document_length`` fires, mirrored here so a
+# generated document's length is a planted property rather than an accident.
+MIN_WORDS, MAX_WORDS = 120, 1200
+
+#: Defects the generator can plant, and the checks each one should trip.
+PLANTABLE: Dict[str, Tuple[str, ...]] = {
+    "header_contact": ("dropped_content", "contact_details"),
+    "textbox": ("dropped_content",),
+    "unlabeled_sections": ("section_headings",),
+    "no_dates": ("parseable_dates",),
+    "symbol_bullets": ("risky_characters",),
+}
+
+MANIFEST = "manifest.json"
+
+
+@dataclass
+class CorpusSpec:
+    """What :func:`generate_corpus` varies, and over what range.
+
+    Ranges are inclusive ``(low, high)`` pairs drawn uniformly per document.
+    ``table_layouts`` is the share laid out as a two-column table, and
+    ``defect_rate`` the chance that each entry of :data:`PLANTABLE` is
+    planted independently.
+    """
+
+    jobs: Tuple[int, int] = (1, 4)
+    bullets: Tuple[int, int] = (2, 6)
+    sections: Tuple[int, int] = (0, 3)
+    paragraphs: Tuple[int, int] = (1, 3)
+    images: Tuple[int, int] = (0, 0)
+    image_size: int = 8
+    table_layouts: float = 0.1
+    defect_rate: float = 0.2
+
+
+def _draw(rng: random.Random, bounds: Sequence[int]) -> int:
+    low, high = bounds
+    return rng.randint(low, max(low, high))
+
+
+def _fill(rng: random.Random, template: str) -> str:
+    return template.format(n=rng.randint(2, 95))
+
+
+def _bullet(rng: random.Random) -> str:
+    return f"{rng.choice(VERBS)} {rng.choice(OBJECTS)}, {_fill(rng, rng.choice(OUTCOMES))}"
+
+
+def _experience(rng: random.Random, spec: CorpusSpec, dated: bool) -> List[Job]:
+    jobs: List[Job] = []
+    year = 2024
+    for index in range(_draw(rng, spec.jobs)):
+        start = max(year - rng.randint(1, 4), 1990)
+        if dated:
+            end = "Present" if index == 0 else f"{rng.choice(MONTHS)} {year}"
+            dates = f"{rng.choice(MONTHS)} {start} - {end}"
+        else:
+            dates = VAGUE_DATES[min(index, len(VAGUE_DATES) - 1)]
+        title = f"{rng.choice(TITLES)}, {rng.choice(COMPANIES)}"
+        bullets = [_bullet(rng) for _ in range(_draw(rng, spec.bullets))]
+        jobs.append((title, dates, bullets))
+        year = start
+    return jobs
+
+
+def _extra_sections(rng: random.Random, spec: CorpusSpec) -> List[Tuple[str, List[str]]]:
+    sections = []
+    for index in range(_draw(rng, spec.sections)):
+        heading = EXTRA_HEADINGS[index % len(EXTRA_HEADINGS)]
+        if index >= len(EXTRA_HEADINGS):
+            heading = f"{heading} {index // len(EXTRA_HEADINGS) + 1}"
+        lines = [_fill(rng, rng.choice(EXTRA_LINES)) for _ in range(_draw(rng, spec.paragraphs))]
+        sections.append((heading, lines))
+    return sections
+
+
+def _body_words(doc: Document) -> int:
+    """Words in body paragraphs and table cells: what a parser will read."""
+    words = sum(len(p.text.split()) for p in doc.paragraphs)
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                words += len(cell.text.split())
+    return words
+
+
+def build_synthetic(path: Path, rng: random.Random, spec: CorpusSpec) -> List[str]:
+    """One generated resume, returning the checks it is built to trip."""
+    planted = {name for name in PLANTABLE if rng.random() < spec.defect_rate}
+    table = rng.random() < spec.table_layouts
+    images = _draw(rng, spec.images)
+
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}".upper()
+    experience = _experience(rng, spec, dated="no_dates" not in planted)
+    education = EDUCATION if "no_dates" not in planted else EDUCATION.rsplit(",", 1)[0]
+    skills = ", ".join(rng.sample(SKILL_TERMS, rng.randint(4, len(SKILL_TERMS))))
+    glyph = "•" if "symbol_bullets" in planted else ""
+
+    doc = Document()
+    doc.add_paragraph(name).runs[0].bold = True
+    if "header_contact" in planted:
+        doc.sections[0].header.paragraphs[0].text = f"{name} | {CONTACT}"
+    else:
+        doc.add_paragraph(CONTACT)
+    for _ in range(images):
+        doc.add_picture(
+            io.BytesIO(png_bytes(spec.image_size, spec.image_size, rng.getrandbits(32))),
+            width=Inches(0.5),
+        )
+    if "textbox" in planted:
+        _add_textbox(doc, SIDEBAR_TEXT)
+
+    extra = _extra_sections(rng, spec)
+    if table:
+        # The table carries fixed, canonical headings, so a table layout
+        # cannot also be built with creative ones.
+        planted.discard("unlabeled_sections")
+        doc.add_paragraph(SUMMARY)
+        _add_table_layout(doc, experience, education, skills, glyph)
+        _add_body_sections(doc, extra)
+    else:
+        _add_body(
+            doc,
+            CREATIVE_HEADINGS if "unlabeled_sections" in planted else None,
+            experience=experience,
+            education=education,
+            skills=skills,
+            extra_sections=extra,
+            bullet_glyph=glyph,
+        )
+    doc.save(str(path))
+
+    checks = {check for defect in planted for check in PLANTABLE[defect]}
+    if table:
+        checks.add("table_layout")
+    if images:
+        checks.add("image_only_content")
+    words = _body_words(doc)
+    if words < MIN_WORDS or words > MAX_WORDS:
+        checks.add("document_length")
+    return sorted(checks)
+
+
+def generate_corpus(
+    directory: str | Path,
+    count: int,
+    seed: int = 0,
+    spec: CorpusSpec | None = None,
+) -> Dict[str, List[str]]:
+    """Write ``count`` generated resumes and a manifest of their defects.
+
+    Each document draws from its own generator seeded by ``(seed, index)``, so
+    the first hundred documents of a ten-thousand-document corpus are the same
+    hundred documents a corpus of a hundred would hold. The manifest records
+    the seed and spec alongside the expected defects, so a corpus can be
+    rebuilt from its manifest alone.
+    """
+    spec = spec or CorpusSpec()
+    target = Path(directory)
+    target.mkdir(parents=True, exist_ok=True)
+    width = max(len(str(count - 1)), 5)
+    expected: Dict[str, List[str]] = {}
+    for index in range(count):
+        name = f"synthetic_{index:0{width}d}"
+        rng = random.Random(f"{seed}:{index}")
+        expected[name] = build_synthetic(target / f"{name}.docx", rng, spec)
+    (target / "job_posting.txt").write_text(JOB_POSTING, encoding="utf-8")
+    manifest = {"seed": seed, "count": count, "spec": asdict(spec), "expected": expected}
+    (target / MANIFEST).write_text(json.dumps(manifest, indent=1) + "\n", encoding="utf-8")
+    return expected
+
+
+# ---------------------------------------------------------------------------
+# Stress documents
+# ---------------------------------------------------------------------------
+
+
+def _stress_document() -> Document:
+    doc = Document()
+    doc.add_paragraph("JORDAN REYES").runs[0].bold = True
+    doc.add_paragraph(CONTACT)
+    return doc
+
+
+def build_stress_long_table(path: Path) -> None:
+    """A 2,000-row, three-column table: skills matrices exported from a spreadsheet."""
+    doc = _stress_document()
+    _add_body(doc)
+    table = doc.add_table(rows=2000, cols=3)
+    for index, row in enumerate(table.rows):
+        skill, level, years = row.cells
+        skill.text = SKILL_TERMS[index % len(SKILL_TERMS)]
+        level.text = ("Expert", "Advanced", "Working")[index % 3]
+        years.text = f"{index % 12 + 1} years"
+    doc.save(str(path))
+
+
+def build_stress_nested_tables(path: Path) -> None:
+    """Tables nested forty deep, the way some templates build their columns."""
+    doc = _stress_document()
+    _add_body(doc)
+    cell = doc.add_table(rows=1, cols=2).rows[0].cells[0]
+    for depth in range(40):
+        cell.paragraphs[0].text = f"Level {depth} {SKILL_TERMS[depth % len(SKILL_TERMS)]}"
+        cell = cell.add_table(rows=1, cols=2).rows[0].cells[0]
+    doc.save(str(path))
+
+
+def build_stress_many_sections(path: Path) -> None:
+    """Two hundred sections, every one with its own heading."""
+    doc = _stress_document()
+    _add_body(doc, extra_sections=[
+        (f"{EXTRA_HEADINGS[i % len(EXTRA_HEADINGS)]} {i + 1}", [EXTRA_LINES[i % 3]] * 2)
+        for i in range(200)
+    ])
+    doc.save(str(path))
+
+
+def build_stress_large_images(path: Path) -> None:
+    """Fifty megabytes of distinct, incompressible images."""
+    doc = _stress_document()
+    _add_body(doc)
+    for seed in range(25):
+        doc.add_picture(io.BytesIO(png_bytes(816, 816, seed)), width=Inches(1.0))
+    doc.save(str(path))
+
+
+def build_stress_huge_paragraph(path: Path) -> None:
+    """Five megabytes of text in a single paragraph, as pasted from a PDF."""
+    doc = _stress_document()
+    _add_body(doc)
+    unit = SUMMARY + " "
+    doc.add_paragraph(unit * (5 * 1024 * 1024 // len(unit)))
+    doc.save(str(path))
+
+
+def build_stress_text_boxes(path: Path) -> None:
+    """A thousand text boxes, the skeleton of a heavily designed template."""
+    doc = _stress_document()
+    _add_body(doc)
+    for index in range(1000):
+        _add_textbox(doc, f"{SIDEBAR_TEXT} ({index + 1})")
+    doc.save(str(path))
+
+
+@dataclass
+class StressCase:
+    """A pathological document and what scoring it may cost.
+
+    Budgets sit a few times above what a laptop measures, so they catch an
+    algorithmic blow-up rather than a slow CI runner.
+    """
+
+    builder: Callable[[Path], None]
+    seconds: float
+    peak_mib: float
+
+
+#: Stress document name to its builder and ``score_resume`` budget.
+STRESS: Dict[str, StressCase] = {
+    "long_table": StressCase(build_stress_long_table, seconds=3.0, peak_mib=48),
+    "nested_tables": StressCase(build_stress_nested_tables, seconds=1.0, peak_mib=16),
+    "many_sections": StressCase(build_stress_many_sections, seconds=1.0, peak_mib=16),
+    "large_images": StressCase(build_stress_large_images, seconds=2.0, peak_mib=160),
+    "huge_paragraph": StressCase(build_stress_huge_paragraph, seconds=8.0, peak_mib=192),
+    "text_boxes": StressCase(build_stress_text_boxes, seconds=1.0, peak_mib=24),
+}
+
+
+def build_stress(
+    directory: str | Path, names: Sequence[str] | None = None
+) -> Dict[str, Path]:
+    """Write the stress documents (all, or just ``names``), returning their paths."""
+    target = Path(directory)
+    target.mkdir(parents=True, exist_ok=True)
+    paths: Dict[str, Path] = {}
+    for name in names or STRESS:
+        paths[name] = target / f"stress_{name}.docx"
+        STRESS[name].builder(paths[name])
+    return paths
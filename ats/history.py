@@ -0,0 +1,277 @@
+"""A local record of every audit, for trends over time.
+
+Re-auditing the same resume after each revision answers "is this getting
+better", but only if the earlier answers were kept somewhere that can be
+queried. Walking a tree of ``ats_report.json`` files to rebuild that is slow and
+loses everything not written to disk. :class:`HistoryStore` appends each
+scorecard to a SQLite database instead, keyed by what was scored (a hash of the
+file's bytes), what it was scored against (a hash of the posting), and when.
+
+Writes are buffered and flushed in one transaction per batch, and the database
+runs in WAL mode, so recording a bulk run costs a few commits rather than one
+per document and readers never block the writer.
+
+The full compact scorecard is stored alongside the indexed columns, so any
+entry can be turned back into a :class:`~ats.score.Scorecard` later.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+if TYPE_CHECKING:  # scoring pulls in python-docx; the CLI imports this module eagerly
+    from .score import Scorecard
+
+#: Environment variable naming a database to record every ``ats score`` run in.
+HISTORY_ENV = "ATS_HISTORY"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scorecards (
+    id INTEGER PRIMARY KEY,
+    recorded_at REAL NOT NULL,
+    content_hash TEXT NOT NULL,
+    posting_hash TEXT,
+    path TEXT NOT NULL,
+    parse_score INTEGER NOT NULL,
+    match_score INTEGER,
+    grade TEXT NOT NULL,
+    card BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS findings (
+    scorecard_id INTEGER NOT NULL REFERENCES scorecards(id),
+    check_name TEXT NOT NULL,
+    severity TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scorecards_content ON scorecards(content_hash, recorded_at);
+CREATE INDEX IF NOT EXISTS scorecards_posting ON scorecards(posting_hash, recorded_at);
+CREATE INDEX IF NOT EXISTS scorecards_path ON scorecards(path, recorded_at);
+CREATE INDEX IF NOT EXISTS scorecards_recorded ON scorecards(recorded_at);
+CREATE INDEX IF NOT EXISTS findings_scorecard ON findings(scorecard_id);
+CREATE INDEX IF NOT EXISTS findings_check ON findings(check_name);
+"""
+
+
+def file_digest(path: str | Path, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's bytes, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def text_digest(text: str) -> str:
+    """SHA-256 of text, ignoring surrounding whitespace."""
+    return hashlib.sha256(text.strip().encode("utf-8")).hexdigest()
+
+
+@dataclass
+class HistoryEntry:
+    """One recorded audit, without its findings."""
+
+    id: int
+    recorded_at: float
+    content_hash: str
+    posting_hash: Optional[str]
+    path: str
+    parse_score: int
+    match_score: Optional[int]
+    grade: str
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "recorded_at": self.recorded_at,
+            "content_hash": self.content_hash,
+            "posting_hash": self.posting_hash,
+            "path": self.path,
+            "parse_score": self.parse_score,
+            "match_score": self.match_score,
+            "grade": self.grade,
+        }
+
+
+_ENTRY_COLUMNS = (
+    "id, recorded_at, content_hash, posting_hash, path, parse_score, match_score, grade"
+)
+
+
+class HistoryStore:
+    """Append-mostly SQLite store of scorecards.
+
+    Use as a context manager, or call :meth:`close`, so the last partial batch
+    is written::
+
+        with HistoryStore("history.db") as store:
+            for card in score_many(paths, posting):
+                store.record(card, posting=posting_text)
+    """
+
+    def __init__(self, path: str | Path, batch_size: int = 500) -> None:
+        self.path = str(path)
+        self.batch_size = max(1, batch_size)
+        self._pending: List[Tuple[Scorecard, float, str, Optional[str]]] = []
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def __enter__(self) -> "HistoryStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def record(
+        self,
+        card: Scorecard,
+        posting: str | None = None,
+        content_hash: str | None = None,
+        recorded_at: float | None = None,
+    ) -> None:
+        """Queue a scorecard for the next batch.
+
+        ``content_hash`` defaults to the hash of the file at ``card.path``;
+        pass it explicitly for a card whose file is gone or was never on disk.
+        """
+        if content_hash is None:
+            content_hash = file_digest(card.path)
+        self._pending.append((
+            card,
+            time.time() if recorded_at is None else recorded_at,
+            content_hash,
+            text_digest(posting) if posting else None,
+        ))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write every queued scorecard in one transaction; returns the count."""
+        if not self._pending:
+            return 0
+        from .serialize import to_json
+
+        batch, self._pending = self._pending, []
+        with self._conn:
+            # Taking the write lock before reading MAX(id) keeps two processes
+            # sharing one database from handing out the same ids.
+            self._conn.execute("BEGIN IMMEDIATE")
+            (last_id,) = self._conn.execute(
+                "SELECT COALESCE(MAX(id), 0) FROM scorecards"
+            ).fetchone()
+            rows, findings = [], []
+            for offset, (card, recorded_at, content_hash, posting_hash) in enumerate(batch, 1):
+                row_id = last_id + offset
+                rows.append((
+                    row_id, recorded_at, content_hash, posting_hash,
+                    os.path.abspath(card.path) if card.path else "",
+                    card.parse_score,
+                    card.match_score if card.keywords is not None else None,
+                    card.grade,
+                    to_json(card, compact=True),
+                ))
+                findings.extend((row_id, f.check, f.severity) for f in card.findings)
+            self._conn.executemany(
+                f"INSERT INTO scorecards ({_ENTRY_COLUMNS}, card) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.executemany(
+                "INSERT INTO findings (scorecard_id, check_name, severity) VALUES (?, ?, ?)",
+                findings,
+            )
+        return len(batch)
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
+
+    @staticmethod
+    def _filters(
+        content_hash: str | None,
+        posting_hash: str | None,
+        path: str | Path | None,
+        since: float | None,
+        prefix: str = "",
+    ) -> Tuple[str, list]:
+        clauses, params = [], []
+        for column, value in (
+            ("content_hash", content_hash),
+            ("posting_hash", posting_hash),
+            ("path", os.path.abspath(path) if path else None),
+        ):
+            if value:
+                clauses.append(f"{prefix}{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append(f"{prefix}recorded_at >= ?")
+            params.append(since)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def trend(
+        self,
+        content_hash: str | None = None,
+        posting_hash: str | None = None,
+        path: str | Path | None = None,
+        since: float | None = None,
+        limit: int | None = None,
+    ) -> List[HistoryEntry]:
+        """Recorded audits matching every given filter, oldest first."""
+        self.flush()
+        where, params = self._filters(content_hash, posting_hash, path, since)
+        # With a limit, take the most recent entries and flip them back.
+        order = "DESC" if limit else "ASC"
+        sql = (
+            f"SELECT {_ENTRY_COLUMNS} FROM scorecards{where} "
+            f"ORDER BY recorded_at {order}, id {order}"
+        )
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        entries = [HistoryEntry(*row) for row in self._conn.execute(sql, params)]
+        return entries[::-1] if limit else entries
+
+    def finding_frequency(
+        self,
+        content_hash: str | None = None,
+        posting_hash: str | None = None,
+        path: str | Path | None = None,
+        since: float | None = None,
+    ) -> List[Tuple[str, str, int, int]]:
+        """``(check, severity, findings, audits)`` rows, most frequent first.
+
+        ``audits`` counts how many recorded scorecards carried the finding at
+        least once, which is the number to compare against the total.
+        """
+        self.flush()
+        where, params = self._filters(content_hash, posting_hash, path, since, "s.")
+        sql = (
+            "SELECT f.check_name, f.severity, COUNT(*), COUNT(DISTINCT f.scorecard_id) "
+            f"FROM findings f JOIN scorecards s ON s.id = f.scorecard_id{where} "
+            "GROUP BY f.check_name, f.severity ORDER BY COUNT(*) DESC, f.check_name"
+        )
+        return [tuple(row) for row in self._conn.execute(sql, params)]
+
+    def count(self) -> int:
+        self.flush()
+        return self._conn.execute("SELECT COUNT(*) FROM scorecards").fetchone()[0]
+
+    def load(self, entry_id: int) -> Scorecard:
+        """Rebuild the full scorecard recorded under ``entry_id``."""
+        from .serialize import from_json
+
+        self.flush()
+        row = self._conn.execute(
+            "SELECT card FROM scorecards WHERE id = ?", (entry_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(entry_id)
+        return from_json(row[0])
@@ -24,7 +24,7 @@ from __future__ import annotations
 import re
 from collections import Counter
 from dataclasses import dataclass, field
-from typing import Dict, List, Sequence, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple, Union
 
 # Common English plus resume and posting boilerplate. Without the second group,
 # every posting "matches" on words like "team", "work", and "role".
@@ -106,6 +106,31 @@ class KeywordReport:
         """The absent terms the posting leaned on hardest."""
         return [term for term, _ in self.missing[:12]]
 
+    @property
+    def score(self) -> int:
+        """Coverage blended into a 0-100 match score."""
+        # Weighted coverage dominates: matching the term a posting repeats six
+        # times counts for more than matching six one-off terms.
+        blended = 0.7 * self.weighted_coverage + 0.3 * self.coverage
+        return round(100 * blended)
+
+
+@dataclass
+class PostingIndex:
+    """A posting analyzed once, ready to be matched against any number of resumes.
+
+    Tokenizing the posting and isolating its requirement lines is the same work
+    for every resume scored against it, so batch and live scoring build this
+    once and pass it wherever a posting string is accepted.
+    """
+
+    terms: Counter = field(default_factory=Counter)
+    requirement_terms: List[str] = field(default_factory=list)
+
+    @property
+    def total_weight(self) -> int:
+        return sum(self.terms.values())
+
 
 def normalize(text: str) -> str:
     """Lowercase and collapse whitespace and separators for matching."""
@@ -180,17 +205,62 @@ def extract_terms(posting: str, limit: int = 60) -> Counter:
     return Counter(dict(counts.most_common(limit)))
 
 
-def match(resume_text: str, posting: str, limit: int = 60) -> KeywordReport:
-    """Compare a resume against a posting and report coverage."""
+def index_posting(posting: str, limit: int = 60) -> PostingIndex:
+    """Analyze a posting once so it can be matched repeatedly."""
     wanted = extract_terms(posting, limit=limit)
+    requirement_terms = sorted(
+        set(tokenize("\n".join(requirement_lines(posting)))) & set(wanted)
+    )
+    return PostingIndex(terms=wanted, requirement_terms=requirement_terms)
+
+
+def as_posting_index(
+    posting: Union[str, PostingIndex, None], limit: int = 60
+) -> Optional[PostingIndex]:
+    """Index raw posting text, pass an index through, and map "no posting" to None."""
+    if isinstance(posting, PostingIndex):
+        return posting
+    return index_posting(posting, limit) if posting else None
+
+
+def is_phrase(term: str) -> bool:
+    """Whether a term is matched as a substring rather than as a token."""
+    return " " in term or "/" in term
+
+
+def match(
+    resume_text: str, posting: Union[str, PostingIndex], limit: int = 60
+) -> KeywordReport:
+    """Compare a resume against a posting and report coverage.
+
+    ``posting`` may be raw text or a :class:`PostingIndex` built by
+    :func:`index_posting`; ``limit`` only applies to raw text.
+    """
+    index = posting if isinstance(posting, PostingIndex) else index_posting(posting, limit)
+    if not index.terms:
+        return KeywordReport(coverage=1.0, weighted_coverage=1.0)
+    return match_terms(resume_terms(resume_text), index)
+
+
+def resume_terms(resume_text: str) -> Tuple[str, FrozenSet[str]]:
+    """The normalized text and token set a resume's terms are looked up in.
+
+    Computed once, these let :func:`match_terms` check one resume against
+    many postings without reading the resume again for each.
+    """
+    return normalize(resume_text), frozenset(tokenize(resume_text))
+
+
+def match_terms(terms: Tuple[str, FrozenSet[str]], index: PostingIndex) -> KeywordReport:
+    """:func:`match` for a resume already reduced by :func:`resume_terms`."""
+    wanted = index.terms
     if not wanted:
         return KeywordReport(coverage=1.0, weighted_coverage=1.0)
 
-    resume_normalized = normalize(resume_text)
-    resume_tokens = set(tokenize(resume_text))
+    resume_normalized, resume_tokens = terms
 
     def present(term: str) -> bool:
-        if " " in term or "/" in term:
+        if is_phrase(term):
             return term in resume_normalized
         return term in resume_tokens
 
@@ -199,13 +269,10 @@ def match(resume_text: str, posting: str, limit: int = 60) -> KeywordReport:
     for term, weight in wanted.most_common():
         (matched if present(term) else missing).append((term, weight))
 
-    total_weight = sum(wanted.values())
+    total_weight = index.total_weight
     matched_weight = sum(weight for _, weight in matched)
 
-    requirement_terms = sorted(
-        set(tokenize("\n".join(requirement_lines(posting))))
-        & set(wanted)
-    )
+    requirement_terms = list(index.requirement_terms)
     missing_requirements = [t for t in requirement_terms if not present(t)]
 
     return KeywordReport(
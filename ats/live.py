@@ -0,0 +1,182 @@
+"""Match scoring that keeps up with someone typing.
+
+Scoring a whole resume is cheap once. Doing it on every keystroke is not,
+because :func:`ats.keywords.match` re-tokenizes the entire document to learn
+that one word in one paragraph changed. A :class:`LiveSession` instead keeps
+the posting analyzed once and remembers, per paragraph, which of the posting's
+terms that paragraph contains. An edit re-reads only the paragraph it touched
+and adjusts running totals, so the cost of an update is the size of the change,
+not the size of the resume.
+
+Only the posting's own terms are tracked. Coverage is a question about those
+terms, and counting every other word in the resume would cost memory on every
+update for nothing.
+
+Phrases are matched within a paragraph. :func:`~ats.keywords.match` reads the
+document as one string, so a phrase split across a line break ("machine" at
+the end of one paragraph, "learning" opening the next) counts there and not
+here. Nobody writes a skill that way on purpose.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Dict, FrozenSet, List, Sequence, Union
+
+from .extract import ExtractionReport
+from .keywords import (
+    KeywordReport, PostingIndex, index_posting, is_phrase, normalize, tokenize,
+)
+from .score import Scorecard, score_report
+
+OPS = ("replace", "insert", "delete")
+
+
+class LiveSession:
+    """One resume being edited against one posting."""
+
+    def __init__(
+        self, posting: Union[str, PostingIndex], paragraphs: Sequence[str] = ()
+    ) -> None:
+        self.index = posting if isinstance(posting, PostingIndex) else index_posting(posting)
+        self._phrases = [t for t in self.index.terms if is_phrase(t)]
+        self._paragraphs: List[str] = []
+        self._present: List[FrozenSet[str]] = []
+        # How many paragraphs contain each term. A term is matched while its
+        # count is non-zero, which is what lets a delete be undone cheaply.
+        self._holders: Counter = Counter()
+        self._matched_weight = 0
+        for text in paragraphs:
+            self.insert(len(self._paragraphs), text)
+
+    def _terms_in(self, text: str) -> FrozenSet[str]:
+        found = set(tokenize(text)) & self.index.terms.keys()
+        if self._phrases:
+            normalized = normalize(text)
+            found.update(p for p in self._phrases if p in normalized)
+        return frozenset(found)
+
+    def _add(self, terms: FrozenSet[str]) -> None:
+        for term in terms:
+            if not self._holders[term]:
+                self._matched_weight += self.index.terms[term]
+            self._holders[term] += 1
+
+    def _remove(self, terms: FrozenSet[str]) -> None:
+        for term in terms:
+            self._holders[term] -= 1
+            if not self._holders[term]:
+                del self._holders[term]
+                self._matched_weight -= self.index.terms[term]
+
+    def _check_index(self, position: int, upper: int) -> None:
+        if not 0 <= position < upper:
+            raise ValueError(
+                f"paragraph index {position} is out of range for "
+                f"{len(self._paragraphs)} paragraph(s)"
+            )
+
+    def replace(self, position: int, text: str) -> None:
+        """Replace the text of one paragraph."""
+        self._check_index(position, len(self._paragraphs))
+        terms = self._terms_in(text)
+        self._remove(self._present[position])
+        self._add(terms)
+        self._paragraphs[position] = text
+        self._present[position] = terms
+
+    def insert(self, position: int, text: str) -> None:
+        """Insert a paragraph before ``position``; the end is ``len(session)``."""
+        self._check_index(position, len(self._paragraphs) + 1)
+        terms = self._terms_in(text)
+        self._add(terms)
+        self._paragraphs.insert(position, text)
+        self._present.insert(position, terms)
+
+    def delete(self, position: int) -> None:
+        """Remove one paragraph."""
+        self._check_index(position, len(self._paragraphs))
+        self._remove(self._present[position])
+        del self._paragraphs[position]
+        del self._present[position]
+
+    def apply(self, delta: Dict) -> None:
+        """Apply an edit of the form ``{"op": ..., "index": ..., "text": ...}``."""
+        op = delta.get("op")
+        if op not in OPS:
+            raise ValueError(f"unknown op {op!r}; expected one of: {', '.join(OPS)}")
+        try:
+            position = int(delta.get("index"))
+        except (TypeError, ValueError):
+            raise ValueError("an edit needs an integer 'index'") from None
+        if op == "delete":
+            self.delete(position)
+        else:
+            getattr(self, op)(position, str(delta.get("text", "")))
+
+    def __len__(self) -> int:
+        return len(self._paragraphs)
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self._paragraphs)
+
+    @property
+    def coverage(self) -> float:
+        if not self.index.terms:
+            return 1.0
+        return len(self._holders) / len(self.index.terms)
+
+    @property
+    def weighted_coverage(self) -> float:
+        if not self.index.terms:
+            return 1.0
+        total = self.index.total_weight
+        return self._matched_weight / total if total else 0.0
+
+    def report(self) -> KeywordReport:
+        """The current state as a full keyword report, in posting weight order."""
+        if not self.index.terms:
+            return KeywordReport(coverage=1.0, weighted_coverage=1.0)
+        matched, missing = [], []
+        for term, weight in self.index.terms.most_common():
+            (matched if term in self._holders else missing).append((term, weight))
+        return KeywordReport(
+            matched=matched,
+            missing=missing,
+            coverage=self.coverage,
+            weighted_coverage=self.weighted_coverage,
+            requirement_terms=list(self.index.requirement_terms),
+            missing_requirements=[
+                t for t in self.index.requirement_terms if t not in self._holders
+            ],
+        )
+
+    def snapshot(self) -> Dict:
+        """What an editor needs after each keystroke."""
+        report = self.report()
+        return {
+            "paragraphs": len(self._paragraphs),
+            "match_score": report.score,
+            "coverage": round(report.coverage, 4),
+            "weighted_coverage": round(report.weighted_coverage, 4),
+            "matched": len(report.matched),
+            "terms": len(self.index.terms),
+            "top_missing": report.top_missing,
+            "missing_requirements": report.missing_requirements,
+        }
+
+    def scorecard(self) -> Scorecard:
+        """Run the text-level checks over the whole draft.
+
+        This reads every paragraph, so it belongs on a pause in typing rather
+        than on every keystroke. Structural findings (headers, tables, text
+        boxes) need the DOCX itself and are not available from typed text.
+        """
+        text = self.text
+        report = ExtractionReport(
+            ats_text=text,
+            human_text=text,
+            body_paragraphs=sum(1 for p in self._paragraphs if p.strip()),
+        )
+        return score_report(report, self.index)
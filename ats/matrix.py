@@ -0,0 +1,169 @@
+"""Scoring many resumes against many postings.
+
+"Which candidates fit which openings" is a matrix: every resume against every
+posting. Running :func:`~ats.batch.score_many` once per posting extracts every
+resume once per posting, and extraction is nearly all of the cost. The parse
+score does not depend on the posting at all, and matching an already
+extracted text against an already indexed posting is a set lookup per term.
+
+:func:`score_matrix` therefore indexes each posting once, up front, and ships
+the indexes to the workers when the pool starts. Each worker extracts a resume
+once, runs the checks once, tokenizes the text once, and looks its terms up
+in every index. The work grows with resumes plus postings for the expensive
+parts and only the set lookups per term grow with their product.
+
+What comes back per resume is a :class:`MatrixRow`: the parse score and one
+match score per posting, in posting order, and nothing else, so nothing large
+crosses back from the workers.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple, Union
+
+from .batch import ScoreFailure, fan_out
+from .extract import extract
+from .keywords import PostingIndex, as_posting_index, match_terms, resume_terms
+from .score import grade_for, score_report
+
+#: File suffixes read as postings when a directory is given.
+POSTING_SUFFIXES = (".txt", ".md")
+
+
+@dataclass
+class MatrixRow:
+    """One resume's parse score and its match score against each posting."""
+
+    path: str
+    parse_score: int
+    matches: List[int] = field(default_factory=list)
+
+    @property
+    def grade(self) -> str:
+        return grade_for(self.parse_score)
+
+    def to_dict(self, names: Sequence[str]) -> Dict:
+        return {
+            "path": self.path,
+            "parse_score": self.parse_score,
+            "grade": self.grade,
+            "match": dict(zip(names, self.matches)),
+        }
+
+
+def load_postings(inputs: Iterable[str | Path]) -> Dict[str, str]:
+    """Posting text by name, from files and directories of ``.txt``/``.md`` files.
+
+    A posting is named by its file name without the suffix; two postings with
+    the same name are an error, since their columns could not be told apart.
+    """
+    postings: Dict[str, str] = {}
+    for item in inputs:
+        item = Path(item)
+        files = (
+            sorted(p for p in item.iterdir() if p.suffix.lower() in POSTING_SUFFIXES)
+            if item.is_dir() else [item]
+        )
+        for path in files:
+            if path.stem in postings:
+                raise ValueError(f"two postings are named {path.stem!r}")
+            text = path.read_text(encoding="utf-8", errors="replace")
+            if not text.strip():
+                raise ValueError(f"{path} is empty")
+            postings[path.stem] = text
+    if not postings:
+        raise ValueError("no postings found")
+    return postings
+
+
+# Set once per worker process by the pool initializer, like ats.batch does for
+# a single posting.
+_INDEXES: Tuple[PostingIndex, ...] = ()
+
+
+def _init_worker(indexes: Tuple[PostingIndex, ...]) -> None:
+    global _INDEXES
+    _INDEXES = indexes
+
+
+def _row(path: str | Path, indexes: Sequence[PostingIndex]) -> MatrixRow:
+    report = extract(path)
+    terms = resume_terms(report.ats_text)
+    return MatrixRow(
+        path=str(path),
+        parse_score=score_report(report).parse_score,
+        matches=[match_terms(terms, index).score for index in indexes],
+    )
+
+
+def _row_in_worker(path: str) -> MatrixRow:
+    return _row(path, _INDEXES)
+
+
+def score_matrix(
+    paths: Iterable[str | Path],
+    postings: Mapping[str, str | PostingIndex],
+    workers: int | None = None,
+    max_pending: int | None = None,
+    return_exceptions: bool = False,
+) -> Iterator[Union[MatrixRow, ScoreFailure]]:
+    """Score every resume against every posting, one row per resume.
+
+    Rows arrive in completion order and their ``matches`` follow the order of
+    ``postings``. The other arguments behave as in
+    :func:`~ats.batch.score_many`.
+    """
+    indexes = tuple(as_posting_index(posting) for posting in postings.values())
+    if not indexes or None in indexes:
+        raise ValueError("every column of the matrix needs a non-empty posting")
+    return fan_out(
+        paths,
+        local=lambda path: _row(path, indexes),
+        remote=_row_in_worker,
+        workers=workers or os.cpu_count() or 1,
+        max_pending=max_pending,
+        return_exceptions=return_exceptions,
+        initializer=_init_worker,
+        initargs=(indexes,),
+    )
+
+
+def write_matrix(
+    rows: Iterable[Union[MatrixRow, ScoreFailure]],
+    names: Sequence[str],
+    stream: IO[str],
+    fmt: str = "csv",
+) -> Tuple[int, int]:
+    """Write rows as they arrive; returns ``(scored, failed)``.
+
+    CSV has one column per posting after ``path``, ``parse_score`` and
+    ``grade``, and a failed resume gets its error in the ``error`` column.
+    NDJSON has one object per resume, or ``{"path", "error"}`` for a failure.
+    """
+    if fmt not in ("csv", "ndjson"):
+        raise ValueError(f"unknown matrix format {fmt!r}; use csv or ndjson")
+    writer = csv.writer(stream, lineterminator="\n") if fmt == "csv" else None
+    if writer is not None:
+        writer.writerow(["path", "parse_score", "grade", *names, "error"])
+
+    scored = failed = 0
+    for row in rows:
+        if isinstance(row, ScoreFailure):
+            failed += 1
+            if writer is not None:
+                writer.writerow([row.path, "", "", *([""] * len(names)), row.error])
+            else:
+                stream.write(json.dumps({"path": row.path, "error": row.error}) + "\n")
+        else:
+            scored += 1
+            if writer is not None:
+                writer.writerow([row.path, row.parse_score, row.grade, *row.matches, ""])
+            else:
+                stream.write(json.dumps(row.to_dict(names)) + "\n")
+        stream.flush()
+    return scored, failed
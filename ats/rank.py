@@ -0,0 +1,119 @@
+"""Picking the best resumes for one posting out of many.
+
+A recruiter with one opening and ten thousand applications wants the twenty
+that fit best, not ten thousand scorecards to sort by hand. Scoring all of them
+and sorting afterwards holds every scorecard, and every extracted document, in
+memory at once. :func:`rank_resumes` streams :func:`~ats.batch.score_many`
+(one posting index, a pool of workers, bounded work in flight) through a heap
+of size ``k``. A scorecard that misses the top ``k`` is dropped as soon as it
+arrives, and one that makes it is kept without its extracted text, so memory
+grows with ``k`` rather than with the corpus.
+
+Resumes are ordered by match score, then parse score: of two equally matched
+candidates, the one an ATS can actually read ranks first. Remaining ties go to
+the path that sorts first, so the ranking is the same however many workers
+produced it.
+"""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+from .batch import ScoreFailure, Summary, score_many
+from .keywords import PostingIndex, as_posting_index
+from .score import Scorecard
+
+
+@dataclass
+class Ranking:
+    """The top scorecards, best first, and totals over everything scored."""
+
+    top: List[Scorecard] = field(default_factory=list)
+    summary: Summary = field(default_factory=Summary)
+
+    def to_dict(self) -> dict:
+        return {
+            "top": [
+                {"rank": rank, **card.to_dict()} for rank, card in enumerate(self.top, 1)
+            ],
+            "summary": self.summary.to_dict(),
+        }
+
+
+class _Entry:
+    """A heap entry ordered so the weakest candidate sits at the root."""
+
+    __slots__ = ("key", "card")
+
+    def __init__(self, card: Scorecard) -> None:
+        self.key: Tuple[int, int] = (card.match_score, card.parse_score)
+        self.card = card
+
+    def __lt__(self, other: "_Entry") -> bool:
+        if self.key != other.key:
+            return self.key < other.key
+        # Equal scores: the later path is the weaker entry.
+        return self.card.path > other.card.path
+
+
+def _slim(card: Scorecard) -> Scorecard:
+    """Drop the extracted document, keeping its counts."""
+    card.stats = card.extraction_stats
+    card.extraction = None
+    return card
+
+
+def rank_resumes(
+    paths: Iterable[str | Path],
+    job_description: str | PostingIndex,
+    k: int = 10,
+    workers: int | None = None,
+    max_pending: int | None = None,
+) -> Ranking:
+    """Score every path against the posting and keep the best ``k``.
+
+    Files that cannot be scored are counted in the summary and otherwise
+    ignored. ``workers`` and ``max_pending`` are passed to
+    :func:`~ats.batch.score_many`.
+    """
+    if k < 1:
+        raise ValueError(f"k must be at least 1, not {k}")
+    posting = as_posting_index(job_description)
+    if posting is None:
+        raise ValueError("ranking needs a job posting to match against")
+
+    summary = Summary()
+    heap: List[_Entry] = []
+    for result in score_many(
+        paths, posting, workers=workers, max_pending=max_pending, return_exceptions=True
+    ):
+        summary.add(result)
+        if isinstance(result, ScoreFailure):
+            continue
+        entry = _Entry(result)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif heap[0] < entry:
+            heapq.heapreplace(heap, entry)
+        else:
+            continue
+        _slim(result)
+    return Ranking(top=[e.card for e in sorted(heap, reverse=True)], summary=summary)
+
+
+def format_ranking(ranking: Ranking) -> str:
+    """A numbered table of the top resumes, then the totals."""
+    lines = [f"{'rank':>4} {'match':>5} {'parse':>5} {'grade':>5}  path"]
+    for rank, card in enumerate(ranking.top, 1):
+        lines.append(
+            f"{rank:>4} {card.match_score:>5} {card.parse_score:>5} {card.grade:>5}  {card.path}"
+        )
+    summary = ranking.summary
+    lines.append("")
+    lines.append(f"Ranked {summary.scored} resume(s); showing the top {len(ranking.top)}.")
+    if summary.failed:
+        lines.append(f"{summary.failed} file(s) could not be scored.")
+    return "\n".join(lines)
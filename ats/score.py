@@ -21,15 +21,23 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from .checks import Finding, run_all
 from .extract import ExtractionReport, extract
-from .keywords import KeywordReport, match
+from .keywords import KeywordReport, PostingIndex, match
 
 GRADE_BANDS = ((90, "A"), (80, "B"), (70, "C"), (60, "D"), (0, "F"))
 
 
+def grade_for(parse_score: int) -> str:
+    """The letter grade for a parse score."""
+    for threshold, letter in GRADE_BANDS:
+        if parse_score >= threshold:
+            return letter
+    return "F"
+
+
 @dataclass
 class Scorecard:
     """The full result of auditing one resume."""
@@ -39,22 +47,32 @@ class Scorecard:
     keywords: Optional[KeywordReport] = None
     extraction: Optional[ExtractionReport] = None
     path: str = ""
+    # Extraction counts for a card rebuilt without its extraction, such as one
+    # read back from :mod:`ats.serialize`. Ignored while ``extraction`` is set.
+    stats: Optional[Dict[str, int]] = None
 
     @property
     def match_score(self) -> int:
         if self.keywords is None:
             return 0
-        # Weighted coverage dominates: matching the term a posting repeats six
-        # times counts for more than matching six one-off terms.
-        blended = 0.7 * self.keywords.weighted_coverage + 0.3 * self.keywords.coverage
-        return round(100 * blended)
+        return self.keywords.score
 
     @property
     def grade(self) -> str:
-        for threshold, letter in GRADE_BANDS:
-            if self.parse_score >= threshold:
-                return letter
-        return "F"
+        return grade_for(self.parse_score)
+
+    @property
+    def extraction_stats(self) -> Optional[Dict[str, int]]:
+        """Counts describing what the parser read, without the text itself."""
+        if self.extraction is None:
+            return self.stats
+        return {
+            "body_paragraphs": self.extraction.body_paragraphs,
+            "tables": self.extraction.table_count,
+            "images": self.extraction.image_count,
+            "dropped_snippets": len(self.extraction.dropped_text),
+            "parsed_words": len(self.extraction.ats_text.split()),
+        }
 
     @property
     def critical(self) -> List[Finding]:
@@ -90,23 +108,20 @@ class Scorecard:
                 }
                 if self.keywords else None
             ),
-            "extraction": (
-                {
-                    "body_paragraphs": self.extraction.body_paragraphs,
-                    "tables": self.extraction.table_count,
-                    "images": self.extraction.image_count,
-                    "dropped_snippets": len(self.extraction.dropped_text),
-                    "parsed_words": len(self.extraction.ats_text.split()),
-                }
-                if self.extraction else None
-            ),
+            "extraction": self.extraction_stats,
         }
 
 
 def score_report(
-    report: ExtractionReport, job_description: str | None = None, path: str = ""
+    report: ExtractionReport,
+    job_description: str | PostingIndex | None = None,
+    path: str = "",
 ) -> Scorecard:
-    """Score an already-extracted document."""
+    """Score an already-extracted document.
+
+    ``job_description`` may be a prebuilt :class:`PostingIndex`, which is how
+    callers scoring many documents against one posting avoid re-analyzing it.
+    """
     findings = run_all(report)
     parse_score = max(0, 100 - sum(f.penalty for f in findings))
     keywords = (
@@ -122,7 +137,7 @@ def score_report(
 
 
 def score_resume(
-    resume_path: str | Path, job_description: str | None = None
+    resume_path: str | Path, job_description: str | PostingIndex | None = None
 ) -> Scorecard:
     """Audit a DOCX resume, optionally against a job posting."""
     report = extract(resume_path)
@@ -142,14 +157,14 @@ def format_scorecard(card: Scorecard, verbose: bool = False) -> str:
             f"{len(card.keywords.matched) + len(card.keywords.missing)} terms present)"
         )
 
-    if card.extraction:
-        e = card.extraction
+    stats = card.extraction_stats
+    if stats:
         lines.append(
-            f"Parsed {len(e.ats_text.split())} words, {e.body_paragraphs} paragraphs, "
-            f"{e.table_count} tables, {e.image_count} images"
+            f"Parsed {stats['parsed_words']} words, {stats['body_paragraphs']} paragraphs, "
+            f"{stats['tables']} tables, {stats['images']} images"
         )
-        if e.dropped_text:
-            lines.append(f"Text a parser never sees: {len(e.dropped_text)} snippet(s)")
+        if stats["dropped_snippets"]:
+            lines.append(f"Text a parser never sees: {stats['dropped_snippets']} snippet(s)")
 
     if card.findings:
         lines.append("")
@@ -0,0 +1,157 @@
+"""Compact, fast serialization for scorecards.
+
+:meth:`Scorecard.to_dict` is the readable form: long keys, nested dicts, term
+lists cut to thirty. It is what a person reads and what ``/audit/`` has always
+returned. It is also lossy, so it cannot be turned back into a scorecard, and
+building all those dicts for every document is wasted work in batch output.
+
+The compact form is built straight from the dataclasses as tuples under
+one-letter keys, carries everything :func:`unpack` needs to rebuild the
+scorecard exactly, and is versioned so stored output stays readable:
+
+====  ===========================================================
+key   value
+====  ===========================================================
+v     schema version, currently 1
+p     path
+s     parse score
+f     findings, each ``(check, severity, message, evidence, penalty)``
+k     ``(coverage, weighted_coverage, matched, missing,
+      requirement_terms, missing_requirements)`` with matched and
+      missing as ``(term, weight)`` pairs, or null without a posting
+x     ``(body_paragraphs, tables, images, dropped_snippets,
+      parsed_words)``, or null
+====  ===========================================================
+
+JSON is encoded with orjson when it is installed and the standard library
+otherwise; the bytes decode the same either way. MessagePack is optional and
+needs the ``msgpack`` package.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import IO, Any, Dict, Iterable, Tuple
+
+from .checks import Finding
+from .keywords import KeywordReport
+from .score import Scorecard
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised by monkeypatching in tests
+    orjson = None
+
+SCHEMA_VERSION = 1
+
+STAT_KEYS: Tuple[str, ...] = (
+    "body_paragraphs", "tables", "images", "dropped_snippets", "parsed_words",
+)
+
+
+def pack(card: Scorecard) -> Dict[str, Any]:
+    """The compact form of a scorecard, ready for any encoder."""
+    keywords = card.keywords
+    stats = card.extraction_stats
+    return {
+        "v": SCHEMA_VERSION,
+        "p": card.path,
+        "s": card.parse_score,
+        "f": [
+            (f.check, f.severity, f.message, f.evidence, f.penalty)
+            for f in card.findings
+        ],
+        "k": (
+            (
+                keywords.coverage,
+                keywords.weighted_coverage,
+                keywords.matched,
+                keywords.missing,
+                keywords.requirement_terms,
+                keywords.missing_requirements,
+            )
+            if keywords is not None else None
+        ),
+        "x": tuple(stats[key] for key in STAT_KEYS) if stats else None,
+    }
+
+
+def unpack(data: Dict[str, Any]) -> Scorecard:
+    """Rebuild a scorecard from its compact form."""
+    version = data.get("v") if isinstance(data, dict) else None
+    if version != SCHEMA_VERSION:
+        raise ValueError(
+            f"not a compact scorecard (schema version {version!r}, "
+            f"expected {SCHEMA_VERSION})"
+        )
+    keywords = None
+    if data["k"] is not None:
+        coverage, weighted, matched, missing, requirements, missing_req = data["k"]
+        keywords = KeywordReport(
+            matched=[(term, weight) for term, weight in matched],
+            missing=[(term, weight) for term, weight in missing],
+            coverage=coverage,
+            weighted_coverage=weighted,
+            requirement_terms=list(requirements),
+            missing_requirements=list(missing_req),
+        )
+    return Scorecard(
+        parse_score=data["s"],
+        findings=[Finding(*fields) for fields in data["f"]],
+        keywords=keywords,
+        path=data["p"],
+        stats=dict(zip(STAT_KEYS, data["x"])) if data["x"] is not None else None,
+    )
+
+
+def _encode(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _decode(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def to_json(card: Scorecard, compact: bool = False) -> bytes:
+    """Encode a scorecard as JSON: the readable form, or the compact one."""
+    return _encode(pack(card) if compact else card.to_dict())
+
+
+def from_json(data: bytes | str) -> Scorecard:
+    """Decode a scorecard written by ``to_json(card, compact=True)``."""
+    return unpack(_decode(data))
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError(
+            "MessagePack output needs the msgpack package: pip install msgpack"
+        ) from None
+    return msgpack
+
+
+def to_msgpack(card: Scorecard) -> bytes:
+    """Encode a scorecard's compact form as MessagePack."""
+    return _msgpack().packb(pack(card), use_bin_type=True)
+
+
+def from_msgpack(data: bytes) -> Scorecard:
+    """Decode a scorecard written by :func:`to_msgpack`."""
+    return unpack(_msgpack().unpackb(data, raw=False))
+
+
+def write_ndjson(
+    cards: Iterable[Scorecard], stream: IO[bytes], compact: bool = True
+) -> int:
+    """Write one scorecard per line as each arrives, returning the count."""
+    written = 0
+    for card in cards:
+        stream.write(to_json(card, compact=compact) + b"\n")
+        written += 1
+    return written
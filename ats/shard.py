@@ -0,0 +1,135 @@
+"""Splitting a batch run across machines, and putting the results back together.
+
+A corpus too big for one machine is scored by several, each running
+``ats score --shard i/N`` over the same inputs. Every node decides for itself
+which files are its own, with no coordinator: a file belongs to shard
+``hash(key) mod N``, where the key is the path as typed or the SHA-256 of the
+file's bytes. Either way the assignment is the same on every node and every
+run, so the shards are disjoint and together cover the corpus.
+
+Hashing paths needs nothing but the listing, so it is the default; it assumes
+every node names the files the same way (run from the same relative
+directory). Hashing content survives different mount points and renames, at
+the cost of every node reading every file once.
+
+:func:`merge_outputs` reads the shards' NDJSON back and recomputes one
+:class:`~ats.batch.Summary` from the per-resume lines, so grade counts, means
+and finding statistics come out exactly as a single-node run would report
+them. The summary line each shard wrote says which shard it was, and a merge
+that is missing a shard, or has one twice, is refused rather than reported as
+a smaller corpus.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import PurePath
+from typing import IO, TYPE_CHECKING, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from .history import file_digest
+
+if TYPE_CHECKING:  # ats.batch pulls in python-docx; this module stays light
+    from .batch import Summary
+
+SHARD_KEYS = ("path", "content")
+
+
+def parse_shard(text: str) -> Tuple[int, int]:
+    """``"2/8"`` as ``(2, 8)``; shards are numbered from 1."""
+    try:
+        index, count = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise ValueError(f"--shard takes I/N, such as 1/4, not {text!r}") from None
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"shard {text} is out of range; use 1/N through N/N")
+    return index, count
+
+
+def shard_of(path: str, count: int, by: str = "path") -> int:
+    """The shard, from 1 to ``count``, that ``path`` belongs to."""
+    if by not in SHARD_KEYS:
+        raise ValueError(f"unknown shard key {by!r}; use one of: {', '.join(SHARD_KEYS)}")
+    key = PurePath(path).as_posix()
+    if by == "content":
+        try:
+            key = file_digest(path)
+        except OSError:
+            # Fall back to the path, so exactly one shard reports the error.
+            pass
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+def select_shard(
+    paths: Iterable[str], index: int, count: int, by: str = "path"
+) -> Iterator[str]:
+    """The paths that belong to shard ``index`` of ``count``, lazily."""
+    for path in paths:
+        if shard_of(str(path), count, by) == index:
+            yield path
+
+
+def _add_line(summary: "Summary", line: Dict) -> None:
+    from .batch import ScoreFailure
+    from .serialize import unpack
+
+    if "error" in line:
+        summary.add(ScoreFailure(path=line["path"], error=line["error"]))
+    elif "v" in line:  # compact scorecard
+        summary.add(unpack(line))
+    else:  # readable scorecard
+        summary.add_scores(
+            line["parse_score"],
+            line["match_score"],
+            [(f["check"], f["severity"]) for f in line["findings"]],
+        )
+
+
+def merge_outputs(
+    streams: Iterable[IO[str]], min_score: Optional[int] = None
+) -> Dict:
+    """One summary over the NDJSON written by several ``ats score`` runs.
+
+    Raises :class:`ValueError` for a resume that appears in two outputs, or
+    when the outputs name their shards and one is missing or repeated.
+    """
+    from .batch import Summary
+
+    summary = Summary(min_score=min_score)
+    seen: Set[str] = set()
+    shards: Dict[int, int] = {}
+    counts: Set[int] = set()
+    for stream in streams:
+        for number, raw in enumerate(stream, 1):
+            if not raw.strip():
+                continue
+            try:
+                line = json.loads(raw)
+            except ValueError as exc:
+                name = getattr(stream, "name", "input")
+                raise ValueError(f"{name}, line {number}: not JSON ({exc})") from None
+            if "summary" in line:
+                shard = line["summary"].get("shard")
+                if shard:
+                    shards[shard["index"]] = shards.get(shard["index"], 0) + 1
+                    counts.add(shard["count"])
+                continue
+            path = line.get("path") if "v" not in line else line["p"]
+            if path in seen:
+                raise ValueError(f"{path} appears in more than one output")
+            seen.add(path)
+            _add_line(summary, line)
+
+    if shards:
+        if len(counts) != 1:
+            raise ValueError(f"the outputs come from different splits: {sorted(counts)}")
+        (count,) = counts
+        repeated = sorted(i for i, n in shards.items() if n > 1)
+        missing = sorted(set(range(1, count + 1)) - set(shards))
+        if repeated:
+            raise ValueError(f"shard(s) {repeated} of {count} appear more than once")
+        if missing:
+            raise ValueError(f"shard(s) {missing} of {count} are missing")
+
+    return summary.to_dict()
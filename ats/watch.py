@@ -0,0 +1,279 @@
+"""Rescoring a folder of resumes as they are saved.
+
+Someone iterating on a resume in Word saves every few seconds and wants to
+know, each time, whether the last edit helped. Rescoring the whole folder on
+every save wastes most of its work, and reacting to every filesystem event
+would rescore the same file three times per save, because Word writes a
+temporary file, renames it and touches it again.
+
+:class:`Watcher` keeps a ``(mtime, size, sha256)`` record per file. A file is
+hashed only when its mtime or size moves, and rescored only when its hash
+does, so opening a document or re-saving it unchanged costs a ``stat``. Bursts
+of events are debounced: after the first one, nothing happens until the
+folder has been quiet for a moment. What comes out is a stream of events, each
+carrying the new scores and what changed since the previous version.
+
+Changes are noticed through inotify on Linux and by polling everywhere else.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .batch import expand_paths
+from .compare import compare_scorecards
+from .history import file_digest
+from .keywords import PostingIndex, as_posting_index
+from .score import Scorecard, score_resume
+
+Event = Dict
+Stat = Tuple[int, int]
+
+# inotify(7) event bits: a file finished writing, was moved in or out, created
+# or deleted. Word's save-as-rename shows up as a move.
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+# struct inotify_event: wd, mask, cookie and name length, then the name.
+_EVENT = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Just enough of inotify, through libc, to wake up when a directory changes."""
+
+    def __init__(self, libc, fd: int) -> None:
+        self._libc = libc
+        self.fd = fd
+        # Watched directories and their watch descriptors, both ways round.
+        self._watched: Dict[str, int] = {}
+        self._paths: Dict[int, str] = {}
+
+    @classmethod
+    def create(cls) -> Optional["_Inotify"]:
+        """An inotify instance, or None where the platform has none."""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        return cls(libc, fd) if fd >= 0 else None
+
+    def watch_tree(self, root: str | Path) -> None:
+        """Watch ``root`` and every directory under it not yet watched."""
+        for directory, _, _ in os.walk(root):
+            if directory not in self._watched:
+                wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+                if wd >= 0:
+                    self._watched[directory] = wd
+                    self._paths[wd] = directory
+
+    def _forget(self, directory: str) -> None:
+        """Drop ``directory`` and everything under it, so it is watched anew if it returns."""
+        prefix = directory + os.sep
+        for path in [p for p in self._watched if p == directory or p.startswith(prefix)]:
+            wd = self._watched.pop(path)
+            if self._paths.get(wd) == path:
+                del self._paths[wd]
+
+    def wait(self, timeout: float) -> bool:
+        """Block until events arrive or ``timeout`` passes; True if any arrived.
+
+        The events are read only to forget directories deleted or moved
+        away: the watcher rescans with ``stat``, which is cheap, instead of
+        trusting event names for files.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        data = b""
+        try:
+            while True:
+                chunk = os.read(self.fd, 64 * 1024)
+                if not chunk:
+                    break
+                data += chunk
+        except BlockingIOError:
+            pass
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size:offset + _EVENT.size + length].split(b"\0", 1)[0]
+            offset += _EVENT.size + length
+            if mask & IN_ISDIR and mask & (IN_DELETE | IN_MOVED_FROM) and wd in self._paths:
+                self._forget(os.path.join(self._paths[wd], os.fsdecode(name)))
+        return True
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class Watcher:
+    """Scores every resume under a directory, then again whenever one changes.
+
+    :meth:`poll_once` does one scan-and-rescore pass and returns its events;
+    :meth:`run` loops until stopped, waiting for changes in between.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        job_description: str | PostingIndex | None = None,
+        debounce: float = 0.3,
+        poll_interval: float = 1.0,
+    ) -> None:
+        self.directory = str(directory)
+        self.posting = as_posting_index(job_description)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._stats: Dict[str, Stat] = {}
+        self._digests: Dict[str, str] = {}
+        self._cards: Dict[str, Scorecard] = {}
+
+    def _signature(self) -> Dict[str, Stat]:
+        signature: Dict[str, Stat] = {}
+        for path in expand_paths([self.directory]):
+            try:
+                info = os.stat(path)
+            except OSError:  # deleted between listing and stat
+                continue
+            signature[path] = (info.st_mtime_ns, info.st_size)
+        return signature
+
+    def poll_once(self) -> List[Event]:
+        """Rescore what changed since the last pass; return one event per file."""
+        events: List[Event] = []
+        signature = self._signature()
+
+        for path in sorted(set(self._stats) - set(signature)):
+            del self._stats[path]
+            self._cards.pop(path, None)
+            self._digests.pop(path, None)
+            events.append({"event": "removed", "path": path})
+
+        for path, stat in signature.items():
+            if self._stats.get(path) == stat:
+                continue
+            try:
+                digest = file_digest(path)
+            except OSError:
+                continue
+            self._stats[path] = stat
+            if self._digests.get(path) == digest:
+                continue  # touched or re-saved, same bytes
+            events.append(self._rescore(path, digest))
+        return events
+
+    def _rescore(self, path: str, digest: str) -> Event:
+        # Recorded whether or not scoring works: a broken file is reported
+        # once, and tried again when its bytes change.
+        self._digests[path] = digest
+        try:
+            card = score_resume(path, self.posting)
+        except Exception as exc:  # noqa: BLE001
+            return {"event": "error", "path": path, "error": f"{type(exc).__name__}: {exc}"}
+
+        previous = self._cards.get(path)
+        self._cards[path] = card
+        event: Event = {
+            "event": "changed" if previous else "scored",
+            "path": path,
+            "parse_score": card.parse_score,
+            "grade": card.grade,
+            "match_score": card.match_score if card.keywords is not None else None,
+        }
+        if previous is not None:
+            delta = compare_scorecards(previous, card)
+            event["delta"] = {
+                "parse_score": delta.parse_delta,
+                "match_score": delta.match_delta,
+                "fixed": [str(f) for f in delta.removed],
+                "introduced": [str(f) for f in delta.added],
+            }
+        return event
+
+    def run(
+        self,
+        emit: Callable[[Event], None],
+        stop: threading.Event | None = None,
+        use_inotify: bool = True,
+    ) -> None:
+        """Score everything, then rescore on change until ``stop`` is set."""
+        stop = stop or threading.Event()
+        # Watch before the first pass, so a save made while it runs still
+        # wakes the loop afterwards.
+        notifier = _Inotify.create() if use_inotify else None
+        if notifier is not None:
+            notifier.watch_tree(self.directory)
+        # Likewise, polling compares against the folder as it was before the
+        # first pass, not after it.
+        last = self._signature() if notifier is None else {}
+        try:
+            for event in self.poll_once():
+                emit(event)
+            while not stop.is_set():
+                if notifier is not None:
+                    if not notifier.wait(self.poll_interval):
+                        continue
+                    while notifier.wait(self.debounce) and not stop.is_set():
+                        pass
+                    # A new directory only appears with an event, so the
+                    # tree is walked again after one, never while idle.
+                    notifier.watch_tree(self.directory)
+                else:
+                    if stop.wait(self.poll_interval):
+                        break
+                    current = self._signature()
+                    if current == last:
+                        continue
+                    # Settle: keep looking until two scans a debounce apart agree.
+                    while not stop.wait(self.debounce):
+                        settled = self._signature()
+                        if settled == current:
+                            break
+                        current = settled
+                    last = current
+                for event in self.poll_once():
+                    emit(event)
+        finally:
+            if notifier is not None:
+                notifier.close()
+
+
+def format_event(event: Event) -> str:
+    """One line per event, plus the findings a change fixed or introduced."""
+    name = os.path.basename(event["path"])
+    kind = event["event"]
+    if kind == "removed":
+        return f"{name}: removed"
+    if kind == "error":
+        return f"{name}: could not score ({event['error']})"
+
+    line = f"{name}: parse {event['parse_score']} ({event['grade']})"
+    delta = event.get("delta")
+    if delta:
+        line += f" {delta['parse_score']:+d}"
+    if event["match_score"] is not None:
+        line += f", match {event['match_score']}"
+        if delta and delta["match_score"] is not None:
+            line += f" {delta['match_score']:+d}"
+    lines = [line]
+    if delta:
+        lines += [f"  fixed: {finding}" for finding in delta["fixed"]]
+        lines += [f"  introduced: {finding}" for finding in delta["introduced"]]
+    return "\n".join(lines)
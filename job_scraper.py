@@ -22,6 +22,11 @@ from PIL import Image, ImageDraw, ImageFont
 from webdriver_manager.chrome import ChromeDriverManager
 
 
+# Connect and read timeouts for fetching a posting. Without them one job site
+# that never answers holds the job forever.
+FETCH_TIMEOUT = (5, 20)
+
+
 class JobPostingScraper:
     """Scrapes job posting text from a given URL."""
     
@@ -73,7 +78,9 @@ class JobPostingScraper:
             dict: Dictionary with company, job_title, and job_text keys
         """
         try:
-            response = requests.get(url, headers={"User-Agent": self.user_agent})
+            response = requests.get(
+                url, headers={"User-Agent": self.user_agent}, timeout=FETCH_TIMEOUT
+            )
             response.raise_for_status()
         except requests.RequestException as e:
             self.logger.error(f"Failed to fetch job posting: {e}")
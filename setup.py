@@ -25,6 +25,10 @@ setup(
         # its own means the free, offline half of the tool carries no
         # dependency on OpenAI, Selenium, or a web server.
         "audit": ["python-docx>=0.8.11"],
+        # Faster scorecard encoding. Both are optional: without orjson the
+        # standard library encodes the same bytes more slowly, and msgpack is
+        # only needed for MessagePack output.
+        "fast": ["orjson", "msgpack"],
     },
     entry_points={
         "console_scripts": [
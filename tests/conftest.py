@@ -39,6 +39,21 @@ mock_job_scraper.JobPostingScraper = MockJobPostingScraper
 # Mock the job_scraper module by default
 sys.modules['job_scraper'] = mock_job_scraper
 
+@pytest.fixture(autouse=True)
+def no_ats_daemon(monkeypatch):
+    """Keep a developer's running ``ats serve`` from answering CLI tests."""
+    monkeypatch.setenv("ATS_NO_DAEMON", "1")
+
+
+@pytest.fixture(scope="session")
+def corpus(tmp_path_factory):
+    """The fixture resumes from ``ats.fixtures``, built once for the whole run."""
+    from ats.fixtures import build_all
+    target = tmp_path_factory.mktemp("corpus")
+    build_all(target)
+    return target
+
+
 @pytest.fixture
 def client():
     """Create a test client for the FastAPI app."""
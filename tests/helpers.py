@@ -0,0 +1,9 @@
+"""
+Helpers shared by the ATS tests.
+"""
+from pathlib import Path
+
+
+def docx_paths(directory) -> list:
+    """The .docx files directly in ``directory``, as sorted path strings."""
+    return sorted(str(p) for p in Path(directory).glob("*.docx"))
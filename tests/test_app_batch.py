@@ -0,0 +1,131 @@
+"""
+Unit tests for the batch audit endpoint.
+"""
+import io
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from ats.fixtures import JOB_POSTING, build_all
+
+
+class TestAuditBatch(unittest.TestCase):
+    """Test cases for POST /audit/batch/."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.expected = build_all(cls.temp_dir.name)
+        cls.names = sorted(f"{name}.docx" for name in cls.expected)
+        cls.client = TestClient(app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def _read(self, name):
+        with open(os.path.join(self.temp_dir.name, name), "rb") as handle:
+            return handle.read()
+
+    def _post(self, files, **kwargs):
+        response = self.client.post("/audit/batch/", files=files, **kwargs)
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertTrue(response.headers["content-type"].startswith("application/x-ndjson"))
+        return [json.loads(line) for line in response.text.splitlines()]
+
+    def test_multiple_files_stream_one_line_each_and_a_summary(self):
+        """Every upload gets a scorecard line, and the last line sums them up."""
+        files = [("files", (name, self._read(name))) for name in self.names]
+        lines = self._post(files, data={"job_description": JOB_POSTING})
+        cards, summary = lines[:-1], lines[-1]["summary"]
+        self.assertEqual(sorted(card["path"] for card in cards), self.names)
+        self.assertTrue(all(card["match_score"] is not None for card in cards))
+        self.assertEqual(summary["scored"], len(self.names))
+        clean = next(card for card in cards if card["path"] == "clean.docx")
+        self.assertEqual(clean["parse_score"], 100)
+
+    def test_zip_archives_are_unpacked_and_bad_entries_reported_inline(self):
+        """Resumes inside a zip are scored; everything else becomes an error line."""
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as bundle:
+            bundle.writestr("batch/clean.docx", self._read("clean.docx"))
+            bundle.writestr("batch/notes.txt", "not a resume")
+            bundle.writestr("batch/~$clean.docx", b"lock file")
+            bundle.writestr("batch/broken.docx", b"PK\x03\x04 not really")
+        files = [
+            ("files", ("applicants.zip", archive.getvalue())),
+            ("files", ("cover.pdf", b"%PDF-1.4")),
+        ]
+        lines = self._post(files, params={"format": "compact"})
+        by_path = {line.get("path") or line.get("p"): line for line in lines[:-1]}
+        self.assertEqual(by_path["applicants.zip/batch/clean.docx"]["s"], 100)
+        self.assertIn("error", by_path["applicants.zip/batch/notes.txt"])
+        self.assertIn("error", by_path["applicants.zip/batch/broken.docx"])
+        self.assertIn("error", by_path["cover.pdf"])
+        self.assertNotIn("applicants.zip/batch/~$clean.docx", by_path)
+        self.assertEqual(lines[-1]["summary"]["scored"], 1)
+        self.assertEqual(lines[-1]["summary"]["failed"], 3)
+
+    def test_direct_parts_count_against_the_batch_budget(self):
+        """A direct .docx part that would take the batch past its budget is refused."""
+        clean = self._read("clean.docx")
+        files = [
+            ("files", ("first.docx", clean)),
+            ("files", ("second.docx", clean)),
+        ]
+        with patch("app.routes.BATCH_MAX_EXPANDED_BYTES", len(clean) + 1):
+            lines = self._post(files)
+        errors = {line["path"]: line["error"] for line in lines[:-1] if "error" in line}
+        self.assertEqual(list(errors), ["second.docx"])
+        self.assertIn("unpacks to more", errors["second.docx"])
+
+    def test_unreadable_zip_and_unknown_format(self):
+        """A corrupt archive is an inline error; an unknown format is a 400."""
+        lines = self._post([("files", ("broken.zip", b"not a zip"))])
+        self.assertEqual(lines[0], {"path": "broken.zip", "error": "Not a readable zip archive."})
+        response = self.client.post(
+            "/audit/batch/?format=msgpack",
+            files=[("files", ("clean.docx", self._read("clean.docx")))],
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+    def test_direct_parts_and_zip_entries_are_checked_before_scoring(self):
+        """Fake .docx parts, compression bombs and an over-budget batch are refused inline."""
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as bundle:
+            bundle.writestr("bomb.docx", b"\0" * (10 * 1024 * 1024))
+            bundle.writestr("clean.docx", self._read("clean.docx"))
+        files = [
+            ("files", ("fake.docx", b"%PDF-1.4 renamed")),
+            ("files", ("applicants.zip", archive.getvalue())),
+        ]
+        with patch("app.routes.BATCH_MAX_EXPANDED_BYTES", 1024):
+            lines = self._post(files)
+        errors = {line["path"]: line["error"] for line in lines[:-1]}
+        self.assertIn("not a .docx", errors["fake.docx"])
+        self.assertIn("Compressed", errors["applicants.zip/bomb.docx"])
+        self.assertIn("unpacks to more", errors["applicants.zip/clean.docx"])
+        self.assertEqual(lines[-1]["summary"]["failed"], 3)
+
+    def test_direct_parts_count_against_the_batch_budget(self):
+        """A direct .docx part that would take the batch past its budget is refused."""
+        clean = self._read("clean.docx")
+        files = [
+            ("files", ("first.docx", clean)),
+            ("files", ("second.docx", clean)),
+        ]
+        with patch("app.routes.BATCH_MAX_EXPANDED_BYTES", len(clean) + 1):
+            lines = self._post(files)
+        errors = {line["path"]: line["error"] for line in lines[:-1] if "error" in line}
+        self.assertEqual(list(errors), ["second.docx"])
+        self.assertIn("unpacks to more", errors["second.docx"])
+
+if __name__ == '__main__':
+    unittest.main()
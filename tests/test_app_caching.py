@@ -20,6 +20,15 @@ class TestAppCaching(unittest.TestCase):
         # Apply the cache decorator
         self.cached_func = timed_cache(seconds=1)(self.mock_func)
     
+    @staticmethod
+    def _run(coro):
+        """Run on a private loop, leaving the thread's current loop alone."""
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
     def test_cache_decorator(self):
         """Test the timed cache decorator."""
         # Run the test in an event loop
@@ -56,5 +65,98 @@ class TestAppCaching(unittest.TestCase):
         self.mock_func.assert_called_once_with("arg1", kwarg1="value1")
 
 
+    def test_concurrent_misses_share_one_call(self):
+        """Callers that miss together wait on a single call."""
+        calls = []
+
+        async def slow(key):
+            calls.append(key)
+            await asyncio.sleep(0.05)
+            return key.upper()
+
+        cached = timed_cache(seconds=60)(slow)
+
+        async def scenario():
+            return await asyncio.gather(*(cached("models") for _ in range(5)))
+
+        self.assertEqual(self._run(scenario()), ["MODELS"] * 5)
+        self.assertEqual(calls, ["models"])
+
+    def test_stale_result_is_served_while_refreshing(self):
+        """Past expiry, the old result comes back at once and one refresh runs."""
+        results = iter(["old", "new"])
+
+        async def fetch():
+            return next(results)
+
+        cached = timed_cache(seconds=0.05, stale=60)(fetch)
+
+        async def scenario():
+            first = await cached()
+            await asyncio.sleep(0.06)
+            stale = await cached()
+            await asyncio.sleep(0.005)  # let the refresh finish
+            return first, stale, await cached()
+
+        self.assertEqual(self._run(scenario()), ("old", "old", "new"))
+
+    def test_failed_refresh_keeps_the_stale_result(self):
+        fail = False
+
+        async def fetch():
+            if fail:
+                raise RuntimeError("API down")
+            return "good"
+
+        cached = timed_cache(seconds=0.01, stale=60)(fetch)
+
+        async def scenario():
+            nonlocal fail
+            await cached()
+            fail = True
+            await asyncio.sleep(0.02)
+            with self.assertLogs(level="WARNING"):
+                stale = await cached()
+                await asyncio.sleep(0.005)
+            return stale, await cached()
+
+        self.assertEqual(self._run(scenario()), ("good", "good"))
+
+    def test_invalidate_and_clear(self):
+        """Dropping an entry makes the next call fetch again."""
+        self.mock_func.return_value = "test_result"
+
+        async def scenario():
+            await self.cached_func("a")
+            await self.cached_func("b")
+            self.cached_func.invalidate("a")
+            await self.cached_func("a")
+            await self.cached_func("b")
+            self.assertEqual(self.mock_func.await_count, 3)
+            self.cached_func.cache_clear()
+            await self.cached_func("b")
+            self.assertEqual(self.mock_func.await_count, 4)
+
+        self._run(scenario())
+
+    def test_clear_model_cache_forces_a_fetch(self):
+        """force_refresh used to reset an attribute the cache never read."""
+        from app import services
+
+        client = AsyncMock()
+        client.models.list.return_value.data = []
+        with patch("app.services.AsyncOpenAI", return_value=client):
+            async def scenario():
+                await services.fetch_openai_models("sk-test")
+                await services.fetch_openai_models("sk-test")
+                services.clear_model_cache("sk-test")
+                await services.fetch_openai_models("sk-test")
+
+            self._run(scenario())
+        services.clear_model_cache()
+        self.assertEqual(client.models.list.await_count, 2)
+        # Every client is closed once its fetch is done.
+        self.assertEqual(client.close.await_count, 2)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""
+Unit tests for conditional and ranged downloads.
+"""
+import hashlib
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.downloads import IMMUTABLE, REVALIDATE, parse_range
+from app.main import app
+
+
+class TestDownloads(unittest.TestCase):
+    """Test cases for validators, 304s and Range on /download."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.content = bytes(range(256)) * 40
+        with open(os.path.join(self.temp_dir.name, "bundle.zip"), "wb") as f:
+            f.write(self.content)
+        self.patch = patch("app.routes.OUTPUT_DIR", self.temp_dir.name)
+        self.patch.start()
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.patch.stop()
+        self.temp_dir.cleanup()
+
+    def _get(self, headers=None, url="/download/bundle.zip"):
+        return self.client.get(url, headers=headers or {})
+
+    def test_etag_is_the_content_hash(self):
+        response = self._get()
+        self.assertEqual(response.content, self.content)
+        self.assertEqual(
+            response.headers["etag"], f'"{hashlib.sha256(self.content).hexdigest()}"'
+        )
+        self.assertEqual(response.headers["accept-ranges"], "bytes")
+        self.assertEqual(response.headers["cache-control"], REVALIDATE)
+
+    def test_matching_validators_get_304(self):
+        first = self._get()
+        by_etag = self._get({"If-None-Match": first.headers["etag"]})
+        by_date = self._get({"If-Modified-Since": first.headers["last-modified"]})
+        for response in (by_etag, by_date):
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.content, b"")
+            self.assertEqual(response.headers["etag"], first.headers["etag"])
+
+        stale = self._get({"If-None-Match": '"something-else"'})
+        self.assertEqual(stale.status_code, 200)
+
+    def test_range_returns_just_those_bytes(self):
+        response = self._get({"Range": "bytes=100-199"})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.content, self.content[100:200])
+        self.assertEqual(
+            response.headers["content-range"], f"bytes 100-199/{len(self.content)}"
+        )
+
+        tail = self._get({"Range": "bytes=-10"})
+        self.assertEqual(tail.content, self.content[-10:])
+
+    def test_range_past_the_end_is_416(self):
+        response = self._get({"Range": f"bytes={len(self.content)}-"})
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response.headers["content-range"], f"bytes */{len(self.content)}")
+
+    def test_if_range_with_an_old_etag_sends_everything(self):
+        response = self._get({"Range": "bytes=0-9", "If-Range": '"old"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, self.content)
+
+    def test_content_addressed_url_is_immutable(self):
+        etag = self._get().headers["etag"].strip('"')
+        response = self._get(url=f"/download/bundle.zip?v={etag}")
+        self.assertEqual(response.headers["cache-control"], IMMUTABLE)
+
+    def test_result_page_links_to_the_content_addressed_bundle(self):
+        from app.state import jobs_db
+
+        bundle = os.path.join(self.temp_dir.name, "bundle.zip")
+        jobs_db["job_v"] = {"download": bundle}
+        try:
+            page = self.client.get("/result?job_id=job_v&download_url=/jobs/job_v/download")
+        finally:
+            del jobs_db["job_v"]
+        etag = hashlib.sha256(self.content).hexdigest()
+        self.assertIn(f"/jobs/job_v/download?v={etag}", page.text)
+
+    def test_etag_cache_keeps_one_entry_per_file(self):
+        from app import downloads
+
+        path = os.path.join(self.temp_dir.name, "bundle.zip")
+        self._get()
+        entries = len(downloads._etags)
+        with open(path, "ab") as f:
+            f.write(b"more")
+        self._get()
+        self.assertEqual(len(downloads._etags), entries)
+        self.assertEqual(
+            downloads._etags[path][1], f'"{hashlib.sha256(self.content + b"more").hexdigest()}"'
+        )
+
+    def test_parse_range(self):
+        self.assertEqual(parse_range("bytes=0-", 10), (0, 9))
+        self.assertEqual(parse_range("bytes=5-100", 10), (5, 9))
+        self.assertEqual(parse_range("bytes=-20", 10), (0, 9))
+        self.assertIsNone(parse_range("bytes=0-1,4-5", 10))
+        self.assertIsNone(parse_range("items=0-1", 10))
+        with self.assertRaises(ValueError):
+            parse_range("bytes=10-", 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Unit tests for pushed job progress.
+"""
+import asyncio
+import json
+import threading
+import unittest
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.progress import ProgressHub, progress_hub
+from app.state import jobs_db, progress_status
+from app.tasks import report_progress
+
+
+class TestProgressHub(unittest.TestCase):
+    """Test cases for ProgressHub and the progress socket."""
+
+    def setUp(self):
+        self.hub = ProgressHub()
+
+    def tearDown(self):
+        jobs_db.clear()
+        progress_status.clear()
+
+    def test_publish_numbers_updates_per_job(self):
+        first = self.hub.publish("a", 10, "rewriting resume")
+        second = self.hub.publish("a", 60, "writing recommendations")
+        other = self.hub.publish("b", 10, "rewriting resume")
+        self.assertEqual((first["version"], second["version"], other["version"]), (1, 2, 1))
+        self.assertEqual(self.hub.latest("a")["stage"], "writing recommendations")
+        self.assertIsInstance(second["time"], float)
+
+    def test_wait_returns_a_newer_update_at_once(self):
+        self.hub.publish("a", 10, "rewriting resume")
+        update = asyncio.run(self.hub.wait("a", after=0, timeout=0.01))
+        self.assertEqual(update["progress"], 10)
+
+    def test_wait_times_out_without_news(self):
+        self.hub.publish("a", 10, "rewriting resume")
+        self.assertIsNone(asyncio.run(self.hub.wait("a", after=1, timeout=0.01)))
+        self.assertEqual(self.hub._waiters, {})
+
+    def test_publish_from_a_worker_thread_wakes_the_loop(self):
+        """Jobs run in the threadpool; their updates still reach async waiters."""
+        async def scenario():
+            waiting = asyncio.ensure_future(self.hub.wait("a", timeout=5))
+            await asyncio.sleep(0)
+            threading.Thread(target=self.hub.publish, args=("a", 85, "auditing")).start()
+            return await waiting
+
+        self.assertEqual(asyncio.run(scenario())["stage"], "auditing")
+
+    def test_updates_end_when_the_job_does(self):
+        async def scenario():
+            seen = []
+            async for update in self.hub.updates("a"):
+                seen.append(update["progress"])
+                if len(seen) == 1:
+                    self.hub.publish("a", -1, "failed")
+            return seen
+
+        self.hub.publish("a", 10, "rewriting resume")
+        self.assertEqual(asyncio.run(scenario()), [10, -1])
+
+    def test_socket_pushes_each_change_and_closes_when_done(self):
+        report_progress("job_ws", 10, "rewriting resume")
+        with TestClient(app).websocket_connect("/ws/progress/job_ws") as socket:
+            first = socket.receive_json()
+            self.assertEqual((first["progress"], first["stage"]), (10, "rewriting resume"))
+            threading.Thread(target=report_progress, args=("job_ws", 100, "done")).start()
+            last = socket.receive_json()
+        self.assertEqual((last["progress"], last["stage"]), (100, "done"))
+        self.assertEqual(last["version"], first["version"] + 1)
+
+    def test_socket_reports_an_unknown_job(self):
+        with TestClient(app).websocket_connect("/ws/progress/nobody") as socket:
+            self.assertEqual(socket.receive_json()["error"], "Job not found")
+
+    def test_report_progress_records_state(self):
+        report_progress("job_state", 60, "writing recommendations")
+        self.assertEqual(progress_status["job_state"], 60)
+        self.assertEqual(jobs_db["job_state"]["stage"], "writing recommendations")
+        self.assertEqual(progress_hub.latest("job_state")["progress"], 60)
+
+
+    def test_status_answers_with_an_etag(self):
+        report_progress("job_poll", 10, "rewriting resume")
+        client = TestClient(app)
+        response = client.get("/jobs/job_poll/status")
+        self.assertEqual(response.json()["stage"], "rewriting resume")
+        etag = response.headers["etag"]
+
+        unchanged = client.get("/jobs/job_poll/status", headers={"If-None-Match": etag})
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(client.get("/jobs/nobody/status").status_code, 404)
+
+    def test_status_long_poll_returns_on_change(self):
+        """A waiting poll is answered by the next update, not by its timeout."""
+        report_progress("job_poll", 10, "rewriting resume")
+        version = progress_hub.latest("job_poll")["version"]
+        timer = threading.Timer(0.2, report_progress, ("job_poll", 60, "writing recommendations"))
+        timer.start()
+        response = TestClient(app).get(f"/jobs/job_poll/status?wait=30&version={version}")
+        timer.join()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["progress"], 60)
+        self.assertEqual(response.headers["etag"], f'"{version + 1}"')
+
+    def test_status_long_poll_times_out_with_304(self):
+        report_progress("job_poll", 10, "rewriting resume")
+        version = progress_hub.latest("job_poll")["version"]
+        response = TestClient(app).get(
+            "/jobs/job_poll/status?wait=0.05", headers={"If-None-Match": f'"{version}"'}
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_events_stream_each_change_until_done(self):
+        report_progress("job_sse", 10, "rewriting resume")
+        timer = threading.Timer(0.2, report_progress, ("job_sse", 100, "done"))
+        timer.start()
+        with TestClient(app).stream("GET", "/jobs/job_sse/events") as response:
+            self.assertEqual(response.headers["content-type"], "text/event-stream; charset=utf-8")
+            body = "".join(response.iter_text())
+        timer.join()
+        events = [json.loads(line[len("data: "):]) for line in body.splitlines()
+                  if line.startswith("data: ")]
+        self.assertEqual([e["progress"] for e in events], [10, 100])
+        self.assertIn(f"id: {events[-1]['version']}", body)
+
+    def test_events_resume_after_last_event_id(self):
+        report_progress("job_sse", 100, "done")
+        version = progress_hub.latest("job_sse")["version"]
+        response = TestClient(app).get(
+            "/jobs/job_sse/events", headers={"Last-Event-ID": str(version)}
+        )
+        self.assertEqual(response.text, "")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,6 +11,7 @@ from fastapi import UploadFile
 from app.routes import router
 from app.state import jobs_db, progress_status, OUTPUT_DIR
 from app.main import app
+from ats.fixtures import build_clean
 
 
 class TestAppRoutes(unittest.TestCase):
@@ -25,8 +26,7 @@ class TestAppRoutes(unittest.TestCase):
         
         # Create a sample resume file
         self.resume_path = os.path.join(self.temp_dir.name, "test_resume.docx")
-        with open(self.resume_path, "wb") as f:
-            f.write(b"Test resume content")
+        build_clean(self.resume_path)
         
         # Clear jobs_db and progress_status
         jobs_db.clear()
@@ -41,8 +41,8 @@ class TestAppRoutes(unittest.TestCase):
         jobs_db.clear()
         progress_status.clear()
 
-    @patch('app.routes.process_resume_job')
-    @patch('app.routes.JobPostingScraper')
+    @patch('app.routes.run_resume_job')
+    @patch('job_scraper.JobPostingScraper')
     def test_upload_resume(self, mock_scraper_class, mock_process_job):
         """Test uploading a resume."""
         # Mock the scraper to return valid job data
@@ -63,19 +63,17 @@ class TestAppRoutes(unittest.TestCase):
         # Create a test file
         with open(self.resume_path, "rb") as f:
             # Submit a job
-            with patch('os.makedirs') as mock_makedirs:
-                with patch('builtins.open', mock_open()) as mock_file:
-                    with patch('shutil.copyfileobj') as mock_copy:
-                        response = self.client.post(
-                            "/upload_resume/",
-                            data={
-                                "job_link": "https://example.com/job",
-                                "model": "gpt-4",
-                                "temperature": "0.7",
-                                "api_key": "test_api_key"
-                            },
-                            files={"file": ("test_resume.docx", f, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")}
-                        )
+            with patch('app.routes.OUTPUT_DIR', self.temp_dir.name):
+                response = self.client.post(
+                    "/upload_resume/",
+                    data={
+                        "job_link": "https://example.com/job",
+                        "model": "gpt-4",
+                        "temperature": "0.7",
+                        "api_key": "test_api_key"
+                    },
+                    files={"file": ("test_resume.docx", f, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")}
+                )
         
         # Verify response
         self.assertEqual(response.status_code, 200)
@@ -85,6 +83,7 @@ class TestAppRoutes(unittest.TestCase):
         
         # Get the job_id from the response
         job_id = data["job_id"]
+        self.assertEqual(len(jobs_db[job_id]["upload_sha256"]), 64)
         
         # Manually add the job to jobs_db for testing
         jobs_db[job_id] = mock_scraper.scrape_job_posting.return_value
@@ -97,8 +96,11 @@ class TestAppRoutes(unittest.TestCase):
         self.assertIn(job_id, progress_status)
         self.assertEqual(progress_status[job_id], 0)
         
-        # Verify process_resume_job was called
+        # Verify the background job was scheduled, and nothing was scraped
+        # inside the request itself.
         mock_process_job.assert_called_once()
+        mock_scraper_class.assert_not_called()
+        self.assertIn(f"download_url=/jobs/{job_id}/download", data["redirect_url"])
 
     @patch('app.routes.router')
     def test_get_progress(self, mock_router):
@@ -137,29 +139,54 @@ class TestAppRoutes(unittest.TestCase):
 
     def test_download_file(self):
         """Test downloading a file."""
-        # Create a test file path
-        test_file = os.path.join(OUTPUT_DIR, "test_file.zip")
-        
-        # Mock the FileResponse
-        with patch('app.routes.FileResponse') as mock_file_response:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.headers = {"content-type": "application/zip"}
-            mock_response.body = b"test content"
-            mock_file_response.return_value = mock_response
-            
-            # Mock os.path.exists to return True
-            with patch('os.path.exists', return_value=True):
-                # Test with a valid filename
-                response = self.client.get("/download/test_file.zip")
-                
-                # Verify the response
-                self.assertEqual(response.status_code, 200)
-                
-                # Verify FileResponse was called with the correct path
-                mock_file_response.assert_called_once()
-                args, kwargs = mock_file_response.call_args
-                self.assertIn(test_file, kwargs.get('path', '') or args[0])
+        with open(os.path.join(self.temp_dir.name, "test_file.zip"), "wb") as f:
+            f.write(b"test content")
+        
+        with patch('app.routes.OUTPUT_DIR', self.temp_dir.name):
+            response = self.client.get("/download/test_file.zip")
+            missing = self.client.get("/download/other.zip")
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"test content")
+        self.assertEqual(response.headers["content-type"], "application/zip")
+        self.assertIn("etag", response.headers)
+        self.assertEqual(missing.status_code, 404)
+
+
+    def test_download_job(self):
+        """A job's bundle is served once the job has recorded it."""
+        self.assertEqual(self.client.get("/jobs/unknown/download").status_code, 404)
+
+        jobs_db["job_1"] = {"stage": "rewriting resume"}
+        progress_status["job_1"] = 40
+        self.assertEqual(self.client.get("/jobs/job_1/download").status_code, 409)
+
+        progress_status["job_1"] = -1
+        self.assertEqual(self.client.get("/jobs/job_1/download").status_code, 404)
+
+        bundle = os.path.join(self.temp_dir.name, "Test_Company_Engineer.zip")
+        with open(bundle, "wb") as f:
+            f.write(b"PK\x05\x06" + b"\x00" * 18)
+        jobs_db["job_1"]["download"] = bundle
+        response = self.client.get("/jobs/job_1/download")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Test_Company_Engineer.zip", response.headers["content-disposition"])
+
+    def test_available_models_does_not_wait_on_a_slow_api(self):
+        """The dropdown gets the fallback list when OpenAI is slow to answer."""
+        import asyncio
+        from app.services import get_fallback_models
+
+        async def slow(api_key):
+            await asyncio.sleep(1)
+            return [{"id": "gpt-4o"}]
+
+        with patch('app.routes.fetch_openai_models', side_effect=slow), \
+                patch('app.routes.MODEL_LIST_WAIT', 0.05), \
+                self.assertLogs(level="INFO") as logs:
+            response = self.client.get("/available_models?api_key=sk-test")
+        self.assertIn("slow", "\n".join(logs.output))
+        self.assertEqual(response.json()["models"], get_fallback_models())
 
 
 if __name__ == '__main__':
@@ -6,7 +6,8 @@ from unittest.mock import patch, MagicMock, mock_open
 import os
 import tempfile
 import json
-from app.tasks import process_resume_job
+from app import tasks as app_tasks
+from app.tasks import process_resume_job, run_resume_job
 from app.state import jobs_db, progress_status, OUTPUT_DIR
 
 
@@ -84,19 +85,29 @@ class TestAppTasks(unittest.TestCase):
             with patch('builtins.open', mock_open()) as mock_file:
                 # Mock zipfile
                 with patch('zipfile.ZipFile'):
-                    # Run the task
-                    process_resume_job(
-                        self.job_id,
-                        self.job_data,
-                        self.resume_path,
-                        self.company_dir,
-                        "gpt-4o",
-                        0.1,
-                        "test_api_key"
-                    )
+                    # Note what a client woken by "done" would find.
+                    seen_at_done = {}
+                    real_report = app_tasks.report_progress
+
+                    def spy(job_id, percent, stage):
+                        if percent == 100:
+                            seen_at_done.update(jobs_db.get(job_id, {}))
+                        real_report(job_id, percent, stage)
+
+                    with patch('app.tasks.report_progress', side_effect=spy):
+                        result = process_resume_job(
+                            self.job_id,
+                            self.job_data,
+                            self.resume_path,
+                            self.company_dir,
+                            "gpt-4o",
+                            0.1,
+                            "test_api_key"
+                        )
             
-            # Verify progress was updated
+            # Verify progress was updated, after the bundle was recorded
             self.assertEqual(progress_status[self.job_id], 100)
+            self.assertEqual(seen_at_done["download"], result)
             
             # Verify the processor was called correctly
             mock_processor.process_resume.assert_called_once()
@@ -145,5 +156,42 @@ class TestAppTasks(unittest.TestCase):
         self.assertEqual(progress_status[self.job_id], -1)
 
 
+    @patch('app.tasks.process_resume_job')
+    @patch('job_scraper.JobPostingScraper')
+    def test_run_resume_job_prepares_the_job_in_the_background(self, mock_scraper_class, mock_process_job):
+        """Scraping, the screenshot and filing the upload happen in the job."""
+        mock_scraper = MagicMock()
+        mock_scraper.scrape_job_posting.return_value = self.job_data
+        mock_scraper_class.return_value = mock_scraper
+        mock_process_job.return_value = "output/Test_Company_Senior_Software_Engineer.zip"
+
+        with patch('app.tasks.OUTPUT_DIR', self.temp_dir.name):
+            result = run_resume_job(
+                self.job_id, "https://example.com/job", self.resume_path,
+                "gpt-4o", 0.1, "test_api_key"
+            )
+
+        mock_scraper.scrape_job_posting.assert_called_once_with("https://example.com/job")
+        mock_scraper.capture_screenshot.assert_called_once()
+        args = mock_process_job.call_args[0]
+        self.assertEqual(args[2], os.path.join(self.company_dir, "original_resume.docx"))
+        self.assertTrue(os.path.exists(args[2]))
+        self.assertFalse(os.path.exists(self.resume_path))
+        self.assertEqual(result, mock_process_job.return_value)
+        self.assertEqual(jobs_db[self.job_id]["job_description"], self.job_data["job_text"])
+
+    @patch('job_scraper.JobPostingScraper')
+    def test_run_resume_job_reports_a_failed_fetch(self, mock_scraper_class):
+        """A job whose preparation fails is marked failed, not left hanging."""
+        mock_scraper_class.return_value.scrape_job_posting.side_effect = Exception("timed out")
+        self.assertIsNone(run_resume_job(
+            self.job_id, "https://example.com/job", self.resume_path,
+            "gpt-4o", 0.1, "test_api_key"
+        ))
+        self.assertEqual(progress_status[self.job_id], -1)
+        # The parked upload does not outlive the job.
+        self.assertFalse(os.path.exists(self.resume_path))
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,128 @@
+"""
+Unit tests for streamed, validated uploads.
+"""
+import asyncio
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.uploads import AuditCache, UploadRejected, save_upload
+from ats.fixtures import build_clean
+
+
+class _Upload:
+    """Just enough of ``UploadFile`` for ``save_upload``."""
+
+    def __init__(self, data: bytes):
+        self._stream = io.BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size)
+
+
+class TestUploads(unittest.TestCase):
+    """Test cases for save_upload and the upload limits on the routes."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.resume_path = os.path.join(self.temp_dir.name, "clean.docx")
+        build_clean(self.resume_path)
+        with open(self.resume_path, "rb") as handle:
+            self.resume = handle.read()
+        self.target = os.path.join(self.temp_dir.name, "saved.docx")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _save(self, data: bytes, max_bytes: int = 10 * 1024 * 1024) -> str:
+        return asyncio.run(save_upload(_Upload(data), self.target, max_bytes))
+
+    def _rejected(self, data: bytes, **kwargs) -> UploadRejected:
+        with self.assertRaises(UploadRejected) as caught:
+            self._save(data, **kwargs)
+        self.assertFalse(os.path.exists(self.target))
+        return caught.exception
+
+    def test_saves_and_hashes_a_docx(self):
+        """A real resume lands on disk intact, with its SHA-256."""
+        import hashlib
+
+        digest = self._save(self.resume)
+        self.assertEqual(digest, hashlib.sha256(self.resume).hexdigest())
+        with open(self.target, "rb") as handle:
+            self.assertEqual(handle.read(), self.resume)
+
+    def test_rejects_by_magic_bytes(self):
+        """A PDF named .docx is refused on its first chunk."""
+        self.assertEqual(self._rejected(b"%PDF-1.4 " * 100).status_code, 400)
+        self.assertEqual(self._rejected(b"").status_code, 400)
+
+    def test_rejects_a_zip_that_is_not_a_docx(self):
+        """A zip without the Word parts, or with a broken directory, is refused."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("notes.txt", "hello")
+        self.assertIn("not a Word", self._rejected(buffer.getvalue()).message)
+        self.assertIn("damaged", self._rejected(b"PK\x03\x04 not really").message)
+
+    def test_rejects_an_oversized_upload(self):
+        """Past the limit the upload stops with 413 and nothing is kept."""
+        exc = self._rejected(self.resume, max_bytes=len(self.resume) - 1)
+        self.assertEqual(exc.status_code, 413)
+
+    def test_rejects_a_zip_bomb(self):
+        """A package that inflates far past its size is refused."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("[Content_Types].xml", "<Types/>")
+            archive.writestr("word/document.xml", b"\0" * (20 * 1024 * 1024))
+        self.assertEqual(self._rejected(buffer.getvalue()).status_code, 413)
+
+    def test_cache_evicts_the_least_recently_used(self):
+        cache = AuditCache(size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual((cache.get("a"), cache.get("c")), (1, 3))
+
+    def test_audit_route_refuses_a_non_docx_body(self):
+        """/audit/ answers 400 for a .docx that is not one, before scoring."""
+        with patch("app.routes.audit_pool") as pool:
+            response = TestClient(app).post(
+                "/audit/", files={"file": ("resume.docx", b"%PDF-1.4")}
+            )
+        self.assertEqual(response.status_code, 400)
+        pool.audit.assert_not_called()
+
+    def test_body_limit_refuses_a_large_request(self):
+        """The middleware answers 413 for a body over the limit."""
+        with patch("app.uploads.BodyLimit.limit_for", return_value=1024):
+            response = TestClient(app).post(
+                "/audit/", files={"file": ("resume.docx", self.resume)}
+            )
+        self.assertEqual(response.status_code, 413)
+        self.assertIn("limit", response.json()["error"])
+
+    def test_audit_route_reuses_a_cached_scorecard(self):
+        """The same bytes against the same posting are scored once."""
+        with patch("app.routes.audit_cache", AuditCache()):
+            client = TestClient(app)
+            first = client.post("/audit/", files={"file": ("a.docx", self.resume)})
+            with patch("app.routes.audit_pool") as pool:
+                second = client.post("/audit/", files={"file": ("b.docx", self.resume)})
+        pool.audit.assert_not_called()
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json()["path"], "b.docx")
+        self.assertEqual(second.json()["parse_score"], first.json()["parse_score"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Unit tests for the audit worker pool.
+"""
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.uploads import AuditCache
+from app.workers import AuditPool, PoolBusy
+from ats.fixtures import JOB_POSTING, build_clean
+
+
+class TestAuditPool(unittest.TestCase):
+    """Test cases for AuditPool."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.resume_path = os.path.join(cls.temp_dir.name, "clean.docx")
+        build_clean(cls.resume_path)
+        cls.pool = AuditPool(workers=1, queue=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+        cls.temp_dir.cleanup()
+
+    def test_audit_scores_on_a_worker(self):
+        """An audit comes back as a scorecard, with a profile only when asked."""
+        card, profile = asyncio.run(self.pool.audit(self.resume_path, JOB_POSTING))
+        self.assertEqual(card.parse_score, 100)
+        self.assertIsNotNone(card.keywords)
+        self.assertIsNone(profile)
+
+        card, profile = asyncio.run(self.pool.audit(self.resume_path, None, "collapsed"))
+        self.assertIsInstance(profile, bytes)
+
+    def test_full_queue_is_refused(self):
+        """Past workers plus queue, a submission fails fast with a retry hint."""
+        async def scenario():
+            busy = asyncio.ensure_future(self.pool.run(time.sleep, 0.5))
+            await asyncio.sleep(0)
+            with self.assertRaises(PoolBusy) as refused:
+                await self.pool.run(time.sleep, 0)
+            await busy
+            return refused.exception
+
+        refused = asyncio.run(scenario())
+        self.assertGreaterEqual(refused.retry_after, 1)
+        self.assertEqual(self.pool.in_flight, 0)
+
+    def test_event_loop_keeps_running_during_an_audit(self):
+        """Other coroutines make progress while a document is being scored."""
+        async def scenario():
+            ticks = 0
+            audit = asyncio.ensure_future(self.pool.run(time.sleep, 0.3))
+            while not audit.done():
+                await asyncio.sleep(0.01)
+                ticks += 1
+            return ticks
+
+        self.assertGreater(asyncio.run(scenario()), 5)
+
+    def test_route_answers_503_with_retry_after(self):
+        """The /audit/ route turns a full pool into 503 and Retry-After."""
+        full = AuditPool(workers=1, queue=0)
+        full.in_flight = full.capacity
+        with patch("app.routes.audit_pool", full), patch(
+            "app.routes.audit_cache", AuditCache()
+        ), open(self.resume_path, "rb") as handle:
+            response = TestClient(app).post(
+                "/audit/", files={"file": ("clean.docx", handle)}
+            )
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["retry-after"], "1")
+        self.assertIn("busy", response.json()["error"])
+
+
+if __name__ == '__main__':
+    unittest.main()
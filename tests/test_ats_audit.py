@@ -2,27 +2,19 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import json
 
 import pytest
 from docx import Document
 
 from ats import extract, format_scorecard, match, score_resume
-from ats.bench import run_benchmark
+from ats.bench import percentile, run_benchmark, run_perf
 from ats.checks import run_all
 from ats.cli import main as cli_main
-from ats.fixtures import JOB_POSTING, build_all
+from ats.fixtures import JOB_POSTING
 from ats.keywords import extract_terms, requirement_lines, tokenize
 
 
-@pytest.fixture(scope="module")
-def corpus(tmp_path_factory) -> Path:
-    """Build the fixture corpus once for the whole module."""
-    target = tmp_path_factory.mktemp("corpus")
-    build_all(target)
-    return target
-
-
 # --- extraction -------------------------------------------------------------
 
 def test_clean_resume_extracts_its_body(corpus):
@@ -230,6 +222,22 @@ def test_benchmark_is_reproducible():
     assert run_benchmark()["totals"] == run_benchmark()["totals"]
 
 
+def test_percentile_interpolates_between_ranks():
+    assert percentile([1, 2, 3, 4], 50) == 2.5
+    assert percentile([5], 99) == 5
+    assert percentile([1, 2, 3, 4, 5], 100) == 5
+
+
+def test_perf_benchmark_times_every_stage():
+    perf = run_perf(repeat=2)
+    assert perf["repeat"] == 2
+    for stages in perf["fixtures"].values():
+        for stage in ("extract", "checks", "keywords", "score"):
+            assert 0 <= stages[stage]["p50_ms"] <= stages[stage]["p99_ms"]
+        assert stages["peak_kib"] > 0
+    assert perf["overall"]["throughput_docs_per_sec"] > 0
+
+
 # --- CLI --------------------------------------------------------------------
 
 def test_cli_score_runs(corpus, capsys):
@@ -269,6 +277,16 @@ def test_cli_compare_reports_a_delta(corpus, capsys):
     assert "+" in out
 
 
+def test_cli_bench_writes_a_perf_section(tmp_path, capsys):
+    import json
+
+    target = tmp_path / "benchmark.json"
+    assert cli_main(["bench", "--perf", "--repeat", "1", "--json", str(target)]) == 0
+    report = json.loads(target.read_text())
+    assert report["totals"]["recall"] == 1.0
+    assert "clean" in report["perf"]["fixtures"]
+
+
 def test_cli_reports_a_missing_file_cleanly(tmp_path, capsys):
     assert cli_main(["score", str(tmp_path / "absent.docx")]) == 2
 
@@ -314,3 +332,143 @@ def test_audit_report_writer_survives_a_bad_path(tmp_path):
     from app.tasks import write_ats_audit
 
     assert write_ats_audit("nope.docx", "also-nope.docx", "", str(tmp_path)) is None
+
+
+# -- generated corpus ---------------------------------------------------------
+
+
+def test_generated_corpus_is_reproducible(tmp_path):
+    from ats.fixtures import CorpusSpec, generate_corpus
+
+    spec = CorpusSpec(images=(0, 2), table_layouts=0.3, defect_rate=0.5)
+    first = generate_corpus(tmp_path / "a", 12, seed=3, spec=spec)
+    again = generate_corpus(tmp_path / "b", 12, seed=3, spec=spec)
+    other = generate_corpus(tmp_path / "c", 12, seed=4, spec=spec)
+
+    assert first == again
+    assert first != other
+    for name in first:
+        assert extract(tmp_path / "a" / f"{name}.docx").ats_text == extract(
+            tmp_path / "b" / f"{name}.docx"
+        ).ats_text
+    manifest = json.loads((tmp_path / "a" / "manifest.json").read_text())
+    assert manifest["seed"] == 3 and manifest["expected"] == first
+
+
+def test_corpus_prefix_does_not_depend_on_its_size(tmp_path):
+    from ats.fixtures import generate_corpus
+
+    small = generate_corpus(tmp_path / "small", 5, seed=1)
+    large = generate_corpus(tmp_path / "large", 20, seed=1)
+    assert all(large[name] == defects for name, defects in small.items())
+
+
+def test_generated_size_knobs_are_respected(tmp_path):
+    from ats.fixtures import CorpusSpec, generate_corpus
+
+    spec = CorpusSpec(jobs=(8, 8), bullets=(20, 20), sections=(15, 15), images=(4, 4))
+    expected = generate_corpus(tmp_path, 2, spec=spec)
+    for name, defects in expected.items():
+        report = extract(tmp_path / f"{name}.docx")
+        assert report.image_count == 4
+        assert "PROJECTS 2" in report.ats_text
+        assert {"image_only_content", "document_length"} <= set(defects)
+
+
+def test_detector_agrees_with_the_generated_manifest():
+    from ats.bench import run_corpus_benchmark
+    from ats.fixtures import CorpusSpec
+
+    spec = CorpusSpec(images=(0, 2), table_layouts=0.25, defect_rate=0.4)
+    report = run_corpus_benchmark(60, seed=11, spec=spec, workers=1)
+    assert report["errors"] == []
+    assert report["totals"]["precision"] == 1.0
+    assert report["totals"]["recall"] == 1.0
+    assert report["totals"]["true_positives"] > 0
+    assert report["separation"]["gap"] > 0
+
+
+def test_cli_fixtures_generates_a_corpus(tmp_path, capsys):
+    assert cli_main(["fixtures", str(tmp_path), "--generate", "3", "--seed", "2"]) == 0
+    assert "3 generated resumes" in capsys.readouterr().out
+    assert len(list(tmp_path.glob("synthetic_*.docx"))) == 3
+    assert (tmp_path / "manifest.json").exists()
+
+
+# -- benchmark regression gate ------------------------------------------------
+
+
+def _perf_report(p95: float, throughput: float = 100.0, peak: float = 2000.0) -> dict:
+    report = json.loads(json.dumps(run_benchmark()))
+    score = {"p50_ms": 8.0, "p95_ms": p95, "p99_ms": p95, "mean_ms": 8.0}
+    report["perf"] = {
+        "fixtures": {"clean": {"score": score, "peak_kib": peak}},
+        "overall": {"score": score, "throughput_docs_per_sec": throughput, "peak_kib": peak},
+    }
+    return report
+
+
+def test_identical_reports_do_not_regress():
+    from ats.bench import compare_reports
+
+    report = _perf_report(10.0)
+    assert compare_reports(report, report)["ok"]
+
+
+def test_an_accuracy_drop_is_a_regression():
+    from ats.bench import compare_reports
+
+    old = _perf_report(10.0)
+    new = json.loads(json.dumps(old))
+    new["totals"]["recall"] = 0.9
+    result = compare_reports(old, new)
+    assert not result["ok"]
+    assert result["regressions"] == ["recall"]
+
+
+def test_latency_regressions_respect_tolerance_and_floor():
+    from ats.bench import Tolerances, compare_reports
+
+    slower = compare_reports(_perf_report(10.0), _perf_report(13.0))
+    assert "score p95" in slower["regressions"]
+    assert compare_reports(
+        _perf_report(10.0), _perf_report(13.0), Tolerances(latency=0.5)
+    )["ok"]
+    # Relative growth under the absolute floor is jitter, not a regression.
+    assert compare_reports(_perf_report(0.1), _perf_report(0.3))["ok"]
+    faster = compare_reports(_perf_report(10.0), _perf_report(5.0))
+    assert {m["status"] for m in faster["metrics"] if m["metric"] == "score p95"} == {
+        "improved"
+    }
+
+
+def test_throughput_and_memory_are_gated():
+    from ats.bench import compare_reports
+
+    result = compare_reports(
+        _perf_report(10.0, throughput=100, peak=2000),
+        _perf_report(10.0, throughput=50, peak=4000),
+    )
+    assert {"throughput", "peak memory", "clean peak memory"} <= set(result["regressions"])
+
+
+def test_metrics_missing_from_one_report_do_not_fail():
+    from ats.bench import compare_reports
+
+    result = compare_reports(_perf_report(10.0), run_benchmark())
+    assert result["ok"]
+    assert any(m["status"] == "missing" for m in result["metrics"])
+
+
+def test_cli_bench_compare_exits_non_zero_on_regression(tmp_path, capsys):
+    old, new = tmp_path / "old.json", tmp_path / "new.json"
+    old.write_text(json.dumps(_perf_report(10.0)))
+    new.write_text(json.dumps(_perf_report(20.0)))
+
+    assert cli_main(["bench", "compare", str(old), str(old)]) == 0
+    assert "No regressions" in capsys.readouterr().out
+    assert cli_main(["bench", "compare", str(old), str(new), "--json"]) == 1
+    assert "score p95" in json.loads(capsys.readouterr().out)["regressions"]
+    assert cli_main([
+        "bench", "compare", str(old), str(new), "--latency-tolerance", "2",
+    ]) == 0
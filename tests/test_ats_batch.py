@@ -0,0 +1,127 @@
+"""Tests for batch scoring across a worker pool."""
+
+from __future__ import annotations
+
+import io
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from ats import ScoreFailure, index_posting, score_many, score_resume
+from ats.batch import Summary, expand_paths
+from ats.cli import main as cli_main
+from ats.fixtures import JOB_POSTING
+from tests.helpers import docx_paths
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_score_many_matches_scoring_one_at_a_time(corpus, workers):
+    expected = {
+        str(p): score_resume(p, JOB_POSTING).to_dict() for p in docx_paths(corpus)
+    }
+    got = {
+        card.path: card.to_dict()
+        for card in score_many(docx_paths(corpus), JOB_POSTING, workers=workers)
+    }
+    assert got == expected
+
+
+def test_score_many_accepts_a_prebuilt_posting_index(corpus):
+    cards = list(score_many(docx_paths(corpus), index_posting(JOB_POSTING), workers=1))
+    assert all(card.keywords is not None for card in cards)
+
+
+def test_score_many_without_a_posting_has_no_match_score(corpus):
+    cards = list(score_many(docx_paths(corpus)[:2], workers=1))
+    assert all(card.keywords is None for card in cards)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_failures_are_reported_inline_when_asked(corpus, tmp_path, workers):
+    paths = [tmp_path / "absent.docx", *docx_paths(corpus)]
+    results = list(score_many(paths, workers=workers, return_exceptions=True))
+    failures = [r for r in results if isinstance(r, ScoreFailure)]
+    assert len(results) == len(paths)
+    assert [f.path for f in failures] == [str(tmp_path / "absent.docx")]
+
+
+def test_failures_raise_by_default(tmp_path):
+    with pytest.raises(Exception):
+        list(score_many([tmp_path / "absent.docx"], workers=2))
+
+
+def test_paths_are_consumed_lazily(corpus):
+    """Only a bounded number of documents may be queued ahead of the consumer."""
+    pulled = []
+
+    def paths():
+        for _ in range(50):
+            path = docx_paths(corpus)[0]
+            pulled.append(path)
+            yield path
+
+    stream = score_many(paths(), workers=2, max_pending=3)
+    next(stream)
+    assert len(pulled) <= 4
+    stream.close()
+
+
+def test_expand_paths_walks_directories_globs_and_stdin(corpus, tmp_path):
+    nested = tmp_path / "nested" / "deeper"
+    nested.mkdir(parents=True)
+    shutil.copy(docx_paths(corpus)[0], nested / "one.docx")
+    (nested / "~$one.docx").write_bytes(b"lock")
+    (nested / "notes.txt").write_text("not a resume")
+
+    assert list(expand_paths([str(tmp_path / "nested")])) == [str(nested / "one.docx")]
+    assert list(expand_paths([str(tmp_path / "**" / "one.docx")])) == [
+        str(nested / "one.docx")
+    ]
+    stdin = io.StringIO(f"{nested / 'one.docx'}\n\n{corpus / 'clean.docx'}\n")
+    assert list(expand_paths(["-"], stdin)) == [
+        str(nested / "one.docx"), str(corpus / "clean.docx"),
+    ]
+    assert list(expand_paths(["missing.docx"])) == ["missing.docx"]
+
+
+def test_summary_counts_grades_and_failures(corpus):
+    summary = Summary(min_score=80)
+    for result in score_many(
+        [*docx_paths(corpus), "absent.docx"], JOB_POSTING, workers=1, return_exceptions=True
+    ):
+        summary.add(result)
+    totals = summary.to_dict()
+    assert totals["total"] == len(docx_paths(corpus)) + 1
+    assert totals["failed"] == 1
+    assert sum(totals["grades"].values()) == totals["scored"]
+    assert totals["below_min_score"] >= 1
+    assert totals["mean_match_score"] is not None
+
+
+def _lines(capsys):
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_cli_scores_a_directory_as_ndjson(corpus, capsys):
+    assert cli_main(["score", str(corpus), "--jobs", "2", "-j", JOB_POSTING]) == 0
+    lines = _lines(capsys)
+    cards, summary = lines[:-1], lines[-1]["summary"]
+    assert {Path(c["path"]).name for c in cards} == {Path(p).name for p in docx_paths(corpus)}
+    assert summary["scored"] == len(cards)
+    assert summary["grades"]["A"] >= 1
+
+
+def test_cli_reads_paths_from_stdin_and_reports_failures(corpus, capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO(f"{corpus / 'clean.docx'}\nabsent.docx\n"))
+    assert cli_main(["score", "-", "--jobs", "1", "--compact"]) == 1
+    lines = _lines(capsys)
+    assert lines[0]["v"] == 1
+    assert lines[1]["path"] == "absent.docx" and "error" in lines[1]
+    assert lines[-1]["summary"]["failed"] == 1
+
+
+def test_cli_single_resume_keeps_the_readable_scorecard(corpus, capsys):
+    assert cli_main(["score", str(corpus / "clean.docx")]) == 0
+    assert not capsys.readouterr().out.startswith("{")
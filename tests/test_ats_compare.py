@@ -0,0 +1,61 @@
+"""Tests for the before-and-after comparison engine."""
+
+from __future__ import annotations
+
+import pytest
+
+from ats.checks import Finding
+from ats.compare import compare_resumes, compare_scorecards
+from ats.fixtures import JOB_POSTING
+from ats.score import Scorecard
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_fixing_the_header_removes_its_findings(corpus, parallel):
+    comparison = compare_resumes(
+        corpus / "header_contact.docx", corpus / "clean.docx", JOB_POSTING, parallel=parallel
+    )
+    assert comparison.parse_delta > 30
+    assert {f.check for f in comparison.removed} >= {"dropped_content", "contact_details"}
+    assert comparison.added == []
+    assert comparison.match_delta is not None
+
+
+def test_a_worse_rewrite_reports_what_it_introduced(corpus):
+    comparison = compare_resumes(corpus / "clean.docx", corpus / "table_layout.docx")
+    assert comparison.parse_delta < 0
+    assert "table_layout" in {f.check for f in comparison.added}
+    assert comparison.match_delta is None
+
+
+def test_comparing_a_file_with_itself_changes_nothing(corpus):
+    comparison = compare_resumes(corpus / "sparse.docx", corpus / "sparse.docx", JOB_POSTING)
+    assert comparison.parse_delta == 0
+    assert comparison.added == comparison.removed == []
+
+
+def test_duplicate_findings_are_diffed_as_a_multiset():
+    warning = Finding("risky_characters", "info", "1 en dash character(s)", penalty=1)
+    before = Scorecard(parse_score=98, findings=[warning, warning])
+    after = Scorecard(parse_score=99, findings=[warning])
+    comparison = compare_scorecards(before, after)
+    assert comparison.removed == [warning]
+    assert comparison.added == []
+
+
+def test_comparison_serializes_its_delta(corpus):
+    payload = compare_resumes(
+        corpus / "header_contact.docx", corpus / "clean.docx", JOB_POSTING
+    ).to_dict()
+    assert payload["delta"]["parse_score"] == (
+        payload["after"]["parse_score"] - payload["before"]["parse_score"]
+    )
+    assert payload["delta"]["removed"]
+
+
+def test_cli_compare_lists_fixed_findings(corpus, capsys):
+    from ats.cli import main as cli_main
+
+    args = ["compare", str(corpus / "header_contact.docx"), str(corpus / "clean.docx")]
+    assert cli_main(args) == 0
+    assert "Fixed:" in capsys.readouterr().out
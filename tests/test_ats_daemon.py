@@ -0,0 +1,99 @@
+"""Tests for the warm ats daemon and the CLI's use of it."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+
+import pytest
+
+from ats import daemon
+from ats.cli import main as cli_main
+from ats.fixtures import build_clean
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(__import__("socket"), "AF_UNIX"), reason="needs Unix domain sockets"
+)
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    # Socket paths are limited to ~100 bytes, which pytest's tmp_path can exceed.
+    path = os.path.join("/tmp", f"ats-test-{os.getpid()}.sock")
+    srv = daemon.DaemonServer(path, workers=1)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv(daemon.SOCKET_ENV, path)
+    monkeypatch.delenv(daemon.NO_DAEMON_ENV, raising=False)
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def resume(tmp_path):
+    path = tmp_path / "clean.docx"
+    build_clean(path)
+    return path
+
+
+def test_request_runs_the_command_in_a_worker(server, resume):
+    response = daemon.request(["score", str(resume), "--json"])
+    assert response["status"] == 0
+    assert json.loads(response["stdout"])["parse_score"] == 100
+
+
+def test_relative_paths_resolve_against_the_client_cwd(server, resume, monkeypatch):
+    monkeypatch.chdir(resume.parent)
+    response = daemon.request(["extract", resume.name])
+    assert response["status"] == 0
+    assert "Parsed" in response["stdout"]
+
+
+def test_cli_forwards_to_a_running_daemon(server, resume, capsys, monkeypatch):
+    calls = []
+    real = daemon.request
+    monkeypatch.setattr(daemon, "request", lambda *a, **k: calls.append(a) or real(*a, **k))
+    assert cli_main(["score", str(resume), "--min-score", "101"]) == 1
+    assert calls
+    captured = capsys.readouterr()
+    assert "Parse score: 100/100" in captured.out
+    assert "below --min-score" in captured.err
+
+
+def test_errors_come_back_as_exit_statuses(server, tmp_path):
+    assert daemon.request(["score", str(tmp_path / "absent.docx")])["status"] == 2
+    assert daemon.request(["score", "--no-such-flag"])["status"] == 2
+
+
+def test_cli_falls_back_in_process_without_a_daemon(resume, tmp_path, capsys, monkeypatch):
+    monkeypatch.setenv(daemon.SOCKET_ENV, str(tmp_path / "nobody.sock"))
+    monkeypatch.delenv(daemon.NO_DAEMON_ENV, raising=False)
+    assert daemon.request(["score", str(resume)]) is None
+    assert cli_main(["score", str(resume)]) == 0
+    assert "100" in capsys.readouterr().out
+
+
+def test_a_daemon_running_other_code_is_bypassed(server, resume, capsys):
+    server.code = "0.0.0+stale"
+    assert daemon.request(["score", str(resume)])["stale"] is True
+    assert cli_main(["score", str(resume)]) == 0
+    assert "100" in capsys.readouterr().out
+
+
+def test_code_version_changes_with_the_sources():
+    before = daemon.code_version()
+    assert before.startswith(__import__("ats").__version__ + "+")
+    source = os.path.join(os.path.dirname(daemon.__file__), "daemon.py")
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    try:
+        assert daemon.code_version() != before
+    finally:
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def test_a_second_daemon_refuses_a_live_socket(server):
+    with pytest.raises(RuntimeError):
+        daemon.DaemonServer(server.socket_path, workers=1)
@@ -0,0 +1,94 @@
+"""Tests for the SQLite scorecard history store."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+
+import pytest
+
+from ats import score_resume
+from ats.cli import main as cli_main
+from ats.fixtures import JOB_POSTING
+from ats.history import HistoryStore, file_digest, text_digest
+
+
+def test_records_are_batched_until_flushed(corpus, tmp_path):
+    db = tmp_path / "history.db"
+    store = HistoryStore(db, batch_size=3)
+    for name in ("clean", "sparse"):
+        store.record(score_resume(corpus / f"{name}.docx"))
+    # Nothing is written until the batch fills or the store flushes.
+    assert sqlite3.connect(db).execute("SELECT COUNT(*) FROM scorecards").fetchone()[0] == 0
+    store.record(score_resume(corpus / "no_dates.docx"))
+    assert sqlite3.connect(db).execute("SELECT COUNT(*) FROM scorecards").fetchone()[0] == 3
+    store.close()
+
+
+def test_database_runs_in_wal_mode(tmp_path):
+    with HistoryStore(tmp_path / "history.db"):
+        pass
+    mode = sqlite3.connect(tmp_path / "history.db").execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_trend_follows_one_resume_over_time(corpus, tmp_path):
+    with HistoryStore(tmp_path / "history.db") as store:
+        store.record(score_resume(corpus / "header_contact.docx", JOB_POSTING),
+                     posting=JOB_POSTING, recorded_at=100.0)
+        store.record(score_resume(corpus / "clean.docx", JOB_POSTING),
+                     posting=JOB_POSTING, recorded_at=200.0)
+        store.record(score_resume(corpus / "clean.docx"), recorded_at=300.0)
+
+        clean = file_digest(corpus / "clean.docx")
+        assert [e.recorded_at for e in store.trend(content_hash=clean)] == [200.0, 300.0]
+        by_posting = store.trend(posting_hash=text_digest(JOB_POSTING))
+        assert [e.parse_score for e in by_posting][-1] == 100
+        assert [e.recorded_at for e in store.trend(since=150.0, limit=1)] == [300.0]
+        assert store.trend(path=corpus / "clean.docx")[0].content_hash == clean
+
+
+def test_finding_frequency_counts_checks(corpus, tmp_path):
+    with HistoryStore(tmp_path / "history.db") as store:
+        for _ in range(2):
+            store.record(score_resume(corpus / "sparse.docx"))
+        store.record(score_resume(corpus / "clean.docx"))
+        rows = {check: (count, audits) for check, _, count, audits in store.finding_frequency()}
+    assert rows["document_length"] == (2, 2)
+
+
+def test_stored_scorecards_rebuild_exactly(corpus, tmp_path):
+    card = score_resume(corpus / "table_layout.docx", JOB_POSTING)
+    with HistoryStore(tmp_path / "history.db") as store:
+        store.record(card, posting=JOB_POSTING)
+        (entry,) = store.trend()
+        assert store.load(entry.id).to_dict() == card.to_dict()
+
+
+def test_ids_keep_counting_across_sessions(corpus, tmp_path):
+    for _ in range(2):
+        with HistoryStore(tmp_path / "history.db") as store:
+            store.record(score_resume(corpus / "clean.docx"))
+    with HistoryStore(tmp_path / "history.db") as store:
+        assert [e.id for e in store.trend()] == [1, 2]
+
+
+def test_cli_score_records_and_history_reports(corpus, tmp_path, capsys):
+    db = str(tmp_path / "history.db")
+    resume = str(corpus / "clean.docx")
+    assert cli_main(["score", resume, "--history", db]) == 0
+    assert cli_main(["score", resume, "--history", db]) == 0
+    capsys.readouterr()
+
+    assert cli_main(["history", "--db", db, "--path", resume, "--json"]) == 0
+    entries = json.loads(capsys.readouterr().out)
+    assert len(entries) == 2 and entries[0]["parse_score"] == 100
+
+    assert cli_main(["history", "--db", db, "--findings"]) == 0
+    assert "2 audit(s)" in capsys.readouterr().out
+
+
+def test_cli_history_without_a_database_fails_cleanly(tmp_path, monkeypatch):
+    monkeypatch.delenv("ATS_HISTORY", raising=False)
+    assert cli_main(["history"]) == 2
+    assert cli_main(["history", "--db", str(tmp_path / "absent.db")]) == 2
@@ -0,0 +1,117 @@
+"""Tests for incremental live match scoring."""
+
+from __future__ import annotations
+
+import pytest
+
+from ats import LiveSession, index_posting, match
+from ats.fixtures import JOB_POSTING, SKILLS, SUMMARY
+
+DRAFT = [
+    "JORDAN REYES",
+    "jordan.reyes@example.com | (555) 123-4567",
+    SUMMARY,
+    "TECHNICAL SKILLS",
+    SKILLS,
+]
+
+
+def _same_coverage(session: LiveSession, text: str) -> None:
+    expected = match(text, JOB_POSTING)
+    assert session.coverage == pytest.approx(expected.coverage)
+    assert session.weighted_coverage == pytest.approx(expected.weighted_coverage)
+    assert session.report().missing_requirements == expected.missing_requirements
+
+
+def test_initial_session_agrees_with_a_full_match():
+    session = LiveSession(JOB_POSTING, DRAFT)
+    _same_coverage(session, "\n".join(DRAFT))
+
+
+def test_edits_agree_with_rescoring_from_scratch():
+    session = LiveSession(JOB_POSTING, DRAFT)
+    paragraphs = list(DRAFT)
+
+    session.replace(4, "Python, SQL")
+    paragraphs[4] = "Python, SQL"
+    _same_coverage(session, "\n".join(paragraphs))
+
+    session.insert(2, "Shipped Kafka streaming and Terraform modules")
+    paragraphs.insert(2, "Shipped Kafka streaming and Terraform modules")
+    _same_coverage(session, "\n".join(paragraphs))
+
+    session.delete(0)
+    del paragraphs[0]
+    _same_coverage(session, "\n".join(paragraphs))
+
+
+def test_a_term_held_by_two_paragraphs_survives_deleting_one():
+    session = LiveSession(JOB_POSTING, ["Python", "Python"])
+    before = session.weighted_coverage
+    session.delete(0)
+    assert session.weighted_coverage == before
+    session.delete(0)
+    assert session.weighted_coverage < before
+
+
+def test_phrases_are_tracked_per_paragraph():
+    session = LiveSession(JOB_POSTING, ["I enjoy learning"])
+    assert "machine learning" not in {t for t, _ in session.report().matched}
+    session.replace(0, "Built machine learning pipelines")
+    assert "machine learning" in {t for t, _ in session.report().matched}
+
+
+def test_apply_accepts_wire_deltas_and_rejects_bad_ones():
+    session = LiveSession(index_posting(JOB_POSTING))
+    session.apply({"op": "insert", "index": 0, "text": "Kubernetes"})
+    assert len(session) == 1
+    with pytest.raises(ValueError):
+        session.apply({"op": "delete", "index": 5})
+    with pytest.raises(ValueError):
+        session.apply({"op": "rename", "index": 0})
+
+
+def test_snapshot_score_matches_the_scorecard_blend():
+    session = LiveSession(JOB_POSTING, DRAFT)
+    assert session.snapshot()["match_score"] == match("\n".join(DRAFT), JOB_POSTING).score
+
+
+def test_on_demand_audit_runs_the_text_checks():
+    card = LiveSession(JOB_POSTING, DRAFT).scorecard()
+    assert "document_length" in {f.check for f in card.findings}
+    assert card.match_score > 0
+
+
+def test_live_websocket_streams_updated_scores():
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with TestClient(app).websocket_connect("/ws/live") as ws:
+        ws.send_json({"job_description": JOB_POSTING, "paragraphs": ["Python"]})
+        first = ws.receive_json()
+        ws.send_json({"op": "insert", "index": 1, "text": SKILLS})
+        second = ws.receive_json()
+        assert second["match_score"] > first["match_score"]
+        ws.send_json({"op": "delete", "index": 9})
+        assert "error" in ws.receive_json()
+        ws.send_json({"op": "audit"})
+        assert "parse_score" in ws.receive_json()
+
+
+def test_live_websocket_answers_messages_that_are_not_objects():
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with TestClient(app).websocket_connect("/ws/live") as ws:
+        ws.send_json([])
+        assert "error" in ws.receive_json()
+
+    with TestClient(app).websocket_connect("/ws/live") as ws:
+        ws.send_json({"job_description": JOB_POSTING, "paragraphs": ["Python"]})
+        ws.receive_json()
+        ws.send_json("x")
+        assert "error" in ws.receive_json()
+        ws.send_json({"op": "insert", "index": 1, "text": SKILLS})
+        assert "match_score" in ws.receive_json()
@@ -0,0 +1,123 @@
+"""Tests for scoring many resumes against many postings."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from ats import score_resume
+from ats.batch import ScoreFailure
+from ats.cli import main as cli_main
+from ats.fixtures import JOB_POSTING
+from ats.matrix import load_postings, score_matrix, write_matrix
+from tests.helpers import docx_paths
+
+FRONTEND_POSTING = """Frontend Engineer
+
+Requirements:
+- TypeScript and React, required
+- Accessibility and responsive design
+- Jest unit testing; GraphQL a plus
+"""
+
+
+@pytest.fixture
+def postings(tmp_path) -> Path:
+    target = tmp_path / "postings"
+    target.mkdir()
+    (target / "data.txt").write_text(JOB_POSTING)
+    (target / "frontend.md").write_text(FRONTEND_POSTING)
+    (target / "notes.pdf").write_text("ignored")
+    return target
+
+
+def test_load_postings_names_columns_by_file(postings, tmp_path):
+    assert list(load_postings([postings])) == ["data", "frontend"]
+    (tmp_path / "empty.txt").write_text("  \n")
+    with pytest.raises(ValueError):
+        load_postings([tmp_path / "empty.txt"])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_matrix_matches_scoring_each_pair(corpus, postings, workers):
+    texts = load_postings([postings])
+    rows = {row.path: row for row in score_matrix(docx_paths(corpus), texts, workers=workers)}
+    assert sorted(rows) == docx_paths(corpus)
+    for path, row in rows.items():
+        expected = [score_resume(path, text) for text in texts.values()]
+        assert row.parse_score == expected[0].parse_score
+        assert row.matches == [card.match_score for card in expected]
+
+
+def test_each_resume_is_read_once_and_each_posting_indexed_once(
+    corpus, postings, monkeypatch
+):
+    import ats.keywords
+    import ats.matrix
+
+    calls = {"extract": 0, "index": 0, "terms": 0}
+    real_extract, real_index = ats.matrix.extract, ats.keywords.index_posting
+    real_terms = ats.matrix.resume_terms
+
+    def counting_extract(path):
+        calls["extract"] += 1
+        return real_extract(path)
+
+    def counting_index(text, limit=60):
+        calls["index"] += 1
+        return real_index(text, limit)
+
+    def counting_terms(text):
+        calls["terms"] += 1
+        return real_terms(text)
+
+    monkeypatch.setattr(ats.matrix, "extract", counting_extract)
+    monkeypatch.setattr(ats.matrix, "resume_terms", counting_terms)
+    monkeypatch.setattr(ats.keywords, "index_posting", counting_index)
+    texts = load_postings([postings])
+    list(score_matrix(docx_paths(corpus), texts, workers=1))
+    docs = len(docx_paths(corpus))
+    assert calls == {"extract": docs, "index": len(texts), "terms": docs}
+
+
+def test_write_matrix_csv_and_ndjson(corpus, postings, tmp_path):
+    texts = load_postings([postings])
+    names = list(texts)
+    paths = [*docx_paths(corpus)[:2], str(tmp_path / "absent.docx")]
+
+    out = io.StringIO()
+    rows = score_matrix(paths, texts, workers=1, return_exceptions=True)
+    assert write_matrix(rows, names, out, "csv") == (2, 1)
+    table = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert list(table[0]) == ["path", "parse_score", "grade", "data", "frontend", "error"]
+    assert table[2]["error"] and not table[2]["data"]
+
+    out = io.StringIO()
+    rows = score_matrix(paths, texts, workers=1, return_exceptions=True)
+    assert write_matrix(rows, names, out, "ndjson") == (2, 1)
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert set(lines[0]["match"]) == {"data", "frontend"}
+    assert "error" in lines[2]
+
+    with pytest.raises(ValueError):
+        write_matrix([ScoreFailure("x", "y")], names, io.StringIO(), "xml")
+
+
+def test_cli_matrix(corpus, postings, tmp_path, capsys):
+    output = tmp_path / "fit.csv"
+    assert cli_main([
+        "matrix", str(postings), str(corpus), "--jobs", "1", "-o", str(output),
+    ]) == 0
+    table = list(csv.DictReader(output.open()))
+    assert len(table) == len(docx_paths(corpus))
+    assert "posting(s) to" in capsys.readouterr().err
+
+    assert cli_main([
+        "matrix", str(postings / "data.txt"), str(corpus), "--jobs", "1", "--format", "ndjson",
+    ]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert all(set(json.loads(line)["match"]) == {"data"} for line in lines)
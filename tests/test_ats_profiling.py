@@ -0,0 +1,92 @@
+"""Tests for the profiling hooks on ats score and /audit/."""
+
+from __future__ import annotations
+
+import pstats
+import time
+
+import pytest
+
+from ats.cli import main as cli_main
+from ats.fixtures import build_clean
+from ats.profiling import Profiler
+
+
+def _busy(seconds: float = 0.05) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(100))
+
+
+@pytest.fixture
+def resume(tmp_path):
+    path = tmp_path / "clean.docx"
+    build_clean(path)
+    return path
+
+
+def test_pstats_output_loads_in_pstats(tmp_path):
+    with Profiler("pstats") as profiler:
+        _busy()
+    profiler.save(tmp_path / "out.prof")
+    stats = pstats.Stats(str(tmp_path / "out.prof"))
+    assert any(func == "_busy" for _, _, func in stats.stats)
+
+
+def test_collapsed_output_is_folded_stacks():
+    with Profiler("collapsed") as profiler:
+        _busy()
+    lines = profiler.output().decode().splitlines()
+    assert profiler.samples > 0
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert any("test_ats_profiling:_busy" in line for line in lines)
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        Profiler("callgrind")
+
+
+def test_cli_score_writes_a_profile(resume, tmp_path, capsys):
+    out = tmp_path / "score.folded"
+    assert cli_main([
+        "score", str(resume), "--profile", str(out), "--profile-format", "collapsed",
+    ]) == 0
+    assert out.exists()
+    assert "collapsed profile" in capsys.readouterr().err
+
+    assert cli_main(["score", str(resume), "--profile", str(tmp_path / "score.prof")]) == 0
+    assert pstats.Stats(str(tmp_path / "score.prof")).total_calls > 0
+
+
+def _post_audit(resume, **kwargs):
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with open(resume, "rb") as handle:
+        return TestClient(app).post(
+            "/audit/", files={"file": ("clean.docx", handle)}, **kwargs
+        )
+
+
+def test_audit_profile_is_refused_unless_enabled(resume, monkeypatch):
+    monkeypatch.setattr("app.routes.PROFILE_AUDITS", False)
+    response = _post_audit(resume, params={"profile": "pstats"})
+    assert response.status_code == 403
+
+
+def test_audit_returns_a_profile_when_enabled(resume, monkeypatch):
+    monkeypatch.setattr("app.routes.PROFILE_AUDITS", True)
+    response = _post_audit(resume, params={"profile": "pstats"})
+    assert response.status_code == 200
+    assert response.headers["x-ats-parse-score"] == "100"
+    assert "audit.prof" in response.headers["content-disposition"]
+
+    response = _post_audit(resume, headers={"X-ATS-Profile": "collapsed"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+
+    assert _post_audit(resume, params={"profile": "callgrind"}).status_code == 400
+    assert _post_audit(resume).json()["parse_score"] == 100
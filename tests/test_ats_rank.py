@@ -0,0 +1,69 @@
+"""Tests for top-k ranking of many resumes against one posting."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ats import rank_resumes, score_resume
+from ats.cli import main as cli_main
+from ats.fixtures import JOB_POSTING, generate_corpus
+from tests.helpers import docx_paths
+
+
+@pytest.fixture(scope="module")
+def corpus(tmp_path_factory) -> Path:
+    target = tmp_path_factory.mktemp("applicants")
+    generate_corpus(target, 24, seed=3)
+    return target
+
+
+def _expected(corpus: Path, k: int):
+    cards = [score_resume(p, JOB_POSTING) for p in docx_paths(corpus)]
+    cards.sort(key=lambda c: c.path)
+    cards.sort(key=lambda c: (c.match_score, c.parse_score), reverse=True)
+    return [(c.path, c.match_score, c.parse_score) for c in cards[:k]]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_top_k_matches_sorting_everything(corpus, workers):
+    ranking = rank_resumes(docx_paths(corpus), JOB_POSTING, k=5, workers=workers)
+    got = [(c.path, c.match_score, c.parse_score) for c in ranking.top]
+    assert got == _expected(corpus, 5)
+    assert ranking.summary.scored == len(docx_paths(corpus))
+
+
+def test_kept_scorecards_drop_their_extracted_text(corpus):
+    ranking = rank_resumes(docx_paths(corpus), JOB_POSTING, k=3, workers=1)
+    assert all(card.extraction is None for card in ranking.top)
+    assert all(card.extraction_stats["parsed_words"] > 0 for card in ranking.top)
+
+
+def test_k_larger_than_the_corpus_and_failures(corpus, tmp_path):
+    paths = [*docx_paths(corpus)[:3], str(tmp_path / "absent.docx")]
+    ranking = rank_resumes(paths, JOB_POSTING, k=10, workers=1)
+    assert len(ranking.top) == 3
+    assert ranking.summary.failed == 1
+
+
+def test_ranking_needs_a_posting_and_a_positive_k(corpus):
+    with pytest.raises(ValueError):
+        rank_resumes(docx_paths(corpus), "", k=5)
+    with pytest.raises(ValueError):
+        rank_resumes(docx_paths(corpus), JOB_POSTING, k=0)
+
+
+def test_cli_rank(corpus, capsys):
+    assert cli_main(["rank", str(corpus), "-j", JOB_POSTING, "--top", "4", "--jobs", "1"]) == 0
+    out = capsys.readouterr().out
+    assert out.splitlines()[0].split() == ["rank", "match", "parse", "grade", "path"]
+    assert f"Ranked {len(docx_paths(corpus))} resume(s); showing the top 4." in out
+
+    assert cli_main([
+        "rank", str(corpus), "-j", JOB_POSTING, "-k", "2", "--jobs", "1", "--json",
+    ]) == 0
+    data = json.loads(capsys.readouterr().out)
+    assert [row["rank"] for row in data["top"]] == [1, 2]
+    assert [row["path"] for row in data["top"]] == [p for p, _, _ in _expected(corpus, 2)]
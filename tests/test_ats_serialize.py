@@ -0,0 +1,90 @@
+"""Tests for compact scorecard serialization."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from ats import format_scorecard, score_resume, serialize
+from ats.fixtures import JOB_POSTING, build_all
+
+
+@pytest.fixture(scope="module")
+def cards(corpus):
+    docs = sorted(corpus.glob("*.docx"))
+    return [score_resume(p, JOB_POSTING) for p in docs] + [score_resume(docs[0])]
+
+
+def test_compact_round_trip_rebuilds_the_scorecard(cards):
+    for card in cards:
+        rebuilt = serialize.from_json(serialize.to_json(card, compact=True))
+        assert rebuilt.to_dict() == card.to_dict()
+        assert rebuilt.match_score == card.match_score
+        assert format_scorecard(rebuilt, verbose=True) == format_scorecard(card, verbose=True)
+
+
+def test_compact_form_uses_short_keys_and_tuples(cards):
+    payload = json.loads(serialize.to_json(cards[0], compact=True))
+    assert set(payload) == {"v", "p", "s", "f", "k", "x"}
+    assert all(isinstance(f, list) and len(f) == 5 for f in payload["f"])
+
+
+def test_readable_json_is_the_to_dict_shape(cards):
+    assert json.loads(serialize.to_json(cards[0])) == cards[0].to_dict()
+
+
+def test_stdlib_fallback_encodes_the_same_document(cards, monkeypatch):
+    fast = json.loads(serialize.to_json(cards[1], compact=True))
+    monkeypatch.setattr(serialize, "orjson", None)
+    slow = serialize.to_json(cards[1], compact=True)
+    assert json.loads(slow) == fast
+    assert serialize.from_json(slow).to_dict() == cards[1].to_dict()
+
+
+def test_msgpack_round_trip(cards):
+    pytest.importorskip("msgpack")
+    for card in cards:
+        assert serialize.from_msgpack(serialize.to_msgpack(card)).to_dict() == card.to_dict()
+
+
+def test_unknown_schema_is_rejected():
+    with pytest.raises(ValueError):
+        serialize.unpack({"v": 99})
+    with pytest.raises(ValueError):
+        serialize.from_json(b'{"parse_score": 100}')
+
+
+def test_ndjson_writes_one_line_per_card(cards, tmp_path):
+    target = tmp_path / "out.ndjson"
+    with open(target, "wb") as stream:
+        assert serialize.write_ndjson(cards, stream) == len(cards)
+    lines = target.read_bytes().splitlines()
+    assert [serialize.from_json(line).path for line in lines] == [c.path for c in cards]
+
+
+def test_audit_endpoint_returns_the_compact_form(tmp_path):
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    build_all(tmp_path)
+    with open(tmp_path / "clean.docx", "rb") as handle:
+        response = TestClient(app).post(
+            "/audit/?format=compact", files={"file": ("clean.docx", handle)}
+        )
+    assert response.status_code == 200
+    card = serialize.from_json(response.content)
+    assert card.parse_score == 100
+    assert card.path == "clean.docx"
+
+
+def test_audit_endpoint_rejects_an_unknown_format():
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    response = TestClient(app).post(
+        "/audit/?format=xml", files={"file": ("resume.docx", b"PK")}
+    )
+    assert response.status_code == 400
@@ -0,0 +1,97 @@
+"""Tests for sharded batch scoring and merging the shards back together."""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from ats.batch import expand_paths
+from ats.cli import main as cli_main
+from ats.fixtures import JOB_POSTING, generate_corpus
+from ats.shard import merge_outputs, parse_shard, select_shard, shard_of
+
+
+@pytest.fixture(scope="module")
+def corpus(tmp_path_factory) -> Path:
+    target = tmp_path_factory.mktemp("corpus")
+    generate_corpus(target, 30, seed=11)
+    return target
+
+
+def test_parse_shard():
+    assert parse_shard("2/8") == (2, 8)
+    for bad in ("0/4", "5/4", "1/0", "two/4", "3"):
+        with pytest.raises(ValueError):
+            parse_shard(bad)
+
+
+@pytest.mark.parametrize("by", ["path", "content"])
+def test_shards_are_disjoint_and_cover_the_corpus(corpus, by):
+    paths = list(expand_paths([str(corpus)]))
+    shards = [list(select_shard(paths, i, 4, by=by)) for i in range(1, 5)]
+    assert sorted(p for shard in shards for p in shard) == sorted(paths)
+    assert sum(len(shard) for shard in shards) == len(paths)
+    assert all(shards), "30 files over 4 shards should leave none empty"
+
+
+def test_assignment_is_stable():
+    assert shard_of("resumes/a.docx", 8) == shard_of("resumes/a.docx", 8)
+    assert shard_of("absent.docx", 4, by="content") == shard_of("absent.docx", 4)
+    with pytest.raises(ValueError):
+        shard_of("a.docx", 4, by="size")
+
+
+def _run(argv, capsys):
+    status = cli_main(argv)
+    return status, capsys.readouterr().out
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_merged_shards_match_a_single_run(corpus, tmp_path, capsys, compact):
+    common = ["-j", JOB_POSTING, "--jobs", "1"] + (["--compact"] if compact else [])
+    _, whole = _run(["score", str(corpus), *common], capsys)
+    expected = json.loads(whole.splitlines()[-1])["summary"]
+
+    outputs = []
+    for index in (1, 2, 3):
+        _, out = _run(["score", str(corpus), "--shard", f"{index}/3", *common], capsys)
+        assert json.loads(out.splitlines()[-1])["summary"]["shard"]["index"] == index
+        path = tmp_path / f"shard-{index}.ndjson"
+        path.write_text(out)
+        outputs.append(str(path))
+
+    status, merged = _run(["merge", *outputs], capsys)
+    assert status == 0
+    assert json.loads(merged) == {"summary": expected}
+    assert expected["findings"], "the generated corpus plants defects"
+
+
+def test_merge_refuses_missing_or_repeated_shards(corpus, tmp_path, capsys):
+    _, out = _run(["score", str(corpus), "--shard", "1/2", "--jobs", "1"], capsys)
+    with pytest.raises(ValueError, match=r"\[2\] of 2 are missing"):
+        merge_outputs([io.StringIO(out)])
+    with pytest.raises(ValueError, match="more than one output"):
+        merge_outputs([io.StringIO(out), io.StringIO(out)])
+    partial = tmp_path / "shard-1.ndjson"
+    partial.write_text(out)
+    assert cli_main(["merge", str(partial)]) == 2
+    assert "missing" in capsys.readouterr().err
+
+
+def test_merge_counts_failures_and_min_score():
+    lines = [
+        json.dumps({"path": "absent.docx", "error": "PackageNotFoundError: nope"}),
+        json.dumps({"path": "a.docx", "parse_score": 55, "match_score": None, "findings": [
+            {"check": "section_headings", "severity": "warning"},
+            {"check": "section_headings", "severity": "warning"},
+        ]}),
+    ]
+    summary = merge_outputs([io.StringIO("\n".join(lines))], min_score=60)
+    assert summary["failed"] == 1 and summary["below_min_score"] == 1
+    assert summary["grades"] == {"F": 1}
+    assert summary["findings"] == [
+        {"check": "section_headings", "severity": "warning", "count": 2, "resumes": 1}
+    ]
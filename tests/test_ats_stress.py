@@ -0,0 +1,45 @@
+"""Time and memory budgets for scoring pathological documents."""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+
+import pytest
+
+from ats import extract, score_resume
+from ats.fixtures import JOB_POSTING, STRESS, build_stress
+
+
+@pytest.fixture(scope="module")
+def stress(tmp_path_factory):
+    return build_stress(tmp_path_factory.mktemp("stress"))
+
+
+@pytest.mark.parametrize("name", sorted(STRESS))
+def test_stress_document_scores_within_its_time_budget(stress, name):
+    start = time.perf_counter()
+    card = score_resume(stress[name], JOB_POSTING)
+    elapsed = time.perf_counter() - start
+    assert card.parse_score >= 0
+    assert elapsed <= STRESS[name].seconds, f"{name} took {elapsed:.2f}s"
+
+
+@pytest.mark.parametrize("name", sorted(STRESS))
+def test_stress_document_scores_within_its_memory_budget(stress, name):
+    tracemalloc.start()
+    try:
+        score_resume(stress[name], JOB_POSTING)
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+    assert peak <= STRESS[name].peak_mib, f"{name} peaked at {peak:.1f} MiB"
+
+
+def test_stress_documents_have_the_shape_they_claim(stress):
+    assert stress["large_images"].stat().st_size > 45 * 2**20
+    assert extract(stress["large_images"]).image_count == 25
+    assert len(extract(stress["long_table"]).table_cell_texts) == 6000
+    assert len(extract(stress["huge_paragraph"]).ats_text) > 5 * 10**6
+    assert len(extract(stress["text_boxes"]).textbox_texts) == 1000
+    assert extract(stress["many_sections"]).ats_text.count("\nPROJECTS ") == 20
@@ -0,0 +1,144 @@
+"""Tests for change-aware rescoring of a watched folder."""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+
+import pytest
+
+from ats.fixtures import JOB_POSTING, build_clean, build_header_contact
+from ats.watch import Watcher, _Inotify, format_event
+
+
+@pytest.fixture
+def folder(tmp_path):
+    build_clean(tmp_path / "resume.docx")
+    return tmp_path
+
+
+def test_first_pass_scores_everything(folder):
+    events = Watcher(folder, JOB_POSTING).poll_once()
+    assert [e["event"] for e in events] == ["scored"]
+    assert events[0]["parse_score"] == 100
+    assert events[0]["match_score"] is not None
+
+
+def test_unchanged_bytes_are_not_rescored(folder):
+    watcher = Watcher(folder)
+    watcher.poll_once()
+    path = folder / "resume.docx"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert watcher.poll_once() == []
+
+
+def test_an_edit_reports_the_delta(folder):
+    watcher = Watcher(folder)
+    watcher.poll_once()
+    build_header_contact(folder / "resume.docx")
+    (event,) = watcher.poll_once()
+    assert event["event"] == "changed"
+    assert event["delta"]["parse_score"] < 0
+    assert any("dropped_content" in f for f in event["delta"]["introduced"])
+    assert "introduced:" in format_event(event)
+
+
+def test_new_removed_and_broken_files(folder):
+    watcher = Watcher(folder)
+    watcher.poll_once()
+    (folder / "resume.docx").unlink()
+    (folder / "half-saved.docx").write_bytes(b"PK\x03\x04 truncated")
+    events = {e["path"]: e["event"] for e in watcher.poll_once()}
+    assert events == {
+        str(folder / "resume.docx"): "removed",
+        str(folder / "half-saved.docx"): "error",
+    }
+    # A file that failed is retried on the next pass once it is fixed.
+    build_clean(folder / "half-saved.docx")
+    assert [e["event"] for e in watcher.poll_once()] == ["scored"]
+
+
+def test_a_broken_file_is_reported_once_and_its_removal_too(folder):
+    broken = folder / "broken.docx"
+    broken.write_bytes(b"PK\x03\x04 truncated")
+    watcher = Watcher(folder)
+    assert [e["event"] for e in watcher.poll_once() if e["path"] == str(broken)] == ["error"]
+    os.utime(broken)  # touched, same bytes
+    assert watcher.poll_once() == []
+    broken.unlink()
+    assert watcher.poll_once() == [{"event": "removed", "path": str(broken)}]
+
+
+@pytest.mark.parametrize("use_inotify", [False, True])
+def test_run_rescores_after_a_save(folder, use_inotify):
+    if use_inotify and _Inotify.create() is None:
+        pytest.skip("inotify is not available here")
+    events: "queue.Queue[dict]" = queue.Queue()
+    stop = threading.Event()
+    watcher = Watcher(folder, debounce=0.05, poll_interval=0.05)
+    thread = threading.Thread(
+        target=watcher.run, args=(events.put, stop, use_inotify), daemon=True
+    )
+    thread.start()
+    try:
+        assert events.get(timeout=5)["event"] == "scored"
+        build_header_contact(folder / "resume.docx")
+        assert events.get(timeout=5)["event"] == "changed"
+    finally:
+        stop.set()
+        thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_inotify_forgets_removed_directories_and_watches_them_again(tmp_path):
+    notifier = _Inotify.create()
+    if notifier is None:
+        pytest.skip("inotify is not available here")
+    nested = tmp_path / "drafts" / "old"
+    nested.mkdir(parents=True)
+    try:
+        notifier.watch_tree(tmp_path)
+        assert str(nested) in notifier._watched
+        nested.rmdir()
+        (tmp_path / "drafts").rename(tmp_path / "archive")
+        assert notifier.wait(1)
+        # One deleted, one moved away: neither name is watched any more.
+        assert set(notifier._watched) == {str(tmp_path)}
+        nested.mkdir(parents=True)
+        assert notifier.wait(1)
+        notifier.watch_tree(tmp_path)
+        assert str(nested) in notifier._watched
+        (nested / "resume.docx").write_bytes(b"saved")
+        assert notifier.wait(1)
+    finally:
+        notifier.close()
+
+
+def test_run_walks_the_tree_only_after_events(folder, monkeypatch):
+    if _Inotify.create() is None:
+        pytest.skip("inotify is not available here")
+    walks = []
+    real = _Inotify.watch_tree
+
+    def counting_walk(self, root):
+        walks.append(root)
+        real(self, root)
+
+    monkeypatch.setattr(_Inotify, "watch_tree", counting_walk)
+    events: "queue.Queue[dict]" = queue.Queue()
+    stop = threading.Event()
+    watcher = Watcher(folder, debounce=0.02, poll_interval=0.02)
+    thread = threading.Thread(target=watcher.run, args=(events.put, stop, True), daemon=True)
+    thread.start()
+    try:
+        assert events.get(timeout=5)["event"] == "scored"
+        stop.wait(0.3)  # idle for many poll intervals
+        assert len(walks) == 1
+        build_header_contact(folder / "resume.docx")
+        assert events.get(timeout=5)["event"] == "changed"
+        assert len(walks) >= 2
+    finally:
+        stop.set()
+        thread.join(timeout=5)
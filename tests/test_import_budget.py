@@ -0,0 +1,69 @@
+"""Start-up cost budgets for the CLI and the web app.
+
+Each measurement runs in a fresh interpreter under ``python -X importtime``,
+so modules already imported by the test session do not hide the cost.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time, in seconds, of the named module on a cold start.
+# Generous on purpose: they exist to catch a heavy dependency sneaking back
+# into an eager import, which costs hundreds of milliseconds, not ten.
+BUDGETS = {
+    "ats.cli": 0.25,
+    "app.main": 2.5,
+}
+
+# Modules that must not load merely because the entry point was imported.
+FORBIDDEN = {
+    "ats.cli": ("docx", "lxml", "ats.score", "ats.extract"),
+    "app.main": ("job_scraper", "selenium", "langchain_openai", "PIL", "webdriver_manager"),
+}
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": ROOT},
+    )
+
+
+def _import_seconds(module: str) -> float:
+    stderr = _run(f"import {module}", "-X", "importtime").stderr
+    for line in reversed(stderr.splitlines()):
+        if line.startswith("import time:") and line.split("|")[-1].strip() == module:
+            return int(line.split("|")[1]) / 1e6
+    raise AssertionError(f"{module} missing from -X importtime output")
+
+
+@pytest.mark.parametrize("module", sorted(BUDGETS))
+def test_import_time_is_within_budget(module):
+    seconds = _import_seconds(module)
+    assert seconds <= BUDGETS[module], f"importing {module} took {seconds:.3f}s"
+
+
+@pytest.mark.parametrize("module", sorted(FORBIDDEN))
+def test_heavy_dependencies_are_not_imported_eagerly(module):
+    loaded = _run(
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {FORBIDDEN[module]!r} if m in sys.modules))"
+    ).stdout.strip()
+    assert not loaded, f"importing {module} loaded {loaded}"
+
+
+def test_ats_names_resolve_on_first_use():
+    out = _run(
+        "import sys, ats; before = 'docx' in sys.modules; "
+        "import ats.extract; from ats import extract, score_resume; "
+        "print(before, callable(extract), score_resume.__module__)"
+    ).stdout.split()
+    assert out == ["False", "True", "ats.score"]
@@ -59,6 +59,8 @@ class TestJobPostingScraper(unittest.TestCase):
         })
         mock_client.chat.completions.create.return_value = mock_chat_response
         
+        import job_scraper
+
         # Patch the _create_extraction_prompt method to avoid errors
         with patch.object(self.scraper, '_create_extraction_prompt', return_value="Test prompt"):
             result = self.scraper.scrape_job_posting(self.test_url)
@@ -71,7 +73,8 @@ class TestJobPostingScraper(unittest.TestCase):
             # Verify the HTTP request was made correctly
             mock_get.assert_called_once_with(
                 self.test_url, 
-                headers={"User-Agent": self.scraper.user_agent}
+                headers={"User-Agent": self.scraper.user_agent},
+                timeout=job_scraper.FETCH_TIMEOUT
             )
             
             # Verify OpenAI was called